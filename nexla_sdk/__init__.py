@@ -19,7 +19,11 @@ from nexla_sdk.client import NexlaClient
 from nexla_sdk.exceptions import (
     AuthenticationError,
     AuthorizationError,
+    BufferFullError,
+    CircuitOpenError,
     CredentialError,
+    DeadlineExceededError,
+    FanOutError,
     FlowError,
     NexlaError,
     NotFoundError,
@@ -125,6 +129,10 @@ __all__ = [
     "RateLimitError",
     "ServerError",
     "ResourceConflictError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
+    "FanOutError",
+    "BufferFullError",
     "CredentialError",
     "FlowError",
     "TransformError",
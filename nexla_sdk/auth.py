@@ -3,9 +3,11 @@ Authentication utilities for the Nexla SDK
 """
 
 import logging
+import threading
 import time
 from typing import Any, Dict, Optional, Union
 
+from .deadlines import bound_timeout
 from .exceptions import AuthenticationError, NexlaError
 from .http_client import HttpClientError, HttpClientInterface, RequestsHttpClient
 
@@ -41,6 +43,7 @@ class TokenAuthHandler:
         api_version: str = "v1",
         token_refresh_margin: int = 3600,
         http_client: Optional[HttpClientInterface] = None,
+        token_timeout: Optional[float] = None,
     ):
         """
         Initialize the token authentication handler
@@ -52,12 +55,17 @@ class TokenAuthHandler:
             api_version: API version to use
             token_refresh_margin: Seconds before token expiry to trigger refresh
             http_client: HTTP client implementation (defaults to RequestsHttpClient)
+            token_timeout: Timeout in seconds for /token requests (None uses the
+                           HTTP client's default); always bounded by any active deadline
         """
         self.service_key = service_key
         self.api_url = base_url.rstrip("/")
         self.api_version = api_version
         self.token_refresh_margin = token_refresh_margin
         self.http_client = http_client or RequestsHttpClient()
+        self.token_timeout = token_timeout
+        # Serializes token acquisition so concurrent callers share one /token call
+        self._token_lock = threading.Lock()
 
         # Session token management
         if access_token:
@@ -106,9 +114,15 @@ class TokenAuthHandler:
             "Accept": f"application/vnd.nexla.api.{self.api_version}+json",
             "Content-Length": "0",
         }
+        request_kwargs = {}
+        timeout = bound_timeout(self.token_timeout, operation="obtain_session_token")
+        if timeout is not None:
+            request_kwargs["timeout"] = timeout
 
         try:
-            token_data = self.http_client.request("POST", url, headers=headers)
+            token_data = self.http_client.request(
+                "POST", url, headers=headers, **request_kwargs
+            )
             self._access_token = token_data.get("access_token")
             # Calculate expiry time (current time + expires_in seconds)
             expires_in = token_data.get("expires_in", 86400)
@@ -165,17 +179,22 @@ class TokenAuthHandler:
             if self._using_direct_token:
                 raise AuthenticationError("No access token available")
             # Obtain new token using service key lazily
-            self.obtain_session_token()
+            with self._token_lock:
+                if not self._access_token:
+                    self.obtain_session_token()
             return self._access_token
 
         # For service key, if nearing expiry, obtain a fresh token via /token
-        if not self._using_direct_token:
-            current_time = time.time()
-            if (self._token_expiry - current_time) < self.token_refresh_margin:
-                self.obtain_session_token()
+        if not self._using_direct_token and self._needs_refresh():
+            with self._token_lock:
+                if self._needs_refresh():
+                    self.obtain_session_token()
 
         return self._access_token
 
+    def _needs_refresh(self) -> bool:
+        return (self._token_expiry - time.time()) < self.token_refresh_margin
+
     def logout(self) -> None:
         """
         Ends the current session and invalidates the NexlaSessionToken.
@@ -236,6 +255,8 @@ class TokenAuthHandler:
                     )
                     self.obtain_session_token()
                     headers["Authorization"] = f"Bearer {self.get_access_token()}"
+                    if "timeout" in kwargs:
+                        kwargs["timeout"] = bound_timeout(kwargs["timeout"])
                     return self.http_client.request(
                         method, url, headers=headers, **kwargs
                     )
@@ -0,0 +1,295 @@
+"""
+Per-endpoint-family circuit breakers for the Nexla SDK.
+
+When a backend subsystem (for example probes or flow metrics) is unhealthy,
+requests to it tend to hang until they time out. A circuit breaker tracks
+consecutive failures for a family of endpoints and, once a threshold is
+reached, rejects further calls immediately instead of tying up worker
+threads. After a recovery timeout a limited number of probe requests are let
+through (half-open); a successful probe closes the circuit again.
+
+Breakers only hold a lock for short, non-blocking bookkeeping, so they are
+safe to share between threads and between coroutines running on an event
+loop.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from .exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+# Path segments made only of lowercase letters and underscores are treated as
+# static route names; everything else (IDs, keys, slugs) is collapsed to "*".
+_STATIC_SEGMENT = re.compile(r"^[a-z_]+$")
+# Segments followed by free-form user values (lookup keys may be any string,
+# including lowercase words); the rest of the path collapses to one "*".
+_FREE_FORM_PARENTS = frozenset({"entries"})
+
+
+def endpoint_family(path: str) -> str:
+    """
+    Normalize an API path into an endpoint family key.
+
+    Examples:
+        endpoint_family("/data_credentials/42/probe")
+        # '/data_credentials/*/probe'
+        endpoint_family("/data_flows/data_sources/7/metrics?from=2024-01-01")
+        # '/data_flows/data_sources/*/metrics'
+        endpoint_family("/data_maps/5/entries/active")
+        # '/data_maps/*/entries/*'
+    """
+    path = path.split("?", 1)[0]
+    segments = []
+    for segment in path.strip("/").split("/"):
+        if not segment:
+            continue
+        if segments and segments[-1] in _FREE_FORM_PARENTS:
+            segments.append("*")
+            break
+        segments.append(segment if _STATIC_SEGMENT.match(segment) else "*")
+    return "/" + "/".join(segments)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Normal operation
+    OPEN = "open"  # Failing fast, not executing calls
+    HALF_OPEN = "half_open"  # Letting probe calls through to test recovery
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for a single endpoint family.
+
+    Args:
+        name: Endpoint family this breaker protects
+        failure_threshold: Consecutive failures before the circuit opens
+        recovery_timeout: Seconds to stay open before allowing probe calls
+        half_open_max_calls: Concurrent probe calls allowed while half-open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_in_flight = 0
+
+        # Counters exposed through metrics()
+        self._total_successes = 0
+        self._total_failures = 0
+        self._rejected = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, accounting for an elapsed recovery timeout."""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def before_request(self) -> None:
+        """
+        Reserve permission to send a request.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or all half-open probe
+                slots are taken
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CircuitState.CLOSED:
+                return
+            if (
+                self._state == CircuitState.HALF_OPEN
+                and self._half_open_in_flight < self.half_open_max_calls
+            ):
+                self._half_open_in_flight += 1
+                return
+            self._rejected += 1
+            state = self._state
+            retry_after = self._seconds_until_half_open()
+
+        raise CircuitOpenError(
+            f"Circuit breaker for '{self.name}' is {state.value}; "
+            f"failing fast (retry after {retry_after:.1f}s)",
+            endpoint_family=self.name,
+            retry_after=retry_after,
+        )
+
+    def record_success(self) -> None:
+        """Record a call that reached a healthy backend."""
+        with self._lock:
+            self._total_successes += 1
+            self._consecutive_failures = 0
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a call that failed because the backend is unhealthy."""
+        with self._lock:
+            self._total_failures += 1
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                self._open()
+            elif (
+                self._state == CircuitState.CLOSED
+                and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def release(self) -> None:
+        """
+        Give back a half-open probe slot without recording an outcome.
+
+        Used when a call is abandoned before it could say anything about the
+        backend (e.g. ``KeyboardInterrupt``), so the slot is not leaked.
+        """
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def reset(self) -> None:
+        """Manually close the circuit and clear failure state."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._half_open_in_flight = 0
+            self._opened_at = None
+            self._transition(CircuitState.CLOSED)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of the breaker state and counters."""
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                "state": self._state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "total_successes": self._total_successes,
+                "total_failures": self._total_failures,
+                "rejected": self._rejected,
+                "times_opened": self._times_opened,
+                "retry_after": self._seconds_until_half_open(),
+            }
+
+    # Internal helpers; callers must hold self._lock
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        self._transition(CircuitState.OPEN)
+
+    def _maybe_half_open(self) -> None:
+        if self._state == CircuitState.OPEN and self._seconds_until_half_open() <= 0:
+            self._half_open_in_flight = 0
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _seconds_until_half_open(self) -> float:
+        if self._state != CircuitState.OPEN or self._opened_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self._opened_at
+        return max(0.0, self.recovery_timeout - elapsed)
+
+    def _transition(self, new_state: CircuitState) -> None:
+        if new_state != self._state:
+            logger.warning(
+                "Circuit breaker for %s: %s -> %s",
+                self.name,
+                self._state.value,
+                new_state.value,
+            )
+            self._state = new_state
+
+
+class CircuitBreakerRegistry:
+    """
+    Lazily creates and holds one CircuitBreaker per endpoint family.
+
+    At most ``max_families`` breakers are kept; beyond that the least
+    recently used closed breaker (or, if none is closed, the least recently
+    used one) is dropped, so a long-lived client cannot grow without bound.
+
+    Examples:
+        breakers = CircuitBreakerRegistry(failure_threshold=3, recovery_timeout=10)
+        client = NexlaClient(service_key="...", circuit_breaker=breakers)
+
+        # Inspect breaker state per endpoint family
+        client.circuit_breakers.metrics()
+        # {'/data_credentials/*/probe': {'state': 'open', ...}, ...}
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        max_families: int = 512,
+    ):
+        if max_families < 1:
+            raise ValueError("max_families must be positive")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.max_families = max_families
+        self._breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> CircuitBreaker:
+        """Return the breaker for the endpoint family of ``path``."""
+        family = endpoint_family(path)
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is not None:
+                self._breakers.move_to_end(family)
+                return breaker
+            if len(self._breakers) >= self.max_families:
+                self._evict()
+            breaker = CircuitBreaker(
+                family,
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+                half_open_max_calls=self.half_open_max_calls,
+            )
+            self._breakers[family] = breaker
+            return breaker
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return metrics for every endpoint family seen so far."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.metrics() for breaker in breakers}
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+    def _evict(self) -> None:
+        # Caller holds self._lock; oldest entries come first
+        for family, breaker in self._breakers.items():
+            if breaker.state == CircuitState.CLOSED:
+                del self._breakers[family]
+                return
+        self._breakers.popitem(last=False)
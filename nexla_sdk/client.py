@@ -2,21 +2,43 @@
 Nexla API client
 """
 
+import asyncio
+import contextlib
+import contextvars
+import functools
 import logging
 import os
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+import threading
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import ValidationError as PydanticValidationError
 
-from . import telemetry
+from . import deadlines, telemetry
 from .auth import TokenAuthHandler
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from .concurrency import FanOut, RateLimiter
+from .deadlines import Deadline, TimeoutProfiles
 from .exceptions import (
     AuthenticationError,
+    DeadlineExceededError,
     NexlaError,
     NotFoundError,
     ServerError,
     ValidationError,
 )
+from .hedging import HedgingPolicy
 from .http_client import HttpClientError, HttpClientInterface, RequestsHttpClient
 from .resources.approval_requests import ApprovalRequestsResource
 from .resources.async_tasks import AsyncTasksResource
@@ -47,6 +69,7 @@ from .resources.webhooks import WebhooksResource
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 class NexlaClient:
@@ -89,6 +112,12 @@ class NexlaClient:
         token_refresh_margin: int = 3600,
         http_client: Optional[HttpClientInterface] = None,
         trace_enabled: Optional[bool] = None,
+        circuit_breaker: Union[bool, CircuitBreakerRegistry, None] = True,
+        hedging: Union[bool, HedgingPolicy, None] = None,
+        timeouts: Union[TimeoutProfiles, Dict[str, float], None] = None,
+        prewarm: bool = False,
+        max_workers: int = 16,
+        max_request_rate: Optional[float] = None,
     ):
         """
         Initialize the Nexla client
@@ -102,6 +131,24 @@ class NexlaClient:
             http_client: HTTP client implementation (defaults to RequestsHttpClient)
             trace_enabled: Explicitly enable/disable OpenTelemetry tracing. If None,
                            tracing auto-enables when a global OTEL config is detected.
+            circuit_breaker: Per-endpoint-family circuit breaking. True (default) uses
+                             a CircuitBreakerRegistry with default thresholds, a
+                             CircuitBreakerRegistry instance customizes them, and
+                             False/None disables circuit breaking.
+            hedging: Opt-in hedging of idempotent GET requests. True uses a
+                     HedgingPolicy with default settings; pass a HedgingPolicy
+                     to tune the percentile, delay bounds and hedge-rate cap.
+            timeouts: Per-operation request timeouts, either a TimeoutProfiles
+                      instance or a mapping of endpoint family patterns
+                      (e.g. "/data_credentials/*/probe") to seconds.
+            prewarm: Start warmup() in the background on construction so the
+                     first real request sees an existing token and open
+                     keep-alive connections.
+            max_workers: Size of the shared thread pool used by map()/gather() and
+                         the bulk helpers; the default HTTP connection pool is
+                         sized to match.
+            max_request_rate: Optional client-wide cap on API requests per second,
+                              shared by every thread using this client.
 
         Raises:
             NexlaError: If neither or both authentication methods are provided
@@ -151,8 +198,39 @@ class NexlaClient:
 
         self.tracer = telemetry.get_tracer(self._trace_enabled)
 
+        # Circuit breakers keyed by endpoint family (e.g. /data_credentials/*/probe)
+        if isinstance(circuit_breaker, CircuitBreakerRegistry):
+            self.circuit_breakers: Optional[CircuitBreakerRegistry] = circuit_breaker
+        elif circuit_breaker:
+            self.circuit_breakers = CircuitBreakerRegistry()
+        else:
+            self.circuit_breakers = None
+
+        # Per-operation timeouts, layered on top of the built-in profiles
+        if isinstance(timeouts, TimeoutProfiles):
+            self.timeouts = timeouts
+        else:
+            self.timeouts = TimeoutProfiles(timeouts)
+
+        # Hedged GETs (duplicate slow requests, first response wins)
+        if isinstance(hedging, HedgingPolicy):
+            self.hedging: Optional[HedgingPolicy] = hedging
+        elif hedging:
+            self.hedging = HedgingPolicy()
+        else:
+            self.hedging = None
+
         # Initialize HTTP client (instrumented if tracer provided)
-        self.http_client = http_client or RequestsHttpClient(tracer=self.tracer)
+        self._custom_http_client = http_client is not None
+        self.http_client = http_client or RequestsHttpClient(
+            tracer=self.tracer, pool_maxsize=max(10, max_workers)
+        )
+
+        # Shared fan-out pool and optional client-wide request rate cap
+        self.fanout = FanOut(max_workers=max_workers)
+        self._request_limiter = (
+            RateLimiter(max_request_rate) if max_request_rate else None
+        )
 
         # Initialize authentication handler
         self.auth_handler = TokenAuthHandler(
@@ -162,6 +240,7 @@ class NexlaClient:
             api_version=api_version,
             token_refresh_margin=token_refresh_margin,
             http_client=self.http_client,
+            token_timeout=self.timeouts.timeout_for("/token"),
         )
 
         # Initialize API endpoints
@@ -190,6 +269,10 @@ class NexlaClient:
         self.doc_containers = DocContainersResource(self)
         self.data_schemas = DataSchemasResource(self)
 
+        self._warmup_future: Optional[Future] = None
+        if prewarm:
+            self._warmup_future = self.warmup(wait=False)
+
     def get_access_token(self) -> str:
         """
         Get a valid access token.
@@ -240,6 +323,198 @@ class NexlaClient:
         """
         self.auth_handler.logout()
 
+    def warmup(
+        self, connections: int = 4, wait: bool = True
+    ) -> Union[Dict[str, Any], "Future[Dict[str, Any]]"]:
+        """
+        Obtain a session token and open pooled connections ahead of real traffic.
+
+        Token acquisition and connection setup (DNS, TCP, TLS) run
+        concurrently. Connection warming is best-effort and only applies to
+        HTTP clients that implement ``warm_connections`` (RequestsHttpClient
+        does); token errors such as an invalid service key are raised.
+
+        Args:
+            connections: Number of keep-alive connections to open
+            wait: Block until warm; when False, run in a background thread and
+                  return a Future with the same result
+
+        Returns:
+            Dict with ``token`` (whether a session token is held) and
+            ``connections`` (number of connections opened), or a Future of it
+
+        Examples:
+            client = NexlaClient(service_key="...")
+            client.warmup(connections=8)
+
+            # Or warm in the background while the worker finishes booting
+            client = NexlaClient(service_key="...", prewarm=True)
+        """
+        if not wait:
+            future: "Future[Dict[str, Any]]" = Future()
+
+            def run() -> None:
+                try:
+                    future.set_result(self.warmup(connections))
+                except Exception as e:
+                    logger.warning(f"Background warmup failed: {e}")
+                    future.set_exception(e)
+
+            thread = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(run,),
+                name="nexla-warmup",
+                daemon=True,
+            )
+            thread.start()
+            return future
+
+        warm_connections = getattr(self.http_client, "warm_connections", None)
+        connection_future: Optional[Future] = None
+        if callable(warm_connections):
+            connection_future = Future()
+
+            def open_connections() -> None:
+                try:
+                    connection_future.set_result(
+                        warm_connections(self.api_url, connections)
+                    )
+                except Exception as e:
+                    logger.debug(f"Connection warmup failed: {e}")
+                    connection_future.set_result(0)
+
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(open_connections,),
+                name="nexla-warmup-connections",
+                daemon=True,
+            ).start()
+
+        try:
+            self.auth_handler.ensure_valid_token()
+        finally:
+            opened = connection_future.result() if connection_future else 0
+
+        return {"token": True, "connections": opened}
+
+    async def warmup_async(self, connections: int = 4) -> Dict[str, Any]:
+        """
+        Awaitable variant of warmup() for asyncio applications.
+
+        The blocking warmup runs in the event loop's default executor.
+
+        Examples:
+            await client.warmup_async(connections=8)
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self.warmup, connections)
+        return await loop.run_in_executor(
+            None, functools.partial(contextvars.copy_context().run, call)
+        )
+
+    def map(
+        self,
+        fn: Callable[[T], R],
+        items: Iterable[T],
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        rate: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> Iterator[R]:
+        """
+        Apply ``fn`` to each item concurrently on the client's shared pool.
+
+        Results stream back lazily, in input order or (``ordered=False``) as
+        they complete. Any active ``client.deadline(...)`` applies inside the
+        tasks. Failures are collected and raised together as a FanOutError
+        once every item has been processed, unless ``return_exceptions`` is set.
+
+        Args:
+            fn: Function called with each item
+            items: Items to process (consumed lazily)
+            concurrency: Maximum tasks in flight (capped at max_workers)
+            ordered: Yield results in input order
+            rate: Maximum task starts per second
+            return_exceptions: Yield exceptions in place of failed results
+
+        Examples:
+            for source in client.map(client.sources.get, source_ids, concurrency=8):
+                print(source.name)
+
+            statuses = list(
+                client.map(lambda fid: client.flows.get(fid, flows_only=True),
+                           flow_ids, ordered=False, rate=20)
+            )
+        """
+        return self.fanout.map(
+            fn,
+            items,
+            concurrency=concurrency,
+            ordered=ordered,
+            rate=rate,
+            return_exceptions=return_exceptions,
+        )
+
+    def gather(
+        self,
+        *calls: Callable[[], R],
+        concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> List[R]:
+        """
+        Run zero-argument callables concurrently and return results in order.
+
+        Raises:
+            FanOutError: If any call failed; ``results`` holds the successful
+                results (None for failures) and ``errors`` (index, exception) pairs
+
+        Examples:
+            sources, sinks = client.gather(
+                client.sources.list, client.destinations.list
+            )
+        """
+        return self.fanout.gather(
+            calls,
+            concurrency=concurrency,
+            rate=rate,
+            return_exceptions=return_exceptions,
+        )
+
+    def close(self) -> None:
+        """Release thread pools owned by the client."""
+        self.fanout.shutdown(wait=False)
+        if self.hedging is not None:
+            self.hedging.shutdown()
+
+    def __enter__(self) -> "NexlaClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @contextlib.contextmanager
+    def deadline(self, seconds: float) -> Iterator[Deadline]:
+        """
+        Bound every SDK call made inside the block by an end-to-end deadline.
+
+        The deadline covers token acquisition, HTTP retries and pagination:
+        each request's timeout is clamped to the remaining budget, retries stop
+        once it is spent, and a request started after it passed raises
+        DeadlineExceededError without being sent. Nested deadlines can only
+        shorten the budget.
+
+        Args:
+            seconds: Total time budget for the block
+
+        Examples:
+            with client.deadline(5.0):
+                flow = client.flows.get(flow_id)
+                sources = list(client.sources.paginate(per_page=100))
+        """
+        with deadlines.deadline(seconds) as active:
+            yield active
+
     def create_webhook_client(self, api_key: str) -> WebhooksResource:
         """
         Create a webhook client for sending data to Nexla webhooks.
@@ -276,7 +551,11 @@ class NexlaClient:
             from nexla_sdk.resources.webhooks import WebhooksResource
             webhooks = WebhooksResource(api_key="your-api-key")
         """
-        return WebhooksResource(api_key=api_key, http_client=self.http_client)
+        webhooks = WebhooksResource(api_key=api_key, http_client=self.http_client)
+        # The default client may be shared; only a user-supplied one should
+        # keep async sends off aiohttp
+        webhooks._custom_http_client = self._custom_http_client
+        return webhooks
 
     def _convert_to_model(
         self, data: Union[Dict[str, Any], List[Dict[str, Any]]], model_class: Type[T]
@@ -327,6 +606,7 @@ class NexlaClient:
 
         Raises:
             AuthenticationError: If authentication fails
+            CircuitOpenError: If the endpoint family's circuit breaker is open
             ServerError: If the API returns an error
         """
         url = f"{self.api_url}{path}"
@@ -339,18 +619,61 @@ class NexlaClient:
         if "headers" in kwargs:
             headers.update(kwargs.pop("headers"))
 
-        try:
+        # Resolve the per-operation timeout and clamp it to any active deadline
+        timeout = kwargs.pop("timeout", None)
+        if timeout is None:
+            timeout = self.timeouts.timeout_for(path)
+        if timeout is None and deadlines.current_deadline() is not None:
+            timeout = getattr(self.http_client, "timeout", None)
+        timeout = deadlines.bound_timeout(
+            timeout, operation=f"{method.lower()}_request"
+        )
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        if self._request_limiter is not None:
+            self._request_limiter.acquire()
+
+        breaker = self.circuit_breakers.get(path) if self.circuit_breakers else None
+        if breaker is not None:
+            breaker.before_request()
+
+        def send() -> Union[Dict[str, Any], None]:
             # Let auth handler manage getting a valid token and handling auth retries
             return self.auth_handler.execute_authenticated_request(
-                method=method, url=url, headers=headers, **kwargs
+                method=method, url=url, headers=dict(headers), **kwargs
             )
+
+        try:
+            if self.hedging is not None and self.hedging.applies_to(method, path):
+                response = self.hedging.execute(path, send)
+            else:
+                response = send()
         except HttpClientError as e:
+            active = deadlines.current_deadline()
+            if (
+                active is not None
+                and active.expired
+                and getattr(e, "status_code", None) is None
+            ):
+                # The caller's own deadline cut the call short; that says
+                # nothing about the backend's health
+                if breaker is not None:
+                    breaker.release()
+            else:
+                self._record_circuit_outcome(breaker, e)
+            self._raise_if_deadline_exceeded(e, method, path)
             # Map HTTP client errors to appropriate Nexla exceptions
             self._handle_http_error(e, method, path, url, kwargs)
         except NexlaError:
+            # Raised before or around the send (e.g. a failed token refresh or
+            # a spent deadline), so it says nothing about the backend
+            if breaker is not None:
+                breaker.release()
             # Preserve explicit NexlaError subclasses (e.g., AuthenticationError)
             raise
         except Exception as e:
+            self._record_circuit_outcome(breaker, e)
             raise NexlaError(
                 message=f"Request failed: {e}",
                 operation=f"{method.lower()}_request",
@@ -364,6 +687,55 @@ class NexlaClient:
                 },
                 original_error=e,
             ) from e
+        except BaseException:
+            # Interrupted mid-call: no outcome, but free any half-open probe slot
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        self._record_circuit_outcome(breaker, None)
+        return response
+
+    @staticmethod
+    def _raise_if_deadline_exceeded(
+        error: HttpClientError, method: str, path: str
+    ) -> None:
+        """Report a transport/5xx failure as a deadline miss once the budget is spent."""
+        active = deadlines.current_deadline()
+        if active is None or not active.expired:
+            return
+        status_code = getattr(error, "status_code", None)
+        if status_code is not None and status_code < 500:
+            return
+        raise DeadlineExceededError(
+            f"Deadline of {active.budget:.3f}s exceeded during {method} {path}: {error}",
+            budget=active.budget,
+            operation=f"{method.lower()}_request",
+            context={"method": method, "path": path},
+            original_error=error,
+        ) from error
+
+    @staticmethod
+    def _record_circuit_outcome(
+        breaker: Optional[CircuitBreaker], error: Optional[Exception]
+    ) -> None:
+        """
+        Feed a request outcome into its circuit breaker.
+
+        Only transport failures and 5xx responses count against the backend;
+        4xx responses (including 429) show the backend is up and answering.
+        """
+        if breaker is None:
+            return
+        if isinstance(error, HttpClientError):
+            status_code = getattr(error, "status_code", None)
+            if status_code is None or status_code >= 500:
+                breaker.record_failure()
+                return
+        elif error is not None:
+            breaker.record_failure()
+            return
+        breaker.record_success()
 
     def _handle_http_error(
         self, error: HttpClientError, method: str, path: str, url: str, kwargs: dict
@@ -0,0 +1,317 @@
+"""
+Coordinated concurrent fan-out for SDK calls.
+
+``FanOut`` owns one thread pool per client so bulk helpers and user code
+share a single bounded set of workers (and therefore a bounded number of
+pooled HTTP connections) instead of each spinning up its own executor.
+Tasks run in a copy of the submitting context, so an active
+``client.deadline(...)`` applies inside every task.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from .deadlines import current_deadline
+from .exceptions import DeadlineExceededError, FanOutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Marks threads currently running a fan-out task, to detect nested fan-outs
+_worker_state = threading.local()
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often an action may start.
+
+    Args:
+        rate: Sustained number of permits per second
+        burst: Maximum permits available at once (defaults to max(1, rate))
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until a permit is available.
+
+        Raises:
+            DeadlineExceededError: If the active deadline would pass while waiting
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_for = (1 - self._tokens) / self.rate
+
+            active = current_deadline()
+            if active is not None and wait_for > active.remaining():
+                raise DeadlineExceededError(
+                    "Deadline would be exceeded waiting for rate limiter",
+                    budget=active.budget,
+                    operation="rate_limit",
+                )
+            time.sleep(wait_for)
+
+
+class FanOut:
+    """
+    Managed thread pool for running many SDK calls concurrently.
+
+    Usually reached through ``NexlaClient.map`` and ``NexlaClient.gather``.
+
+    Args:
+        max_workers: Size of the shared thread pool
+    """
+
+    def __init__(self, max_workers: int = 16):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def map(
+        self,
+        fn: Callable[[T], R],
+        items: Iterable[T],
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        rate: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> Iterator[R]:
+        """
+        Apply ``fn`` to every item concurrently, streaming results.
+
+        Items are pulled from ``items`` lazily, so at most ``concurrency``
+        tasks are in flight and arbitrarily large iterables are fine.
+
+        Args:
+            fn: Function called with each item
+            items: Items to process
+            concurrency: Maximum tasks in flight (capped at max_workers)
+            ordered: Yield results in input order; otherwise as they complete
+            rate: Maximum task starts per second
+            return_exceptions: Yield a failed task's exception in place of its
+                result instead of collecting it
+
+        Yields:
+            Results (or exceptions, with return_exceptions=True)
+
+        Raises:
+            FanOutError: After all tasks ran, if any failed (with
+                return_exceptions=False); ``errors`` holds (item, exception)
+            DeadlineExceededError: If the active deadline passed before all
+                items were submitted
+        """
+        limit = max(1, min(concurrency or self.max_workers, self.max_workers))
+        limiter = RateLimiter(rate) if rate else None
+
+        if getattr(_worker_state, "active", False):
+            # Nested fan-out from inside a task: run inline so tasks never
+            # wait on work queued behind them in the same pool.
+            yield from self._map_inline(fn, items, limiter, return_exceptions)
+            return
+
+        executor = self._get_executor()
+        iterator = iter(enumerate(items))
+        errors: List[Tuple[Any, BaseException]] = []
+        in_flight: Deque[Tuple[T, Future]] = deque()
+        unordered: Set[Future] = set()
+        by_future = {}
+        total = 0
+        deadline_hit = False
+
+        def submit_next() -> bool:
+            nonlocal total, deadline_hit
+            active = current_deadline()
+            if active is not None and active.expired:
+                deadline_hit = True
+                return False
+            try:
+                _, item = next(iterator)
+            except StopIteration:
+                return False
+            context = contextvars.copy_context()
+            future = executor.submit(context.run, _run_task, fn, item, limiter)
+            total += 1
+            if ordered:
+                in_flight.append((item, future))
+            else:
+                unordered.add(future)
+                by_future[future] = item
+            return True
+
+        try:
+            while len(in_flight) + len(unordered) < limit and submit_next():
+                pass
+
+            while in_flight or unordered:
+                if ordered:
+                    item, future = in_flight.popleft()
+                    done_items = [(item, future)]
+                else:
+                    done, _ = wait(unordered, return_when=FIRST_COMPLETED)
+                    done_items = []
+                    for future in done:
+                        unordered.discard(future)
+                        done_items.append((by_future.pop(future), future))
+
+                for item, future in done_items:
+                    error = future.exception()
+                    if error is None:
+                        yield future.result()
+                    elif return_exceptions:
+                        yield error  # type: ignore[misc]
+                    else:
+                        errors.append((item, error))
+                    submit_next()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            for future in unordered:
+                future.cancel()
+
+        if deadline_hit:
+            active = current_deadline()
+            raise DeadlineExceededError(
+                f"Deadline exceeded after submitting {total} fan-out tasks",
+                budget=active.budget if active else None,
+                operation="fan_out",
+                context={"failed": len(errors)},
+            )
+        if errors:
+            raise FanOutError(
+                f"{len(errors)} of {total} fan-out tasks failed",
+                errors=errors,
+            )
+
+    def gather(
+        self,
+        calls: Iterable[Callable[[], R]],
+        concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> List[R]:
+        """
+        Run zero-argument callables concurrently and return their results in order.
+
+        Raises:
+            FanOutError: If any call failed (with return_exceptions=False);
+                ``results`` holds the results with None for failed calls and
+                ``errors`` holds (index, exception) pairs
+        """
+        outcomes = list(
+            self.map(
+                lambda call: call(),
+                list(calls),
+                concurrency=concurrency,
+                ordered=True,
+                rate=rate,
+                return_exceptions=True,
+            )
+        )
+        if return_exceptions:
+            return outcomes
+        errors = [
+            (index, outcome)
+            for index, outcome in enumerate(outcomes)
+            if isinstance(outcome, BaseException)
+        ]
+        if errors:
+            results = [
+                None if isinstance(outcome, BaseException) else outcome
+                for outcome in outcomes
+            ]
+            raise FanOutError(
+                f"{len(errors)} of {len(outcomes)} gathered calls failed",
+                errors=errors,
+                results=results,
+            )
+        return outcomes
+
+    def submit(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> "Future[R]":
+        """Submit a single task to the shared pool, preserving the caller's context."""
+        context = contextvars.copy_context()
+        return self._get_executor().submit(
+            context.run, _run_task, lambda _: fn(*args, **kwargs), None, None
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the shared thread pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="nexla-fanout"
+                )
+            return self._executor
+
+    @staticmethod
+    def _map_inline(
+        fn: Callable[[T], R],
+        items: Iterable[T],
+        limiter: Optional[RateLimiter],
+        return_exceptions: bool,
+    ) -> Iterator[R]:
+        errors: List[Tuple[Any, BaseException]] = []
+        total = 0
+        for item in items:
+            total += 1
+            try:
+                yield _run_task(fn, item, limiter)
+            except Exception as e:
+                if return_exceptions:
+                    yield e  # type: ignore[misc]
+                else:
+                    errors.append((item, e))
+        if errors:
+            raise FanOutError(
+                f"{len(errors)} of {total} fan-out tasks failed", errors=errors
+            )
+
+
+def _run_task(fn: Callable[[T], R], item: T, limiter: Optional[RateLimiter]) -> R:
+    previous = getattr(_worker_state, "active", False)
+    _worker_state.active = True
+    try:
+        if limiter is not None:
+            limiter.acquire()
+        return fn(item)
+    finally:
+        _worker_state.active = previous
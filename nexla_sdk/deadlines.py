@@ -0,0 +1,183 @@
+"""
+End-to-end deadlines and per-operation timeout profiles.
+
+A deadline bounds the total wall-clock time of a logical operation, however
+many HTTP requests it takes (token acquisition, retries, pagination). The
+active deadline lives in a context variable, so it follows the calling
+thread or coroutine and can be propagated to worker threads with
+``contextvars.copy_context()``.
+
+Timeout profiles assign per-request timeouts by endpoint family, so a probe
+can be given a minute while ``/token`` is expected to answer in seconds.
+"""
+
+import contextlib
+import contextvars
+import fnmatch
+import time
+from typing import Dict, Iterator, Optional
+
+from .circuit_breaker import endpoint_family
+from .exceptions import DeadlineExceededError
+
+
+class Deadline:
+    """
+    A point in time by which an operation must finish.
+
+    Args:
+        seconds: Time budget from now, in seconds
+    """
+
+    def __init__(self, seconds: float):
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self, operation: Optional[str] = None) -> None:
+        """
+        Raise if the deadline has passed.
+
+        Raises:
+            DeadlineExceededError: If no budget is left
+        """
+        if self.expired:
+            raise DeadlineExceededError(
+                f"Deadline of {self.budget:.3f}s exceeded",
+                budget=self.budget,
+                operation=operation,
+            )
+
+    def __repr__(self) -> str:
+        return f"Deadline(budget={self.budget}, remaining={self.remaining():.3f})"
+
+
+_current_deadline = contextvars.ContextVar(
+    "nexla_sdk_deadline", default=None
+)  # type: contextvars.ContextVar[Optional[Deadline]]
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline active in the current context, if any."""
+    return _current_deadline.get()
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[Deadline]:
+    """
+    Run a block of SDK calls under an end-to-end deadline.
+
+    Nested deadlines can only shorten the budget: the effective deadline is
+    whichever of the outer and inner deadlines expires first.
+
+    Examples:
+        with deadline(5.0):
+            flows = client.flows.list()
+            for source in client.sources.paginate():
+                ...
+    """
+    new_deadline = Deadline(seconds)
+    outer = _current_deadline.get()
+    if outer is not None and outer.expires_at < new_deadline.expires_at:
+        new_deadline = outer
+    token = _current_deadline.set(new_deadline)
+    try:
+        yield new_deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def bound_timeout(
+    timeout: Optional[float], operation: Optional[str] = None
+) -> Optional[float]:
+    """
+    Clamp a request timeout to the remaining deadline budget.
+
+    Args:
+        timeout: Timeout the request would otherwise use (None for no timeout)
+        operation: Operation name used in the error if the deadline passed
+
+    Returns:
+        The smaller of ``timeout`` and the remaining budget, or ``timeout``
+        unchanged when no deadline is active
+
+    Raises:
+        DeadlineExceededError: If the active deadline has already passed
+    """
+    active = _current_deadline.get()
+    if active is None:
+        return timeout
+    active.check(operation)
+    remaining = active.remaining()
+    if timeout is None:
+        return remaining
+    return min(timeout, remaining)
+
+
+def fits_deadline(seconds: float) -> bool:
+    """
+    Whether a wait of ``seconds`` ends before the active deadline.
+
+    Retry loops use this to give up instead of sleeping past the deadline.
+    Always True when no deadline is active.
+    """
+    active = _current_deadline.get()
+    return active is None or seconds < active.remaining()
+
+
+# Defaults for operations known to be much slower or faster than typical calls.
+DEFAULT_TIMEOUT_PROFILES: Dict[str, float] = {
+    "/token": 5.0,
+    "/token/*": 5.0,
+    "/data_credentials/*/probe": 60.0,
+    "/data_credentials/*/probe/*": 60.0,
+    "/flows": 30.0,
+}
+
+
+class TimeoutProfiles:
+    """
+    Per-operation request timeouts keyed by endpoint family glob patterns.
+
+    Patterns are matched against the endpoint family of the request path
+    (numeric IDs collapsed to ``*``, see ``circuit_breaker.endpoint_family``).
+    The first matching pattern wins, checking overrides before defaults.
+
+    Args:
+        profiles: Pattern to timeout (seconds) overrides
+        default: Timeout for paths that match no pattern; None defers to the
+            HTTP client's own default
+        include_defaults: Whether to include DEFAULT_TIMEOUT_PROFILES
+
+    Examples:
+        profiles = TimeoutProfiles({"/data_sets/*/samples": 45.0}, default=10.0)
+        client = NexlaClient(service_key="...", timeouts=profiles)
+    """
+
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, float]] = None,
+        default: Optional[float] = None,
+        include_defaults: bool = True,
+    ):
+        self.default = default
+        self.profiles: Dict[str, float] = dict(profiles or {})
+        if include_defaults:
+            for pattern, seconds in DEFAULT_TIMEOUT_PROFILES.items():
+                self.profiles.setdefault(pattern, seconds)
+
+    def timeout_for(self, path: str) -> Optional[float]:
+        """Return the configured timeout for a request path."""
+        family = endpoint_family(path)
+        for pattern, seconds in self.profiles.items():
+            if fnmatch.fnmatchcase(family, pattern):
+                return seconds
+        return self.default
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class NexlaError(Exception):
@@ -111,6 +111,55 @@ class ServerError(NexlaError):
     pass
 
 
+class CircuitOpenError(NexlaError):
+    """Raised when a circuit breaker rejects a request without sending it."""
+
+    def __init__(
+        self,
+        message: str,
+        endpoint_family: Optional[str] = None,
+        retry_after: Optional[float] = None,
+        **kwargs,
+    ):
+        kwargs.setdefault("operation", "circuit_breaker")
+        super().__init__(message, **kwargs)
+        self.endpoint_family = endpoint_family
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(NexlaError):
+    """Raised when an operation runs past its end-to-end deadline."""
+
+    def __init__(self, message: str, budget: Optional[float] = None, **kwargs):
+        kwargs.setdefault("operation", "deadline")
+        super().__init__(message, **kwargs)
+        self.budget = budget
+
+
+class FanOutError(NexlaError):
+    """Raised when one or more tasks of a concurrent fan-out fail."""
+
+    def __init__(
+        self,
+        message: str,
+        errors: Optional[List[Tuple[Any, BaseException]]] = None,
+        results: Optional[List[Any]] = None,
+        **kwargs,
+    ):
+        kwargs.setdefault("operation", "fan_out")
+        super().__init__(message, **kwargs)
+        self.errors = errors or []
+        self.results = results
+
+
+class BufferFullError(NexlaError):
+    """Raised when a producer's buffer stays full past its blocking timeout."""
+
+    def __init__(self, message: str, **kwargs):
+        kwargs.setdefault("operation", "webhook_produce")
+        super().__init__(message, **kwargs)
+
+
 class ResourceConflictError(NexlaError):
     """Raised when resource conflicts occur."""
 
@@ -159,3 +208,20 @@ class TransformError(NexlaError):
         if transform_id:
             kwargs.setdefault("resource_id", transform_id)
         super().__init__(message, **kwargs)
+
+
+def is_retryable_error(error: NexlaError) -> bool:
+    """
+    Whether a failed call is worth retrying.
+
+    Rate limits, 5xx responses and failures that never got a response
+    (connection errors, timeouts) are retryable. Other 4xx responses and
+    errors raised for a specific client-side cause (authentication, not
+    found, an expired deadline, ...) are not.
+    """
+    if isinstance(error, RateLimitError):
+        return True
+    status = error.status_code or getattr(error.original_error, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return type(error) in (NexlaError, ServerError)
@@ -0,0 +1,194 @@
+"""
+Request hedging for idempotent GET requests.
+
+A hedged request sends a duplicate of a slow GET once the first attempt has
+been outstanding for longer than a recent latency percentile of its endpoint
+family. Whichever attempt succeeds first wins. Hedges are capped to a
+fraction of all hedgeable requests so the extra load stays bounded.
+"""
+
+import contextvars
+import fnmatch
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+
+from .circuit_breaker import endpoint_family
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    """
+    Opt-in hedging configuration and bookkeeping for GET requests.
+
+    Args:
+        percentile: Latency percentile of the endpoint family used as hedge delay
+        initial_delay: Hedge delay used until enough latency samples exist
+        min_delay: Lower bound for the hedge delay in seconds
+        max_delay: Upper bound for the hedge delay in seconds
+        window: Number of recent latency samples kept per endpoint family
+        min_samples: Samples required before the percentile is trusted
+        max_hedge_ratio: Maximum fraction of hedgeable requests that may be hedged
+        families: Optional glob patterns of endpoint families to hedge
+            (e.g. ``["/flows/*", "/data_sets/*"]``); all GETs when omitted
+        max_workers: Size of the thread pool running the attempts
+
+    Examples:
+        client = NexlaClient(
+            service_key="...",
+            hedging=HedgingPolicy(percentile=95, max_hedge_ratio=0.05),
+        )
+        flow = client.flows.get(123)
+        print(client.hedging.metrics())
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.02,
+        max_delay: float = 5.0,
+        window: int = 200,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.05,
+        families: Optional[List[str]] = None,
+        max_workers: int = 16,
+    ):
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.families = families
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Counters exposed through metrics()
+        self._requests = 0
+        self._hedges_sent = 0
+        self._hedges_won = 0
+        self._hedges_denied = 0
+
+    def applies_to(self, method: str, path: str) -> bool:
+        """Whether a request is eligible for hedging."""
+        if method.upper() != "GET":
+            return False
+        if not self.families:
+            return True
+        family = endpoint_family(path)
+        return any(fnmatch.fnmatchcase(family, pattern) for pattern in self.families)
+
+    def hedge_delay(self, path: str) -> float:
+        """Seconds to wait for the first attempt before sending a hedge."""
+        family = endpoint_family(path)
+        with self._lock:
+            samples = list(self._latencies.get(family, ()))
+        if len(samples) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            samples.sort()
+            index = int(round((self.percentile / 100.0) * (len(samples) - 1)))
+            delay = samples[min(max(index, 0), len(samples) - 1)]
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def record_latency(self, path: str, seconds: float) -> None:
+        """Add a completed request's latency to its family's window."""
+        family = endpoint_family(path)
+        with self._lock:
+            samples = self._latencies.get(family)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self._latencies[family] = samples
+            samples.append(seconds)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return hedging counters."""
+        with self._lock:
+            requests = self._requests
+            return {
+                "requests": requests,
+                "hedges_sent": self._hedges_sent,
+                "hedges_won": self._hedges_won,
+                "hedges_denied": self._hedges_denied,
+                "hedge_rate": (self._hedges_sent / requests) if requests else 0.0,
+            }
+
+    def execute(self, path: str, call: Callable[[], T]) -> T:
+        """
+        Run ``call``, hedging it with a duplicate if it is slow.
+
+        The attempt that succeeds first wins. A losing attempt that has not
+        started yet is cancelled; one already in flight cannot be aborted
+        mid-request and its response is discarded.
+        """
+        with self._lock:
+            self._requests += 1
+        delay = self.hedge_delay(path)
+        executor = self._get_executor()
+        started = time.monotonic()
+
+        primary = executor.submit(contextvars.copy_context().run, call)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._acquire_hedge():
+            result = primary.result()
+            self.record_latency(path, time.monotonic() - started)
+            return result
+
+        logger.debug("Hedging slow GET %s after %.3fs", path, delay)
+        hedge = executor.submit(contextvars.copy_context().run, call)
+        attempts = [primary, hedge]
+        pending = set(attempts)
+        first_error: Optional[BaseException] = None
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in attempts:
+                if future not in done:
+                    continue
+                error = future.exception()
+                if error is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if future is hedge:
+                        with self._lock:
+                            self._hedges_won += 1
+                    self.record_latency(path, time.monotonic() - started)
+                    return future.result()
+                if first_error is None or future is primary:
+                    first_error = error
+
+        raise first_error  # type: ignore[misc]
+
+    def shutdown(self) -> None:
+        """Release the attempt thread pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _acquire_hedge(self) -> bool:
+        with self._lock:
+            if self._hedges_sent + 1 > self.max_hedge_ratio * self._requests + 1:
+                self._hedges_denied += 1
+                return False
+            self._hedges_sent += 1
+            return True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="nexla-hedge"
+                )
+            return self._executor
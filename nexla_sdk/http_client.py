@@ -2,8 +2,11 @@
 HTTP client interface and implementations for Nexla SDK
 """
 
+import contextlib
+import contextvars
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, Union
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -22,6 +25,7 @@ except Exception:  # pragma: no cover
 
 # Optional OpenTelemetry imports (guarded by availability)
 from . import telemetry
+from .deadlines import current_deadline
 
 try:  # pragma: no cover - optional dependency
     from opentelemetry.propagate import inject  # type: ignore
@@ -35,6 +39,71 @@ except Exception:  # pragma: no cover
         return None
 
 
+if Retry is not None:
+
+    class _DeadlineAwareRetry(Retry):
+        """
+        urllib3 Retry that stops retrying once the active SDK deadline passes.
+
+        Retries run synchronously in the calling thread, so the deadline
+        context variable of the caller is visible here, as is
+        ``no_transport_retries()``. Backoff and
+        Retry-After sleeps are clamped to the remaining budget.
+        """
+
+        def is_exhausted(self) -> bool:
+            if not _transport_retries.get():
+                return True
+            active = current_deadline()
+            if active is not None and active.expired:
+                return True
+            return super().is_exhausted()
+
+        def get_backoff_time(self) -> float:
+            return _clamp_to_deadline(super().get_backoff_time())
+
+        def get_retry_after(self, response):  # type: ignore[override]
+            retry_after = super().get_retry_after(response)
+            if retry_after is None:
+                return None
+            return _clamp_to_deadline(retry_after)
+
+else:  # pragma: no cover
+    _DeadlineAwareRetry = None  # type: ignore[assignment,misc]
+
+
+_transport_retries = contextvars.ContextVar(
+    "nexla_sdk_transport_retries", default=True
+)  # type: contextvars.ContextVar[bool]
+
+
+@contextlib.contextmanager
+def no_transport_retries() -> Iterator[None]:
+    """
+    Send the requests of a block without RequestsHttpClient's own retries.
+
+    For callers that run their own retry loop: each of their attempts is then
+    a single request instead of a full round of transport retries. Failures
+    surface as they would once the transport retries are used up.
+
+    Examples:
+        with no_transport_retries():
+            client.request("PUT", url, json=body)
+    """
+    token = _transport_retries.set(False)
+    try:
+        yield
+    finally:
+        _transport_retries.reset(token)
+
+
+def _clamp_to_deadline(seconds: float) -> float:
+    active = current_deadline()
+    if active is None:
+        return seconds
+    return min(seconds, active.remaining())
+
+
 class HttpClientInterface(ABC):
     """
     Abstract interface for HTTP clients used by the Nexla SDK.
@@ -88,14 +157,16 @@ class RequestsHttpClient(HttpClientInterface):
         max_retries: int = 3,
         backoff_factor: float = 0.5,
         tracer: Optional[object] = None,
+        pool_maxsize: int = 10,
     ):
         self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
         self.session = requests.Session()
         self.tracer = tracer if tracer is not None else telemetry.get_tracer(False)
 
-        # Configure retries if available
-        if Retry is not None:
-            retry = Retry(
+        # Configure retries if available (bounded by any active deadline)
+        if _DeadlineAwareRetry is not None:
+            retry = _DeadlineAwareRetry(
                 total=max_retries,
                 read=max_retries,
                 connect=max_retries,
@@ -112,10 +183,46 @@ class RequestsHttpClient(HttpClientInterface):
                 ],
                 raise_on_status=False,
             )
-            adapter = HTTPAdapter(max_retries=retry)
+            adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        else:  # pragma: no cover
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
             self.session.mount("http://", adapter)
             self.session.mount("https://", adapter)
 
+    def warm_connections(self, url: str, connections: int = 4) -> int:
+        """
+        Open keep-alive connections to the host of ``url`` ahead of real traffic.
+
+        Sends concurrent HEAD requests so DNS, TCP and TLS setup happen up
+        front and the connections are parked in the session's pool. Any HTTP
+        response counts as a warmed connection, whatever its status.
+
+        Args:
+            url: URL on the host to connect to
+            connections: Number of connections to open (capped at pool_maxsize)
+
+        Returns:
+            Number of connections that were opened successfully
+        """
+        count = max(1, min(connections, self.pool_maxsize))
+        headers = {"User-Agent": f"nexla-sdk/{_SDK_VERSION}"}
+
+        def open_connection(_: int) -> bool:
+            try:
+                self.session.head(
+                    url, headers=headers, timeout=self.timeout, allow_redirects=False
+                )
+                return True
+            except requests.exceptions.RequestException:
+                return False
+
+        with ThreadPoolExecutor(
+            max_workers=count, thread_name_prefix="nexla-warmup"
+        ) as pool:
+            return sum(pool.map(open_connection, range(count)))
+
     def request(
         self, method: str, url: str, headers: Dict[str, str], **kwargs
     ) -> Union[Dict[str, Any], None]:
@@ -70,6 +70,8 @@ from nexla_sdk.models.enums import (
 )
 from nexla_sdk.models.flows import (
     DocsRecommendation,
+    FlowBulkItemResult,
+    FlowBulkResult,
     FlowCopyOptions,
     FlowElements,
     FlowLogEntry,
@@ -81,6 +83,7 @@ from nexla_sdk.models.flows import (
     FlowMetricsData,
     FlowMetricsMeta,
     FlowResponse,
+    FlowStatusTransition,
 )
 from nexla_sdk.models.genai import (
     ActiveConfigView,
@@ -92,8 +95,13 @@ from nexla_sdk.models.genai import (
 )
 from nexla_sdk.models.lookups import (
     Lookup,
+    LookupBulkResult,
+    LookupChunkResult,
     LookupCreate,
+    LookupDeleteResult,
+    LookupEntriesResult,
     LookupEntriesUpsert,
+    LookupSyncReport,
     LookupUpdate,
 )
 from nexla_sdk.models.marketplace import (
@@ -117,6 +125,7 @@ from nexla_sdk.models.nexsets import (
     NexsetCopyOptions,
     NexsetCreate,
     NexsetSample,
+    NexsetSamples,
     NexsetStatus,
     NexsetUpdate,
     OutputType,
@@ -186,7 +195,11 @@ from nexla_sdk.models.users import (
     UserSettings,
     UserUpdate,
 )
-from nexla_sdk.models.webhooks import WebhookResponse, WebhookSendOptions
+from nexla_sdk.models.webhooks import (
+    WebhookDelivery,
+    WebhookResponse,
+    WebhookSendOptions,
+)
 
 __all__ = [
     # Base and Common models
@@ -242,6 +255,9 @@ __all__ = [
     "FlowMetricsData",
     "FlowMetricsApiResponse",
     "DocsRecommendation",
+    "FlowBulkItemResult",
+    "FlowBulkResult",
+    "FlowStatusTransition",
     # Source models and enums
     "SourceStatus",
     "SourceType",
@@ -269,12 +285,18 @@ __all__ = [
     "OutputType",
     "Nexset",
     "NexsetSample",
+    "NexsetSamples",
     "DataSinkSimplified",
     "NexsetCreate",
     "NexsetUpdate",
     "NexsetCopyOptions",
     # Lookup models
     "Lookup",
+    "LookupBulkResult",
+    "LookupChunkResult",
+    "LookupDeleteResult",
+    "LookupEntriesResult",
+    "LookupSyncReport",
     "LookupCreate",
     "LookupUpdate",
     "LookupEntriesUpsert",
@@ -377,4 +399,5 @@ __all__ = [
     # Webhooks
     "WebhookSendOptions",
     "WebhookResponse",
+    "WebhookDelivery",
 ]
@@ -1,6 +1,8 @@
 from nexla_sdk.models.flows.requests import FlowCopyOptions
 from nexla_sdk.models.flows.responses import (
     DocsRecommendation,
+    FlowBulkItemResult,
+    FlowBulkResult,
     FlowElements,
     FlowLogEntry,
     FlowLogsMeta,
@@ -11,6 +13,7 @@ from nexla_sdk.models.flows.responses import (
     FlowMetricsData,
     FlowMetricsMeta,
     FlowResponse,
+    FlowStatusTransition,
 )
 
 __all__ = [
@@ -26,6 +29,9 @@ __all__ = [
     "FlowMetricsData",
     "FlowMetricsApiResponse",
     "DocsRecommendation",
+    "FlowBulkItemResult",
+    "FlowBulkResult",
+    "FlowStatusTransition",
     # Requests
     "FlowCopyOptions",
 ]
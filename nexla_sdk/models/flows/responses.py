@@ -138,3 +138,38 @@ class FlowResponse(BaseModel):
     users: Optional[List[Dict[str, Any]]] = None
     projects: Optional[List[Dict[str, Any]]] = None
     metrics: Optional[List[FlowMetrics]] = None
+
+
+class FlowBulkItemResult(BaseModel):
+    """Outcome of a bulk activate/pause for one flow or resource."""
+
+    id: int
+    success: bool
+    flow: Optional[FlowResponse] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+    previous_status: Optional[str] = None
+
+
+class FlowBulkResult(BaseModel):
+    """Summary of an activate_many() or pause_many() call."""
+
+    action: str
+    succeeded: List[FlowBulkItemResult] = Field(default_factory=list)
+    failed: List[FlowBulkItemResult] = Field(default_factory=list)
+    rolled_back: List[FlowBulkItemResult] = Field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every flow changed state successfully."""
+        return not self.failed
+
+
+class FlowStatusTransition(BaseModel):
+    """A status change observed by flows.watch()."""
+
+    flow_id: int
+    old_status: Optional[str] = None
+    new_status: Optional[str] = None
+    node: Optional[FlowNode] = None
+    elapsed: float = 0.0
@@ -3,11 +3,23 @@ from nexla_sdk.models.lookups.requests import (
     LookupEntriesUpsert,
     LookupUpdate,
 )
-from nexla_sdk.models.lookups.responses import Lookup
+from nexla_sdk.models.lookups.responses import (
+    Lookup,
+    LookupBulkResult,
+    LookupChunkResult,
+    LookupDeleteResult,
+    LookupEntriesResult,
+    LookupSyncReport,
+)
 
 __all__ = [
     # Responses
     "Lookup",
+    "LookupBulkResult",
+    "LookupChunkResult",
+    "LookupDeleteResult",
+    "LookupEntriesResult",
+    "LookupSyncReport",
     # Requests
     "LookupCreate",
     "LookupUpdate",
@@ -32,3 +32,88 @@ class Lookup(BaseModel):
     tags: List[str] = Field(default_factory=list)
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+
+class LookupChunkResult(BaseModel):
+    """Outcome of uploading one chunk in lookups.bulk_upsert()."""
+
+    index: int
+    start: int
+    rows: int
+    bytes: int
+    success: bool
+    attempts: int = 1
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+
+
+class LookupBulkResult(BaseModel):
+    """Summary of a lookups.bulk_upsert() call."""
+
+    data_map_id: int
+    chunks: List[LookupChunkResult] = Field(default_factory=list)
+
+    @property
+    def failed(self) -> List[LookupChunkResult]:
+        """Chunks that could not be uploaded, in row order."""
+        return [chunk for chunk in self.chunks if not chunk.success]
+
+    @property
+    def rows_upserted(self) -> int:
+        """Number of entries in successfully uploaded chunks."""
+        return sum(chunk.rows for chunk in self.chunks if chunk.success)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every chunk was uploaded."""
+        return not self.failed
+
+
+class LookupEntriesResult(BaseModel):
+    """Entries resolved by lookups.get_entries_map(), keyed by requested key."""
+
+    entries: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    missing: List[str] = Field(default_factory=list)
+    failed: Dict[str, str] = Field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every batch was fetched (misses are not failures)."""
+        return not self.failed
+
+
+class LookupDeleteResult(BaseModel):
+    """Outcome of lookups.delete_entries_many()."""
+
+    data_map_id: int
+    deleted_keys: List[str] = Field(default_factory=list)
+    responses: List[Any] = Field(default_factory=list)
+    failed: Dict[str, str] = Field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every batch was deleted."""
+        return not self.failed
+
+
+class LookupSyncReport(BaseModel):
+    """Summary of a lookups.sync() call."""
+
+    data_map_id: int
+    added: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    skipped: int = 0
+    dry_run: bool = False
+    added_keys: List[str] = Field(default_factory=list)
+    changed_keys: List[str] = Field(default_factory=list)
+    removed_keys: List[str] = Field(default_factory=list)
+    upsert: Optional[LookupBulkResult] = None
+    delete_failed: Dict[str, str] = Field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every upsert chunk and delete batch succeeded."""
+        upserted = self.upsert is None or self.upsert.ok
+        return upserted and not self.delete_failed
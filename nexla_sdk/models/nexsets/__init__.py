@@ -4,7 +4,12 @@ from nexla_sdk.models.nexsets.requests import (
     NexsetCreate,
     NexsetUpdate,
 )
-from nexla_sdk.models.nexsets.responses import DataSinkSimplified, Nexset, NexsetSample
+from nexla_sdk.models.nexsets.responses import (
+    DataSinkSimplified,
+    Nexset,
+    NexsetSample,
+    NexsetSamples,
+)
 
 __all__ = [
     # Enums
@@ -14,6 +19,7 @@ __all__ = [
     # Responses
     "Nexset",
     "NexsetSample",
+    "NexsetSamples",
     "DataSinkSimplified",
     # Requests
     "NexsetCreate",
@@ -64,3 +64,14 @@ class NexsetSample(BaseModel):
                 # Direct record format - entire dict is the raw message
                 return {"raw_message": data, "nexla_metadata": None}
         return data
+
+
+class NexsetSamples(BaseModel):
+    """Samples drawn from one nexset by nexsets.sample_many()."""
+
+    set_id: int
+    samples: List[Any] = Field(default_factory=list)
+    rows: int = 0
+    success: bool = True
+    error: Optional[str] = None
+    status_code: Optional[int] = None
@@ -1,9 +1,10 @@
 """Webhook models."""
 
 from .requests import WebhookSendOptions
-from .responses import WebhookResponse
+from .responses import WebhookDelivery, WebhookResponse
 
 __all__ = [
     "WebhookSendOptions",
     "WebhookResponse",
+    "WebhookDelivery",
 ]
@@ -15,3 +15,30 @@ class WebhookResponse(BaseModel):
 
     dataset_id: Optional[int] = None
     processed: Optional[int] = None
+
+
+class WebhookDelivery(BaseModel):
+    """Outcome of delivering one buffered batch to a webhook.
+
+    Attributes:
+        webhook_url: Webhook the batch was sent to.
+        records: Number of records in the batch.
+        bytes: Serialized size of the batch.
+        success: Whether the webhook accepted the batch.
+        attempts: Requests made, including retries.
+        response: Webhook response when the batch was accepted.
+        error: Error message when it was not.
+        latency: Seconds from the first request to the final response.
+        dead_lettered: Whether a spooled batch the webhook rejected for good
+            was moved to the spool's dead-letter file.
+    """
+
+    webhook_url: str
+    records: int
+    bytes: int = 0
+    success: bool
+    attempts: int = 1
+    response: Optional[WebhookResponse] = None
+    error: Optional[str] = None
+    latency: Optional[float] = None
+    dead_lettered: bool = False
@@ -1,13 +1,47 @@
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import contextvars
+import functools
+import itertools
+import json
+import os
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
+from nexla_sdk.deadlines import current_deadline
+from nexla_sdk.exceptions import DeadlineExceededError, NotFoundError
+from nexla_sdk.models.common import FlowNode
 from nexla_sdk.models.flows.requests import FlowCopyOptions
 from nexla_sdk.models.flows.responses import (
     DocsRecommendation,
+    FlowBulkItemResult,
+    FlowBulkResult,
+    FlowLogEntry,
     FlowLogsResponse,
     FlowMetricsApiResponse,
     FlowResponse,
+    FlowStatusTransition,
 )
 from nexla_sdk.resources.base_resource import BaseResource
+from nexla_sdk.utils.polling import AdaptivePoller
+
+FlowBulkProgressCallback = Callable[[FlowBulkItemResult, int, int], None]
+
+# Status reported by flows.watch() for a flow deleted while watched
+_DELETED = "DELETED"
+# _get_root() result for a flow the response did not include
+_MISSING = object()
 
 
 class FlowsResource(BaseResource):
@@ -56,6 +90,46 @@ class FlowsResource(BaseResource):
         # API returns a single FlowResponse object for list
         return [self._parse_response(response)]
 
+    def iter_pages(
+        self, per_page: int = 100, flows_only: bool = False, **kwargs
+    ) -> Iterator[FlowResponse]:
+        """
+        List flows page by page.
+
+        Stops at an empty page, at the response's ``meta.pageCount`` when
+        present, and otherwise at a short page (or an oversized one, from a
+        server that ignored paging).
+
+        Args:
+            per_page: Flows requested per page
+            flows_only: Only return flow structure without resource details
+            **kwargs: Other list() filters
+
+        Yields:
+            FlowResponse for each page
+
+        Examples:
+            for page in client.flows.iter_pages(flows_only=True):
+                for root in page.flows:
+                    print(root.id, root.status)
+        """
+        page = 1
+        while True:
+            responses = self.list(
+                flows_only=flows_only, page=page, per_page=per_page, **kwargs
+            )
+            count = sum(len(response.flows) for response in responses)
+            if not count:
+                return
+            yield from responses
+            page_count = _page_count(responses)
+            if page_count is not None:
+                if page >= page_count:
+                    return
+            elif count != per_page:
+                return
+            page += 1
+
     def get(
         self, flow_id: int, flows_only: bool = False, include_run_metrics: bool = False
     ) -> FlowResponse:
@@ -100,7 +174,11 @@ class FlowsResource(BaseResource):
         return self._parse_response(response)
 
     def activate(
-        self, flow_id: int, all: bool = False, full_tree: bool = False
+        self,
+        flow_id: int,
+        all: bool = False,
+        full_tree: bool = False,
+        async_mode: bool = False,
     ) -> FlowResponse:
         """
         Activate a flow.
@@ -108,6 +186,8 @@ class FlowsResource(BaseResource):
         Args:
             flow_id: Flow ID
             all: Activate entire flow tree
+            full_tree: Alias for 'all' parameter
+            async_mode: Execute activation asynchronously
 
         Returns:
             Activated flow
@@ -118,6 +198,8 @@ class FlowsResource(BaseResource):
             params["all"] = 1
         if full_tree:
             params["full_tree"] = 1
+        if async_mode:
+            params["async"] = 1
 
         response = self._make_request("PUT", path, params=params)
         return self._parse_response(response)
@@ -202,6 +284,7 @@ class FlowsResource(BaseResource):
         resource_id: int,
         all: bool = False,
         full_tree: bool = False,
+        async_mode: bool = False,
     ) -> FlowResponse:
         """
         Activate flow by resource ID.
@@ -210,6 +293,8 @@ class FlowsResource(BaseResource):
             resource_type: Type of resource
             resource_id: Resource ID
             all: Activate entire flow tree
+            full_tree: Alias for 'all' parameter
+            async_mode: Execute activation asynchronously
 
         Returns:
             Activated flow
@@ -220,6 +305,8 @@ class FlowsResource(BaseResource):
             params["all"] = 1
         if full_tree:
             params["full_tree"] = 1
+        if async_mode:
+            params["async"] = 1
 
         response = self._make_request("PUT", path, params=params)
         return self._parse_response(response)
@@ -230,6 +317,7 @@ class FlowsResource(BaseResource):
         resource_id: int,
         all: bool = False,
         full_tree: bool = False,
+        async_mode: bool = False,
     ) -> FlowResponse:
         """
         Pause flow by resource ID.
@@ -238,6 +326,8 @@ class FlowsResource(BaseResource):
             resource_type: Type of resource
             resource_id: Resource ID
             all: Pause entire flow tree
+            full_tree: Alias for 'all' parameter
+            async_mode: Execute pause asynchronously
 
         Returns:
             Paused flow
@@ -248,10 +338,332 @@ class FlowsResource(BaseResource):
             params["all"] = 1
         if full_tree:
             params["full_tree"] = 1
+        if async_mode:
+            params["async"] = 1
 
         response = self._make_request("PUT", path, params=params)
         return self._parse_response(response)
 
+    def activate_many(
+        self,
+        flow_ids: Optional[Iterable[int]] = None,
+        resource_type: Optional[str] = None,
+        resource_ids: Optional[Iterable[int]] = None,
+        all: bool = False,
+        full_tree: bool = False,
+        async_mode: bool = False,
+        concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        on_progress: Optional[FlowBulkProgressCallback] = None,
+        rollback: bool = False,
+    ) -> FlowBulkResult:
+        """
+        Activate many flows concurrently.
+
+        Args:
+            flow_ids: Flow IDs to activate
+            resource_type: Resource type, to activate by resource instead
+                (data_sources, data_sets, data_sinks)
+            resource_ids: Resource IDs, used together with resource_type
+            all: Activate entire flow trees
+            full_tree: Alias for 'all' parameter
+            async_mode: Ask the API to activate asynchronously
+            concurrency: Maximum requests in flight (capped at the client's
+                max_workers)
+            rate: Maximum requests started per second
+            on_progress: Called as ``on_progress(item, completed, total)``
+                after each flow finishes
+            rollback: Pause the flows that were activated if any activation
+                fails. Each flow's status is fetched first so flows that were
+                already active are left alone; a flow whose status cannot be
+                fetched is reported as failed and not activated.
+
+        Returns:
+            FlowBulkResult with per-flow outcomes
+
+        Examples:
+            result = client.flows.activate_many(flow_ids, concurrency=8, rate=20)
+            if not result.ok:
+                print([item.id for item in result.failed])
+        """
+        return self._change_many(
+            "activate",
+            flow_ids,
+            resource_type,
+            resource_ids,
+            dict(all=all, full_tree=full_tree, async_mode=async_mode),
+            concurrency,
+            rate,
+            on_progress,
+            rollback,
+        )
+
+    def pause_many(
+        self,
+        flow_ids: Optional[Iterable[int]] = None,
+        resource_type: Optional[str] = None,
+        resource_ids: Optional[Iterable[int]] = None,
+        all: bool = False,
+        full_tree: bool = False,
+        async_mode: bool = False,
+        concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        on_progress: Optional[FlowBulkProgressCallback] = None,
+        rollback: bool = False,
+    ) -> FlowBulkResult:
+        """
+        Pause many flows concurrently.
+
+        Takes the same arguments as activate_many(); with ``rollback=True``
+        the flows this call paused (not ones that were already paused) are
+        re-activated if any pause fails.
+
+        Returns:
+            FlowBulkResult with per-flow outcomes
+
+        Examples:
+            client.flows.pause_many(
+                resource_type="data_sources", resource_ids=source_ids, all=True
+            )
+        """
+        return self._change_many(
+            "pause",
+            flow_ids,
+            resource_type,
+            resource_ids,
+            dict(all=all, full_tree=full_tree, async_mode=async_mode),
+            concurrency,
+            rate,
+            on_progress,
+            rollback,
+        )
+
+    def _change_many(
+        self,
+        action: str,
+        flow_ids: Optional[Iterable[int]],
+        resource_type: Optional[str],
+        resource_ids: Optional[Iterable[int]],
+        options: Dict[str, Any],
+        concurrency: Optional[int],
+        rate: Optional[float],
+        on_progress: Optional[FlowBulkProgressCallback],
+        rollback: bool,
+    ) -> FlowBulkResult:
+        if (flow_ids is None) == (resource_ids is None):
+            raise ValueError("Provide exactly one of flow_ids or resource_ids")
+        if resource_ids is not None and not resource_type:
+            raise ValueError("resource_type is required with resource_ids")
+        ids = list(flow_ids if flow_ids is not None else resource_ids)
+
+        result = FlowBulkResult(action=action)
+        items = self._run_many(
+            action, ids, resource_type, options, concurrency, rate, rollback
+        )
+        for completed, item in enumerate(items, start=1):
+            (result.succeeded if item.success else result.failed).append(item)
+            if on_progress is not None:
+                on_progress(item, completed, len(ids))
+
+        if rollback and result.failed and result.succeeded:
+            undo = "pause" if action == "activate" else "activate"
+            target = "ACTIVE" if action == "activate" else "PAUSED"
+            # Only undo flows this call moved; ones already in the target
+            # state stay where they were
+            undo_ids = [
+                item.id for item in result.succeeded if item.previous_status != target
+            ]
+            if undo_ids:
+                result.rolled_back = list(
+                    self._run_many(
+                        undo, undo_ids, resource_type, options, concurrency, rate
+                    )
+                )
+        return result
+
+    def _run_many(
+        self,
+        action: str,
+        ids: List[int],
+        resource_type: Optional[str],
+        options: Dict[str, Any],
+        concurrency: Optional[int],
+        rate: Optional[float],
+        capture_status: bool = False,
+    ) -> Iterator[FlowBulkItemResult]:
+        if resource_type:
+            method = getattr(self, f"{action}_by_resource")
+
+            def call(target_id: int) -> FlowResponse:
+                return method(resource_type, target_id, **options)
+
+            def fetch(target_id: int) -> FlowResponse:
+                return self.get_by_resource(resource_type, target_id, flows_only=True)
+
+        else:
+            method = getattr(self, action)
+
+            def call(target_id: int) -> FlowResponse:
+                return method(target_id, **options)
+
+            def fetch(target_id: int) -> FlowResponse:
+                return self.get(target_id, flows_only=True)
+
+        def run(target_id: int) -> FlowBulkItemResult:
+            previous_status = None
+            try:
+                if capture_status:
+                    current = fetch(target_id)
+                    if current.flows:
+                        previous_status = current.flows[0].status
+                flow = call(target_id)
+            except Exception as e:
+                return FlowBulkItemResult(
+                    id=target_id,
+                    success=False,
+                    error=str(e),
+                    status_code=getattr(e, "status_code", None),
+                    previous_status=previous_status,
+                )
+            return FlowBulkItemResult(
+                id=target_id, success=True, flow=flow, previous_status=previous_status
+            )
+
+        return self.client.map(
+            run, ids, concurrency=concurrency, ordered=False, rate=rate
+        )
+
+    def watch(
+        self,
+        flow_ids: Union[int, Iterable[int]],
+        until: Union[str, Iterable[str]] = "ACTIVE",
+        timeout: Optional[float] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        batch_threshold: int = 10,
+    ) -> Iterator[FlowStatusTransition]:
+        """
+        Watch flows until they all reach a target status.
+
+        Each poll round covers every pending flow. When more than
+        ``batch_threshold`` flows are pending it pages through
+        ``list(flows_only=True)`` until every one was seen, otherwise (and for
+        flows the listing missed) it makes concurrent
+        ``get(flows_only=True)`` calls. Intervals grow exponentially (with
+        jitter) while nothing changes and drop back to ``min_interval`` after
+        any transition. Flows stop being polled once they reach a target
+        status; a flow deleted while watched yields a final transition to
+        ``"DELETED"``.
+
+        Args:
+            flow_ids: Flow ID or IDs to watch
+            until: Target status or statuses (case-insensitive)
+            timeout: Maximum seconds to wait; an active client deadline also
+                applies
+            min_interval: Smallest polling interval, in seconds
+            max_interval: Largest polling interval, in seconds
+            batch_threshold: Pending-flow count above which one list call is
+                used instead of per-flow gets
+
+        Yields:
+            FlowStatusTransition for every observed status, starting with the
+            initial status of each flow (``old_status`` None)
+
+        Raises:
+            DeadlineExceededError: If the flows did not all reach the target
+                status in time
+
+        Examples:
+            client.flows.activate_many(flow_ids)
+            for change in client.flows.watch(flow_ids, until="ACTIVE", timeout=300):
+                print(change.flow_id, change.old_status, "->", change.new_status)
+        """
+        watch = _StatusWatch(flow_ids, until, timeout)
+        poller = AdaptivePoller(min_interval, max_interval)
+        while True:
+            roots = self._poll_roots(watch.pending, batch_threshold)
+            transitions = watch.update(roots)
+            yield from transitions
+            if watch.done:
+                return
+            if transitions:
+                poller.reset()
+            time.sleep(watch.sleep_time(poller.next_interval()))
+
+    async def watch_async(
+        self,
+        flow_ids: Union[int, Iterable[int]],
+        until: Union[str, Iterable[str]] = "ACTIVE",
+        timeout: Optional[float] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        batch_threshold: int = 10,
+    ) -> AsyncIterator[FlowStatusTransition]:
+        """
+        Async variant of watch().
+
+        Polls run in the event loop's default executor and waits use
+        ``asyncio.sleep``, so many watchers can share one loop.
+
+        Examples:
+            async for change in client.flows.watch_async(flow_ids, until="PAUSED"):
+                print(change.flow_id, change.new_status)
+        """
+        loop = asyncio.get_running_loop()
+        watch = _StatusWatch(flow_ids, until, timeout)
+        poller = AdaptivePoller(min_interval, max_interval)
+        while True:
+            context = contextvars.copy_context()
+            roots = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    context.run, self._poll_roots, watch.pending, batch_threshold
+                ),
+            )
+            transitions = watch.update(roots)
+            for transition in transitions:
+                yield transition
+            if watch.done:
+                return
+            if transitions:
+                poller.reset()
+            await asyncio.sleep(watch.sleep_time(poller.next_interval()))
+
+    def _poll_roots(
+        self, flow_ids: List[int], batch_threshold: int
+    ) -> Dict[int, Optional[FlowNode]]:
+        """
+        Fetch the current root node of each flow in one poll round.
+
+        Deleted flows map to None; flows that could not be found at all are
+        left out.
+        """
+        roots: Dict[int, Optional[FlowNode]] = {}
+        if len(flow_ids) > batch_threshold:
+            wanted = set(flow_ids)
+            for response in self.iter_pages(flows_only=True):
+                for root in response.flows:
+                    if root.id in wanted:
+                        roots[root.id] = root
+                if len(roots) == len(wanted):
+                    break
+        # Per-flow gets for small sets and for flows the listing did not include
+        missing = [flow_id for flow_id in flow_ids if flow_id not in roots]
+        for flow_id, root in zip(missing, self.client.map(self._get_root, missing)):
+            if root is not _MISSING:
+                roots[flow_id] = root
+        return roots
+
+    def _get_root(self, flow_id: int) -> Any:
+        try:
+            response = self.get(flow_id, flows_only=True)
+        except NotFoundError:
+            return None
+        for root in response.flows:
+            if root.id == flow_id:
+                return root
+        return response.flows[0] if response.flows else _MISSING
+
     def docs_recommendation(
         self, flow_id: int
     ) -> Union[DocsRecommendation, Dict[str, Any]]:
@@ -313,6 +725,201 @@ class FlowsResource(BaseResource):
         except Exception:
             return response
 
+    def iter_logs(
+        self,
+        resource_type: str,
+        resource_id: int,
+        run_id: int,
+        from_ts: int,
+        to_ts: Optional[int] = None,
+        per_page: Optional[int] = None,
+        window_seconds: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[FlowLogEntry]:
+        """Stream flow log entries across all pages.
+
+        Without ``window_seconds`` pages are fetched one after another and
+        entries are yielded as each page arrives, in API order. With
+        ``window_seconds`` the ``[from_ts, to_ts]`` range is split into
+        sub-windows of that size which are paged concurrently on the client's
+        shared pool; each window is sorted by timestamp and windows are yielded
+        in order, so the stream as a whole is in timestamp order while at most
+        ``concurrency`` windows are held in memory.
+
+        Args:
+            resource_type: Type of resource (data_sources, data_sets, data_sinks)
+            resource_id: Resource ID
+            run_id: Run ID to get logs for
+            from_ts: Start timestamp (Unix timestamp)
+            to_ts: End timestamp (Unix timestamp); defaults to now when
+                splitting into windows
+            per_page: Items per page
+            window_seconds: Split the range into windows of this many seconds
+            concurrency: Maximum windows fetched at once
+
+        Yields:
+            FlowLogEntry objects
+
+        Examples:
+            for entry in client.flows.iter_logs(
+                "data_sources", 5023, run_id, from_ts, to_ts, window_seconds=900
+            ):
+                print(entry.timestamp, entry.level, entry.message)
+        """
+        if not window_seconds:
+            for logs in self._iter_log_pages(
+                resource_type, resource_id, run_id, from_ts, to_ts, per_page
+            ):
+                yield from logs
+            return
+
+        if to_ts is None:
+            to_ts = int(time.time())
+        windows = _split_window(from_ts, to_ts, window_seconds)
+
+        def fetch_window(window: Tuple[int, int]) -> List[FlowLogEntry]:
+            entries = [
+                entry
+                for logs in self._iter_log_pages(
+                    resource_type, resource_id, run_id, window[0], window[1], per_page
+                )
+                for entry in logs
+            ]
+            entries.sort(key=_log_sort_key)
+            return entries
+
+        for entries in self.client.map(fetch_window, windows, concurrency=concurrency):
+            yield from entries
+
+    async def iter_logs_async(
+        self,
+        resource_type: str,
+        resource_id: int,
+        run_id: int,
+        from_ts: int,
+        to_ts: Optional[int] = None,
+        per_page: Optional[int] = None,
+        window_seconds: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[FlowLogEntry]:
+        """Async variant of iter_logs().
+
+        Entries are pulled from iter_logs() in chunks of ``chunk_size`` on the
+        event loop's default executor, so the loop is never blocked on HTTP.
+
+        Examples:
+            async for entry in client.flows.iter_logs_async(
+                "data_sets", 5061, run_id, from_ts, to_ts, window_seconds=900
+            ):
+                ...
+        """
+        loop = asyncio.get_running_loop()
+        entries = self.iter_logs(
+            resource_type,
+            resource_id,
+            run_id,
+            from_ts,
+            to_ts,
+            per_page=per_page,
+            window_seconds=window_seconds,
+            concurrency=concurrency,
+        )
+        context = contextvars.copy_context()
+        try:
+            while True:
+                chunk = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        context.run, list, itertools.islice(entries, chunk_size)
+                    ),
+                )
+                if not chunk:
+                    return
+                for entry in chunk:
+                    yield entry
+        finally:
+            try:
+                entries.close()
+            except ValueError:
+                # Still running in the executor after cancellation
+                pass
+
+    def export_logs_ndjson(
+        self,
+        destination: Union[str, os.PathLike, TextIO],
+        resource_type: str,
+        resource_id: int,
+        run_id: int,
+        from_ts: int,
+        to_ts: Optional[int] = None,
+        per_page: Optional[int] = None,
+        window_seconds: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> int:
+        """Write flow log entries to a file as newline-delimited JSON.
+
+        Entries are streamed from iter_logs() and written as they arrive.
+
+        Args:
+            destination: File path, or an open text file
+            (other arguments as for iter_logs())
+
+        Returns:
+            Number of entries written
+
+        Examples:
+            count = client.flows.export_logs_ndjson(
+                "run-12345.ndjson", "data_sources", 5023, 12345, from_ts, to_ts,
+                window_seconds=900,
+            )
+        """
+        entries = self.iter_logs(
+            resource_type,
+            resource_id,
+            run_id,
+            from_ts,
+            to_ts,
+            per_page=per_page,
+            window_seconds=window_seconds,
+            concurrency=concurrency,
+        )
+        if isinstance(destination, (str, os.PathLike)):
+            with open(destination, "w", encoding="utf-8") as f:
+                return _write_ndjson(f, entries)
+        return _write_ndjson(destination, entries)
+
+    def _iter_log_pages(
+        self,
+        resource_type: str,
+        resource_id: int,
+        run_id: int,
+        from_ts: int,
+        to_ts: Optional[int],
+        per_page: Optional[int],
+    ) -> Iterator[List[FlowLogEntry]]:
+        page = 1
+        while True:
+            response = self.get_logs(
+                resource_type,
+                resource_id,
+                run_id,
+                from_ts,
+                to_ts=to_ts,
+                page=page,
+                per_page=per_page,
+            )
+            if not isinstance(response, FlowLogsResponse) or not response.logs:
+                return
+            yield response.logs
+            meta = response.meta
+            if meta is not None and meta.page_count is not None:
+                if page >= meta.page_count:
+                    return
+            elif per_page is not None and len(response.logs) < per_page:
+                return
+            page += 1
+
     def get_metrics(
         self,
         resource_type: str,
@@ -358,3 +965,121 @@ class FlowsResource(BaseResource):
             return FlowMetricsApiResponse.model_validate(response)
         except Exception:
             return response
+
+
+def _page_count(responses: List[FlowResponse]) -> Optional[int]:
+    """Page count from the ``meta`` of a flows listing, if it has one."""
+    for response in responses:
+        meta = getattr(response, "meta", None)
+        if isinstance(meta, dict):
+            page_count = meta.get("pageCount") or meta.get("page_count")
+            if page_count is not None:
+                return int(page_count)
+    return None
+
+
+class _StatusWatch:
+    """Tracks flow statuses and the time budget for flows.watch()."""
+
+    def __init__(
+        self,
+        flow_ids: Union[int, Iterable[int]],
+        until: Union[str, Iterable[str]],
+        timeout: Optional[float],
+    ):
+        if isinstance(flow_ids, int):
+            flow_ids = [flow_ids]
+        if isinstance(until, str):
+            until = [until]
+        self.pending: List[int] = list(dict.fromkeys(flow_ids))
+        self.targets = {status.upper() for status in until}
+        self.statuses: Dict[int, Optional[str]] = {}
+        self.timeout = timeout
+        self.started = time.monotonic()
+        self.expires_at = self.started + timeout if timeout is not None else None
+        active = current_deadline()
+        if active is not None and (
+            self.expires_at is None or active.expires_at < self.expires_at
+        ):
+            self.expires_at = active.expires_at
+            self.timeout = active.budget
+
+    @property
+    def done(self) -> bool:
+        return not self.pending
+
+    def update(
+        self, roots: Dict[int, Optional[FlowNode]]
+    ) -> List[FlowStatusTransition]:
+        transitions = []
+        elapsed = time.monotonic() - self.started
+        deleted = set()
+        for flow_id in self.pending:
+            root = roots.get(flow_id)
+            status = root.status if root is not None else None
+            if flow_id in roots and root is None:
+                status = _DELETED
+                deleted.add(flow_id)
+            if flow_id in self.statuses and self.statuses[flow_id] == status:
+                continue
+            transitions.append(
+                FlowStatusTransition(
+                    flow_id=flow_id,
+                    old_status=self.statuses.get(flow_id),
+                    new_status=status,
+                    node=root,
+                    elapsed=elapsed,
+                )
+            )
+            self.statuses[flow_id] = status
+        self.pending = [
+            flow_id
+            for flow_id in self.pending
+            if flow_id not in deleted
+            and (self.statuses.get(flow_id) or "").upper() not in self.targets
+        ]
+        return transitions
+
+    def sleep_time(self, interval: float) -> float:
+        """Clamp a polling interval to the remaining budget, raising if spent."""
+        if self.expires_at is None:
+            return interval
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(
+                f"{len(self.pending)} flows did not reach "
+                f"{sorted(self.targets)} in time",
+                budget=self.timeout,
+                operation="watch_flows",
+                context={
+                    "pending": {
+                        flow_id: self.statuses.get(flow_id) for flow_id in self.pending
+                    }
+                },
+            )
+        return min(interval, remaining)
+
+
+def _split_window(from_ts: int, to_ts: int, size: int) -> List[Tuple[int, int]]:
+    """Split an inclusive ``[from_ts, to_ts]`` range into disjoint windows."""
+    windows = []
+    start = from_ts
+    while start <= to_ts:
+        end = min(start + size - 1, to_ts)
+        windows.append((start, end))
+        start = end + 1
+    return windows
+
+
+def _log_sort_key(entry: FlowLogEntry) -> Tuple[bool, float]:
+    timestamp = entry.timestamp
+    return (timestamp is None, timestamp.timestamp() if timestamp else 0.0)
+
+
+def _write_ndjson(f: TextIO, entries: Iterable[FlowLogEntry]) -> int:
+    count = 0
+    for entry in entries:
+        f.write(json.dumps(entry.model_dump(mode="json", exclude_none=True)))
+        f.write("\n")
+        count += 1
+    return count
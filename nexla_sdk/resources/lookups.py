@@ -1,14 +1,40 @@
 """Lookups resource implementation."""
 
-from typing import Any, Dict, List, Union
-
+import hashlib
+import json
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+from nexla_sdk.deadlines import fits_deadline
+from nexla_sdk.exceptions import (
+    NexlaError,
+    NotFoundError,
+    RateLimitError,
+    is_retryable_error,
+)
+from nexla_sdk.http_client import no_transport_retries
 from nexla_sdk.models.lookups.requests import (
     LookupCreate,
     LookupEntriesUpsert,
     LookupUpdate,
 )
-from nexla_sdk.models.lookups.responses import Lookup
+from nexla_sdk.models.lookups.responses import (
+    Lookup,
+    LookupBulkResult,
+    LookupChunkResult,
+    LookupDeleteResult,
+    LookupEntriesResult,
+    LookupSyncReport,
+)
 from nexla_sdk.resources.base_resource import BaseResource
+from nexla_sdk.utils.polling import AdaptivePoller
+
+# Keep entry-key URLs well under the ~2 KB limit common to proxies
+_MAX_KEY_PATH_BYTES = 1800
+
+# (index, first row offset, entries, serialized bytes)
+_Chunk = Tuple[int, int, List[Dict[str, Any]], int]
 
 
 class LookupsResource(BaseResource):
@@ -113,32 +139,216 @@ class LookupsResource(BaseResource):
 
         return self._make_request("PUT", path, json=request.to_dict())
 
+    def bulk_upsert(
+        self,
+        data_map_id: int,
+        entries: Iterable[Dict[str, Any]],
+        chunk_size: int = 5000,
+        max_chunk_bytes: int = 4 * 1024 * 1024,
+        concurrency: Optional[int] = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        on_progress: Optional[Callable[[LookupChunkResult], None]] = None,
+    ) -> LookupBulkResult:
+        """
+        Upsert a large stream of entries in concurrent chunks.
+
+        Entries are consumed lazily from any iterable and grouped into chunks
+        of at most ``chunk_size`` rows and ``max_chunk_bytes`` of JSON, so
+        only the chunks in flight are held in memory. Each chunk is a separate
+        ``PUT /data_maps/{id}/entries``; chunks failing with a rate limit,
+        server or connection error are retried with exponential backoff, and
+        a failed chunk does not stop the others. Each attempt is one request:
+        the HTTP client's own retries are off for these calls, and retrying
+        stops when the next wait would pass the active deadline.
+
+        Args:
+            data_map_id: Lookup ID
+            entries: Entries to upsert (list, generator, file reader, ...)
+            chunk_size: Maximum entries per request
+            max_chunk_bytes: Maximum serialized entry bytes per request
+            concurrency: Maximum chunks uploaded at once
+            retries: Extra attempts per chunk for retryable errors
+            backoff: First retry delay in seconds (doubles per attempt)
+            on_progress: Called with each chunk result as it completes
+
+        Returns:
+            LookupBulkResult with one result per chunk, in row order
+
+        Examples:
+            rows = ({"code": c, "label": l} for c, l in read_reference_table())
+            result = client.lookups.bulk_upsert(55, rows, concurrency=8)
+            if not result.ok:
+                print([(c.start, c.error) for c in result.failed])
+        """
+        if chunk_size < 1 or max_chunk_bytes < 1:
+            raise ValueError("chunk_size and max_chunk_bytes must be positive")
+        path = f"{self._path}/{data_map_id}/entries"
+
+        def upload(chunk: _Chunk) -> LookupChunkResult:
+            index, start, rows, size = chunk
+            poller = AdaptivePoller(backoff, backoff * 2 ** max(retries, 0))
+            attempts = 0
+            while True:
+                attempts += 1
+                try:
+                    # Retried below, so each attempt is a single request
+                    with no_transport_retries():
+                        self._make_request("PUT", path, json={"entries": rows})
+                    return LookupChunkResult(
+                        index=index,
+                        start=start,
+                        rows=len(rows),
+                        bytes=size,
+                        success=True,
+                        attempts=attempts,
+                    )
+                except NexlaError as e:
+                    delay = poller.next_interval()
+                    if isinstance(e, RateLimitError) and e.retry_after:
+                        delay = max(delay, float(e.retry_after))
+                    if (
+                        attempts > retries
+                        or not is_retryable_error(e)
+                        or not fits_deadline(delay)
+                    ):
+                        return LookupChunkResult(
+                            index=index,
+                            start=start,
+                            rows=len(rows),
+                            bytes=size,
+                            success=False,
+                            attempts=attempts,
+                            error=str(e),
+                            status_code=getattr(e, "status_code", None),
+                        )
+                    time.sleep(delay)
+
+        result = LookupBulkResult(data_map_id=data_map_id)
+        for chunk_result in self.client.map(
+            upload,
+            _chunk_entries(entries, chunk_size, max_chunk_bytes),
+            concurrency=concurrency,
+            ordered=False,
+        ):
+            result.chunks.append(chunk_result)
+            if on_progress is not None:
+                on_progress(chunk_result)
+        result.chunks.sort(key=lambda chunk: chunk.index)
+        return result
+
     def get_entries(
-        self, data_map_id: int, entry_keys: Union[str, List[str]]
+        self,
+        data_map_id: int,
+        entry_keys: Union[str, List[str]],
+        max_url_bytes: int = _MAX_KEY_PATH_BYTES,
+        concurrency: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get specific entries from a lookup.
 
+        A string is sent as-is (so wildcards such as ``"ABC*"`` work). A list
+        of keys is URL-encoded and split into batches whose key segment fits
+        ``max_url_bytes``. A single request returns the API response as it
+        is; several batches are fetched concurrently and their entries
+        concatenated in key order.
+
         Args:
             data_map_id: Lookup ID
             entry_keys: Single key or list of keys to retrieve
+            max_url_bytes: Byte budget for the comma-joined keys in one URL
+            concurrency: Maximum batches fetched at once
 
         Returns:
             List of matching entries
         """
-        if isinstance(entry_keys, list):
-            keys_str = ",".join(str(key) for key in entry_keys)
-        else:
-            keys_str = str(entry_keys)
+        path = f"{self._path}/{data_map_id}/entries"
+        if not isinstance(entry_keys, list):
+            return self._make_request("GET", f"{path}/{entry_keys}")
+
+        segments = [segment for _, segment in _key_batches(entry_keys, max_url_bytes)]
+        if len(segments) == 1:
+            return self._make_request("GET", f"{path}/{segments[0]}")
+        responses = self.client.map(
+            lambda segment: self._make_request("GET", f"{path}/{segment}"),
+            segments,
+            concurrency=concurrency,
+        )
+        return [entry for response in responses for entry in response or []]
+
+    def get_entries_map(
+        self,
+        data_map_id: int,
+        entry_keys: Iterable[Any],
+        key_field: Optional[str] = None,
+        max_url_bytes: int = _MAX_KEY_PATH_BYTES,
+        concurrency: Optional[int] = None,
+    ) -> LookupEntriesResult:
+        """
+        Resolve many exact keys into a key -> entry mapping.
+
+        Keys are batched as in get_entries(). Entries are matched back to
+        keys through the lookup's primary key field; keys without an entry
+        are listed in ``missing`` and keys of batches that failed in
+        ``failed``, so one bad batch does not lose the others.
 
-        path = f"/data_maps/{data_map_id}/entries/{keys_str}"
-        return self._make_request("GET", path)
+        Args:
+            data_map_id: Lookup ID
+            entry_keys: Keys to resolve (duplicates are ignored)
+            key_field: Primary key field of the entries; fetched from the
+                lookup's ``map_primary_key`` when omitted
+            max_url_bytes: Byte budget for the comma-joined keys in one URL
+            concurrency: Maximum batches fetched at once
+
+        Returns:
+            LookupEntriesResult with entries in requested key order
+
+        Examples:
+            result = client.lookups.get_entries_map(55, codes, concurrency=16)
+            labels = {code: entry["label"] for code, entry in result.entries.items()}
+        """
+        keys = list(dict.fromkeys(str(key) for key in entry_keys))
+        if key_field is None:
+            key_field = self.get(data_map_id).map_primary_key
+        path = f"{self._path}/{data_map_id}/entries"
+        batches = _key_batches(keys, max_url_bytes, wildcards=False)
+
+        def fetch(batch: Tuple[List[str], str]) -> List[Dict[str, Any]]:
+            try:
+                return self._make_request("GET", f"{path}/{batch[1]}") or []
+            except NotFoundError:
+                return []
+
+        found: Dict[str, Dict[str, Any]] = {}
+        failed: Dict[str, str] = {}
+        outcomes = self.client.map(
+            fetch, batches, concurrency=concurrency, return_exceptions=True
+        )
+        for (batch_keys, _), outcome in zip(batches, outcomes):
+            if isinstance(outcome, BaseException):
+                failed.update((key, str(outcome)) for key in batch_keys)
+                continue
+            for entry in outcome:
+                if isinstance(entry, dict) and entry.get(key_field) is not None:
+                    found[str(entry[key_field])] = entry
+
+        result = LookupEntriesResult(failed=failed)
+        for key in keys:
+            if key in found:
+                result.entries[key] = found[key]
+            elif key not in failed:
+                result.missing.append(key)
+        return result
 
     def delete_entries(
         self, data_map_id: int, entry_keys: Union[str, List[str]]
     ) -> Dict[str, Any]:
         """
-        Delete specific entries from a lookup.
+        Delete specific entries from a lookup in one request.
+
+        A string is sent as-is; a list of keys is URL-encoded and
+        comma-joined. Use delete_entries_many() for key lists too long for
+        one URL.
 
         Args:
             data_map_id: Lookup ID
@@ -148,9 +358,205 @@ class LookupsResource(BaseResource):
             Response with deletion results
         """
         if isinstance(entry_keys, list):
-            keys_str = ",".join(str(key) for key in entry_keys)
-        else:
-            keys_str = str(entry_keys)
-
-        path = f"/data_maps/{data_map_id}/entries/{keys_str}"
+            entry_keys = ",".join(_encode_key(key) for key in entry_keys)
+        path = f"{self._path}/{data_map_id}/entries/{entry_keys}"
         return self._make_request("DELETE", path)
+
+    def delete_entries_many(
+        self,
+        data_map_id: int,
+        entry_keys: Iterable[Any],
+        max_url_bytes: int = _MAX_KEY_PATH_BYTES,
+        concurrency: Optional[int] = None,
+    ) -> LookupDeleteResult:
+        """
+        Delete many exact keys in URL-sized batches.
+
+        Keys are encoded and batched as in get_entries() and the batches are
+        deleted concurrently. A failed batch is reported per key in
+        ``failed`` without stopping the others. Keys containing ``*`` or
+        ``,`` are refused and reported in ``failed``: even percent-encoded, a
+        server that decodes the path first would read them as a wildcard or
+        as several keys and delete other entries.
+
+        Args:
+            data_map_id: Lookup ID
+            entry_keys: Keys to delete (duplicates are ignored)
+            max_url_bytes: Byte budget for the comma-joined keys in one URL
+            concurrency: Maximum batches deleted at once
+
+        Returns:
+            LookupDeleteResult with the deleted keys, one response per
+            deleted batch and errors by key
+
+        Examples:
+            result = client.lookups.delete_entries_many(55, stale_codes)
+            if not result.ok:
+                print(result.failed)
+        """
+        keys = list(dict.fromkeys(str(key) for key in entry_keys))
+        result = LookupDeleteResult(data_map_id=data_map_id)
+        result.failed.update(
+            (key, "Key contains '*' or ',' and cannot be deleted by exact key")
+            for key in keys
+            if "*" in key or "," in key
+        )
+        path = f"{self._path}/{data_map_id}/entries"
+        batches = _key_batches(
+            [key for key in keys if key not in result.failed],
+            max_url_bytes,
+            wildcards=False,
+        )
+        outcomes = self.client.map(
+            lambda batch: self._make_request("DELETE", f"{path}/{batch[1]}"),
+            batches,
+            concurrency=concurrency,
+            return_exceptions=True,
+        )
+        for (batch_keys, _), outcome in zip(batches, outcomes):
+            if isinstance(outcome, BaseException):
+                result.failed.update((key, str(outcome)) for key in batch_keys)
+            else:
+                result.deleted_keys.extend(batch_keys)
+                result.responses.append(outcome)
+        return result
+
+    def sync(
+        self,
+        data_map_id: int,
+        source_rows: Iterable[Dict[str, Any]],
+        key_field: Optional[str] = None,
+        delete_missing: bool = True,
+        dry_run: bool = False,
+        chunk_size: int = 5000,
+        concurrency: Optional[int] = None,
+        max_url_bytes: int = _MAX_KEY_PATH_BYTES,
+    ) -> LookupSyncReport:
+        """
+        Make a lookup match ``source_rows`` by sending only what changed.
+
+        The current entries are fetched once and reduced to a hash per key.
+        Source rows are then streamed: rows whose key is new or whose hash
+        differs go through bulk_upsert(), unchanged rows are skipped, and
+        remote keys absent from the source are removed with batched
+        delete_entries_many() calls. Rows are compared as canonical JSON, so the
+        source should carry the same fields and value types as the lookup.
+
+        Args:
+            data_map_id: Lookup ID
+            source_rows: Desired entries (any iterable; consumed once)
+            key_field: Primary key field; fetched from the lookup's
+                ``map_primary_key`` when omitted
+            delete_missing: Remove remote entries whose key is not in the source
+            dry_run: Compute the delta without writing anything
+            chunk_size: Maximum entries per upsert request
+            concurrency: Maximum upsert chunks or delete batches in flight
+            max_url_bytes: Byte budget for keys in one delete URL
+
+        Returns:
+            LookupSyncReport with counts, keys and write results
+
+        Examples:
+            report = client.lookups.sync(55, read_reference_table(), key_field="code")
+            print(report.added, report.changed, report.removed, report.ok)
+        """
+        if key_field is None:
+            key_field = self.get(data_map_id).map_primary_key
+        remote = {
+            str(entry[key_field]): _row_hash(entry)
+            for entry in self.get_entries(data_map_id, "*") or []
+            if isinstance(entry, dict) and entry.get(key_field) is not None
+        }
+        report = LookupSyncReport(data_map_id=data_map_id, dry_run=dry_run)
+        seen = set()
+
+        def delta() -> Iterator[Dict[str, Any]]:
+            for row in source_rows:
+                if row.get(key_field) is None:
+                    report.skipped += 1
+                    continue
+                key = str(row[key_field])
+                if key in seen:
+                    continue
+                seen.add(key)
+                held = remote.get(key)
+                if held is None:
+                    report.added_keys.append(key)
+                elif held != _row_hash(row):
+                    report.changed_keys.append(key)
+                else:
+                    continue
+                yield row
+
+        if dry_run:
+            for _ in delta():
+                pass
+        else:
+            report.upsert = self.bulk_upsert(
+                data_map_id, delta(), chunk_size=chunk_size, concurrency=concurrency
+            )
+
+        if delete_missing:
+            report.removed_keys = [key for key in remote if key not in seen]
+            if report.removed_keys and not dry_run:
+                report.delete_failed = self.delete_entries_many(
+                    data_map_id, report.removed_keys, max_url_bytes, concurrency
+                ).failed
+        report.added = len(report.added_keys)
+        report.changed = len(report.changed_keys)
+        report.removed = len(report.removed_keys)
+        report.unchanged = len(seen) - report.added - report.changed
+        return report
+
+
+def _chunk_entries(
+    entries: Iterable[Dict[str, Any]], chunk_size: int, max_bytes: int
+) -> Iterator[_Chunk]:
+    """Group entries into chunks bounded by row count and serialized size."""
+    index, start, rows, size = 0, 0, [], 0
+    for entry in entries:
+        entry_size = len(json.dumps(entry, separators=(",", ":"), default=str)) + 1
+        if rows and (len(rows) >= chunk_size or size + entry_size > max_bytes):
+            yield index, start, rows, size
+            index, start, rows, size = index + 1, start + len(rows), [], 0
+        rows.append(entry)
+        size += entry_size
+    if rows:
+        yield index, start, rows, size
+
+
+def _key_batches(
+    keys: List[Any], max_bytes: int, wildcards: bool = True
+) -> List[Tuple[List[str], str]]:
+    """
+    Split keys into ``(keys, encoded comma-joined segment)`` URL batches.
+
+    Commas inside a key are always percent-encoded; ``*`` is left as a
+    wildcard unless ``wildcards`` is False.
+    """
+    batches: List[Tuple[List[str], str]] = []
+    batch: List[str] = []
+    encoded: List[str] = []
+    size = 0
+    for key in keys:
+        key = str(key)
+        part = _encode_key(key, wildcards)
+        if batch and size + 1 + len(part) > max_bytes:
+            batches.append((batch, ",".join(encoded)))
+            batch, encoded, size = [], [], 0
+        size += len(part) + (1 if batch else 0)
+        batch.append(key)
+        encoded.append(part)
+    if batch:
+        batches.append((batch, ",".join(encoded)))
+    return batches
+
+
+def _encode_key(key: Any, wildcards: bool = True) -> str:
+    """URL-encode one key, commas included, keeping ``*`` if ``wildcards``."""
+    return quote(str(key), safe="*" if wildcards else "")
+
+
+def _row_hash(row: Dict[str, Any]) -> str:
+    encoded = json.dumps(row, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
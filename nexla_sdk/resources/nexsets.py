@@ -1,13 +1,20 @@
-from typing import Any, Dict, List, Optional
+import math
+import random
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from nexla_sdk.exceptions import NexlaError
 from nexla_sdk.models.nexsets.requests import (
     NexsetCopyOptions,
     NexsetCreate,
     NexsetUpdate,
 )
-from nexla_sdk.models.nexsets.responses import Nexset, NexsetSample
+from nexla_sdk.models.nexsets.responses import Nexset, NexsetSample, NexsetSamples
 from nexla_sdk.resources.base_resource import BaseResource
 
+# Largest sample count requested in one call
+_MAX_SAMPLES_PER_REQUEST = 1000
+_SAMPLE_OUTPUTS = ("model", "raw", "columns")
+
 
 class NexsetsResource(BaseResource):
     """Resource for managing nexsets (data sets)."""
@@ -144,6 +151,191 @@ class NexsetsResource(BaseResource):
             return [NexsetSample(**item) for item in response]
         return response
 
+    def iter_samples(
+        self,
+        set_id: int,
+        count: int = 10,
+        include_metadata: bool = False,
+        live: bool = False,
+        output: str = "model",
+        batch_size: int = 500,
+        reservoir: bool = False,
+        passes: Optional[int] = None,
+        max_per_request: int = _MAX_SAMPLES_PER_REQUEST,
+        seed: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Stream sample records from a nexset without building them all up front.
+
+        Samples are converted one at a time as the iterator is consumed, and
+        at most one response is held at once. ``output="raw"`` skips model
+        construction entirely; ``output="columns"`` yields column batches
+        (field -> list of values, ``None`` where a record lacks the field)
+        for schema and quality checks.
+
+        Each request asks for at most ``max_per_request`` samples. When
+        ``count`` exceeds that, ``reservoir=True`` draws ``passes`` requests
+        of live samples (which differ between requests) and keeps a uniform
+        random sample of ``count`` records; otherwise one capped request is
+        made.
+
+        Args:
+            set_id: Nexset ID
+            count: Number of samples wanted
+            include_metadata: Include Nexla metadata
+            live: Fetch live samples from topic
+            output: "model" (NexsetSample), "raw" (dicts as returned) or
+                "columns" (dicts of column lists)
+            batch_size: Records per column batch
+            reservoir: Reservoir-sample across several requests when
+                ``count`` exceeds ``max_per_request``; requires ``live=True``
+            passes: Requests made when reservoir sampling (default: twice
+                the requests needed to fill the reservoir, so later records
+                get a chance to replace earlier ones)
+            max_per_request: Samples requested per call
+            seed: Random seed for reservoir sampling
+
+        Returns:
+            Iterator of samples or column batches
+
+        Raises:
+            ValueError: If ``output`` is unknown, or ``reservoir`` is set
+                without ``live`` (cached samples repeat between requests)
+            NexlaError: If the API returns something other than a sample list
+
+        Examples:
+            for batch in client.nexsets.iter_samples(
+                5001, count=5000, live=True, output="columns", reservoir=True
+            ):
+                null_rate = batch["email"].count(None) / len(batch["email"])
+        """
+        if output not in _SAMPLE_OUTPUTS:
+            raise ValueError("output must be 'model', 'raw' or 'columns'")
+        if reservoir and not live:
+            raise ValueError(
+                "reservoir sampling requires live=True; cached samples repeat "
+                "between requests"
+            )
+        per_request = max(1, min(count, max_per_request))
+
+        if reservoir and count > per_request:
+            records = self._reservoir_samples(
+                set_id,
+                count,
+                per_request,
+                passes or 2 * math.ceil(count / per_request),
+                include_metadata,
+                live,
+                random.Random(seed),
+            )
+        else:
+            records = iter(
+                self._fetch_samples(set_id, per_request, include_metadata, live)[:count]
+            )
+
+        if output == "raw":
+            return records
+        if output == "model":
+            return (NexsetSample.model_validate(item) for item in records)
+        return _column_batches(records, batch_size)
+
+    def sample_many(
+        self,
+        set_ids: Iterable[int],
+        count: int = 10,
+        output: str = "raw",
+        concurrency: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[NexsetSamples]:
+        """
+        Sample many nexsets concurrently.
+
+        Results stream back as each nexset finishes; a failure is reported
+        in its NexsetSamples instead of stopping the rest.
+
+        Args:
+            set_ids: Nexset IDs
+            count: Samples per nexset
+            output: Sample format, as for iter_samples()
+            concurrency: Maximum nexsets sampled at once
+            **kwargs: Further iter_samples() options
+
+        Returns:
+            Iterator of NexsetSamples, in completion order
+
+        Examples:
+            for result in client.nexsets.sample_many(set_ids, count=200):
+                if result.success:
+                    check_schema(result.set_id, result.samples)
+        """
+
+        def run(set_id: int) -> NexsetSamples:
+            try:
+                samples = list(
+                    self.iter_samples(set_id, count=count, output=output, **kwargs)
+                )
+            except Exception as e:
+                return NexsetSamples(
+                    set_id=set_id,
+                    success=False,
+                    error=str(e),
+                    status_code=getattr(e, "status_code", None),
+                )
+            rows = (
+                sum(len(next(iter(batch.values()), [])) for batch in samples)
+                if output == "columns"
+                else len(samples)
+            )
+            return NexsetSamples(set_id=set_id, samples=samples, rows=rows)
+
+        return self.client.map(
+            run, list(set_ids), concurrency=concurrency, ordered=False
+        )
+
+    def _fetch_samples(
+        self, set_id: int, count: int, include_metadata: bool, live: bool
+    ) -> List[Any]:
+        path = f"{self._path}/{set_id}/samples"
+        params = {"count": count, "include_metadata": include_metadata, "live": live}
+        response = self._make_request("GET", path, params=params)
+        if response is None:
+            return []
+        if not isinstance(response, list):
+            raise NexlaError(
+                "Unexpected samples response: expected a list of records",
+                operation="get_samples",
+                resource_type="data_set",
+                resource_id=str(set_id),
+                response=response if isinstance(response, dict) else None,
+            )
+        return response
+
+    def _reservoir_samples(
+        self,
+        set_id: int,
+        count: int,
+        per_request: int,
+        passes: int,
+        include_metadata: bool,
+        live: bool,
+        rng: random.Random,
+    ) -> Iterator[Any]:
+        """Uniform sample of ``count`` records over several requests (Algorithm R)."""
+        kept: List[Any] = []
+        seen = 0
+        for _ in range(passes):
+            for item in self._fetch_samples(
+                set_id, per_request, include_metadata, live
+            ):
+                seen += 1
+                if len(kept) < count:
+                    kept.append(item)
+                else:
+                    slot = rng.randrange(seen)
+                    if slot < count:
+                        kept[slot] = item
+        return iter(kept)
+
     def copy(self, set_id: int, options: Optional[NexsetCopyOptions] = None) -> Nexset:
         """
         Copy a nexset.
@@ -162,3 +354,26 @@ class NexsetsResource(BaseResource):
         """Generate AI suggestion for Nexset documentation."""
         path = f"{self._path}/{set_id}/docs/recommendation"
         return self._make_request("POST", path)
+
+
+def _column_batches(
+    records: Iterator[Any], batch_size: int
+) -> Iterator[Dict[str, List[Any]]]:
+    """Pivot sample records into column batches of ``batch_size`` rows."""
+    batch: List[Dict[str, Any]] = []
+    for item in records:
+        if isinstance(item, dict) and "rawMessage" in item:
+            item = item["rawMessage"]
+        batch.append(item if isinstance(item, dict) else {"value": item})
+        if len(batch) >= batch_size:
+            yield _to_columns(batch)
+            batch = []
+    if batch:
+        yield _to_columns(batch)
+
+
+def _to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    fields: Dict[str, None] = {}
+    for row in rows:
+        fields.update(dict.fromkeys(row))
+    return {field: [row.get(field) for row in rows] for field in fields}
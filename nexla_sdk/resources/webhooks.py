@@ -1,11 +1,35 @@
 """Resource for sending data to Nexla webhooks."""
 
 import base64
-from typing import Any, Dict, List, Optional
-
-from nexla_sdk.exceptions import NexlaError
+import re
+import time
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from nexla_sdk.deadlines import fits_deadline
+from nexla_sdk.exceptions import NexlaError, is_retryable_error
 from nexla_sdk.models.webhooks.requests import WebhookSendOptions
 from nexla_sdk.models.webhooks.responses import WebhookResponse
+from nexla_sdk.utils.polling import AdaptivePoller
+from nexla_sdk.utils.webhook_async import AsyncWebhookSender
+from nexla_sdk.utils.webhook_producer import WebhookProducer
+
+RawPayload = Union[bytes, bytearray, memoryview, IO[bytes], Iterable[bytes]]
+
+# Chunk size when streaming raw payloads from files or memoryviews
+_STREAM_CHUNK_BYTES = 64 * 1024
+# One NDJSON line: anything up to a newline that is not only whitespace
+_NDJSON_LINE = re.compile(rb"[ \t]*[^\s][^\r\n]*")
 
 
 class WebhooksResource:
@@ -48,6 +72,9 @@ class WebhooksResource:
         """
         self.api_key = api_key
         self._http_client = http_client
+        self._custom_http_client = http_client is not None
+        self._stream_http_client = None
+        self._encoded_key: Optional[Tuple[str, str]] = None
 
     def _get_http_client(self):
         """Get or create HTTP client."""
@@ -59,38 +86,46 @@ class WebhooksResource:
         self._http_client = RequestsHttpClient()
         return self._http_client
 
-    def _make_request(
-        self,
-        method: str,
-        url: str,
-        json: Any = None,
-        options: Optional[WebhookSendOptions] = None,
-        auth_method: str = "query",
-    ) -> Dict[str, Any]:
-        """Make authenticated request to webhook.
+    def _get_stream_http_client(self):
+        """HTTP client for streamed bodies, which a transport retry would
+        resend empty: a RequestsHttpClient is paired with a non-retrying one,
+        other clients are used as they are."""
+        from nexla_sdk.http_client import RequestsHttpClient
+
+        http_client = self._get_http_client()
+        if not isinstance(http_client, RequestsHttpClient):
+            return http_client
+        if self._stream_http_client is None:
+            self._stream_http_client = RequestsHttpClient(
+                timeout=http_client.timeout,
+                max_retries=0,
+                pool_maxsize=http_client.pool_maxsize,
+            )
+        return self._stream_http_client
+
+    def _auth_material(
+        self, options: Optional[WebhookSendOptions] = None, auth_method: str = "query"
+    ) -> Tuple[Dict[str, str], Optional[Dict[str, str]]]:
+        """Build request headers and query parameters for a send.
+
+        The Basic auth header is encoded once per API key and reused.
 
         Args:
-            method: HTTP method
-            url: Full webhook URL
-            json: JSON body to send
             options: Webhook send options
             auth_method: Authentication method ("query" or "header")
 
         Returns:
-            Response data as dictionary
-
-        Raises:
-            NexlaError: If request fails
+            Tuple of (headers, params); params is None when empty
         """
         headers = {"Content-Type": "application/json"}
+        params: Dict[str, str] = {}
 
-        params = {}
-
-        # Add authentication
         if auth_method == "header":
             # Basic auth with API key
-            encoded_key = base64.b64encode(self.api_key.encode()).decode()
-            headers["Authorization"] = f"Basic {encoded_key}"
+            if self._encoded_key is None or self._encoded_key[0] != self.api_key:
+                encoded = base64.b64encode(self.api_key.encode()).decode()
+                self._encoded_key = (self.api_key, encoded)
+            headers["Authorization"] = f"Basic {self._encoded_key[1]}"
         else:
             # Query parameter auth
             params["api_key"] = self.api_key
@@ -104,15 +139,47 @@ class WebhooksResource:
             if options.force_schema_detection:
                 params["force_schema_detection"] = "true"
 
-        http_client = self._get_http_client()
+        return headers, params or None
+
+    def _make_request(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        options: Optional[WebhookSendOptions] = None,
+        auth_method: str = "query",
+        data: Any = None,
+        http_client=None,
+    ) -> Dict[str, Any]:
+        """Make authenticated request to webhook.
+
+        Args:
+            method: HTTP method
+            url: Full webhook URL
+            json: JSON body to send
+            options: Webhook send options
+            auth_method: Authentication method ("query" or "header")
+            data: Pre-encoded body (bytes, file or iterable of chunks) sent
+                instead of ``json``
+            http_client: Client to send with instead of the default one
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            NexlaError: If request fails
+        """
+        headers, params = self._auth_material(options, auth_method)
+        http_client = http_client or self._get_http_client()
+        body = {"json": json} if data is None else {"data": data}
 
         try:
             response = http_client.request(
                 method=method,
                 url=url,
                 headers=headers,
-                params=params if params else None,
-                json=json,
+                params=params,
+                **body,
             )
             return response
         except Exception as e:
@@ -215,3 +282,204 @@ class WebhooksResource:
             auth_method=auth_method,
         )
         return WebhookResponse.model_validate(response)
+
+    def send_raw_records(
+        self,
+        webhook_url: str,
+        payload: RawPayload,
+        format: str = "json",
+        options: Optional[WebhookSendOptions] = None,
+        auth_method: str = "query",
+        retries: int = 3,
+        backoff: float = 0.5,
+    ) -> WebhookResponse:
+        """Send records that are already JSON-encoded, without decoding them.
+
+        ``format="json"`` sends a JSON array as-is. Bytes and bytearrays go
+        to the socket without a copy, memoryviews and files are streamed in
+        chunks, and an iterable is sent as the successive chunks of the
+        array, using chunked transfer encoding.
+
+        ``format="ndjson"`` takes one JSON document per line, or one per
+        item when ``payload`` is an iterable such as Kafka message values.
+        The documents are framed into a JSON array as the body streams out.
+        Nothing is parsed or re-encoded; each document is copied once, into
+        a 64 KiB transfer chunk.
+
+        A streamed body is used up by the request that sends it, so rate
+        limits, 5xx responses and connection errors are retried here, with
+        the body rebuilt for each attempt: memoryviews are re-chunked and
+        seekable files rewound. One-shot iterables and unseekable files are
+        sent once and never retried.
+
+        Args:
+            webhook_url: Full URL of the Nexla webhook endpoint.
+            payload: bytes, bytearray, memoryview, binary file object, or
+                iterable of bytes.
+            format: "json" or "ndjson".
+            options: Optional send options.
+            auth_method: Authentication method ("query" or "header").
+            retries: Extra attempts for payloads that can be sent again.
+            backoff: First retry delay in seconds (doubles per attempt).
+
+        Returns:
+            WebhookResponse with dataset_id and processed count.
+
+        Raises:
+            ValueError: If the format is unknown.
+            NexlaError: If the request fails.
+
+        Examples:
+            # Kafka message values, each one encoded JSON record
+            values = (message.value() for message in consumer.consume(500))
+            webhooks.send_raw_records(webhook_url, values, format="ndjson")
+
+            # Stream a large NDJSON export straight from disk
+            with open("events.ndjson", "rb") as f:
+                webhooks.send_raw_records(webhook_url, f, format="ndjson")
+        """
+        if format not in ("json", "ndjson"):
+            raise ValueError("format must be 'json' or 'ndjson'")
+        if format == "json" and isinstance(payload, (bytes, bytearray)):
+            # Resent intact by the HTTP client's own retries
+            response = self._make_request(
+                method="POST",
+                url=webhook_url,
+                data=payload,
+                options=options,
+                auth_method=auth_method,
+            )
+            return WebhookResponse.model_validate(response)
+
+        make_body, replayable = _raw_body_factory(payload, format)
+        http_client = self._get_stream_http_client()
+        retries_left = retries if replayable else 0
+        poller = AdaptivePoller(backoff, backoff * 2 ** max(retries, 0))
+        while True:
+            try:
+                response = self._make_request(
+                    method="POST",
+                    url=webhook_url,
+                    data=make_body(),
+                    options=options,
+                    auth_method=auth_method,
+                    http_client=http_client,
+                )
+                return WebhookResponse.model_validate(response)
+            except NexlaError as e:
+                delay = poller.next_interval()
+                if (
+                    retries_left <= 0
+                    or not is_retryable_error(e)
+                    or not fits_deadline(delay)
+                ):
+                    raise
+                retries_left -= 1
+                time.sleep(delay)
+
+    def producer(self, **kwargs: Any) -> WebhookProducer:
+        """Create a buffered background producer that batches records.
+
+        Args:
+            **kwargs: WebhookProducer settings (batch_size, max_batch_bytes,
+                linger, max_buffered_records, max_block, workers, retries,
+                options, auth_method, on_delivery, spool).
+
+        Returns:
+            A started WebhookProducer; close it (or use it as a context
+            manager) to flush remaining records.
+
+        Examples:
+            with webhooks.producer(batch_size=1000, linger=0.1) as producer:
+                for event in events:
+                    producer.send("https://api.nexla.com/webhook/abc123", event)
+        """
+        return WebhookProducer(self, **kwargs)
+
+    def async_sender(self, **kwargs: Any) -> AsyncWebhookSender:
+        """Create an asyncio sender that multiplexes batches over pooled connections.
+
+        Args:
+            **kwargs: AsyncWebhookSender settings (max_connections,
+                per_url_concurrency, timeout, retries, backoff, options,
+                auth_method).
+
+        Returns:
+            An AsyncWebhookSender; close it (or use it as an async context
+            manager) to release its connections.
+
+        Examples:
+            async with webhooks.async_sender(per_url_concurrency=32) as sender:
+                delivery = await sender.send_many_records(webhook_url, records)
+                print(delivery.latency)
+        """
+        return AsyncWebhookSender(self, **kwargs)
+
+
+def _memoryview_chunks(view: memoryview) -> Iterator[memoryview]:
+    view = view.cast("B")
+    for start in range(0, len(view), _STREAM_CHUNK_BYTES):
+        yield view[start : start + _STREAM_CHUNK_BYTES]
+
+
+def _raw_json_body(payload: RawPayload) -> Any:
+    """Body for a pre-encoded JSON array, copying nothing."""
+    if isinstance(payload, (bytes, bytearray)):
+        return payload
+    if isinstance(payload, memoryview):
+        return _memoryview_chunks(payload)
+    # Files and iterables of chunks are streamed by the HTTP client
+    return payload
+
+
+def _raw_body_factory(
+    payload: RawPayload, format: str
+) -> Tuple[Callable[[], Any], bool]:
+    """Return a body builder and whether it may be called again for a retry."""
+    frame = _raw_json_body if format == "json" else _ndjson_array_chunks
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return (lambda: frame(payload)), True
+    seekable = getattr(payload, "seekable", None)
+    if hasattr(payload, "read") and seekable is not None and seekable():
+        start = payload.tell()
+
+        def rewound() -> Any:
+            payload.seek(start)
+            return frame(payload)
+
+        return rewound, True
+    return (lambda: frame(payload)), False
+
+
+def _ndjson_documents(payload: RawPayload) -> Iterator[Any]:
+    """Yield each NDJSON document as a bytes-like object."""
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        view = memoryview(payload).cast("B")
+        for match in _NDJSON_LINE.finditer(view):
+            yield view[match.start() : match.end()]
+    elif hasattr(payload, "read"):
+        for line in payload:
+            line = line.strip()
+            if line:
+                yield line
+    else:
+        for item in payload:
+            item = item.rstrip(b"\r\n") if isinstance(item, bytes) else item
+            if len(item):
+                yield item
+
+
+def _ndjson_array_chunks(payload: RawPayload) -> Iterator[bytearray]:
+    """Frame NDJSON documents as a JSON array, in transfer-sized chunks."""
+    chunk = bytearray(b"[")
+    first = True
+    for document in _ndjson_documents(payload):
+        if not first:
+            chunk += b","
+        chunk += document
+        first = False
+        if len(chunk) >= _STREAM_CHUNK_BYTES:
+            yield chunk
+            chunk = bytearray()
+    chunk += b"]"
+    yield chunk
@@ -0,0 +1,377 @@
+"""
+Fleet-wide run health analytics.
+
+``FleetHealth`` fetches recent run summaries for many resources concurrently,
+stores them as flat columns (one row per run, segmented per resource) and
+derives per-resource health features in bulk: error rate, staleness,
+throughput drop and a z-score of the latest run against the runs before it.
+Resources breaking any threshold are returned ranked by severity.
+
+NumPy is used for the column math when installed (``pip install
+"nexla-sdk[metrics]"``); otherwise the same features are computed in Python.
+"""
+
+import datetime as dt
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import Field
+
+from nexla_sdk.models.base import BaseModel
+
+# Guard against missing NumPy installation
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+
+    _numpy_available = True
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+    _numpy_available = False
+
+ResourceKey = Tuple[str, int]
+
+
+class ResourceHealth(BaseModel):
+    """Health features and issues for one resource."""
+
+    resource_type: str
+    resource_id: int
+    runs: int = 0
+    error_rate: float = 0.0
+    staleness_hours: Optional[float] = None
+    throughput_drop: float = 0.0
+    z_score: float = 0.0
+    score: float = 0.0
+    issues: List[str] = Field(default_factory=list)
+
+    @property
+    def healthy(self) -> bool:
+        """Whether no threshold was broken."""
+        return not self.issues
+
+
+class FleetHealthReport(BaseModel):
+    """Result of a fleet health sweep."""
+
+    resources: List[ResourceHealth] = Field(default_factory=list)
+    unhealthy: List[ResourceHealth] = Field(default_factory=list)
+    errors: Dict[str, str] = Field(default_factory=dict)
+    checked_at: float = 0.0
+
+
+class RunColumns:
+    """
+    Run summaries for many resources as flat columns.
+
+    Rows are grouped per resource, newest run last; ``offsets[i]`` is the
+    first row of resource ``keys[i]`` and ``offsets[-1]`` the row count.
+    """
+
+    def __init__(self) -> None:
+        self.keys: List[ResourceKey] = []
+        self.offsets: List[int] = [0]
+        self.records: List[float] = []
+        self.errors: List[float] = []
+        self.written: List[float] = []
+
+    def add(self, key: ResourceKey, runs: Iterable[Dict[str, Any]]) -> None:
+        """Append one resource's runs (any order; sorted by lastWritten here)."""
+        rows = []
+        for run in runs:
+            written = _last_written(run)
+            rows.append(
+                (
+                    written if written is not None else -math.inf,
+                    float(run.get("records") or 0),
+                    float(run.get("errors") or 0),
+                )
+            )
+        rows.sort(key=lambda row: row[0])
+        self.keys.append(key)
+        for written, records, errors in rows:
+            self.written.append(written)
+            self.records.append(records)
+            self.errors.append(errors)
+        self.offsets.append(len(self.records))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class FleetHealth:
+    """
+    Concurrent health sweep over many resources.
+
+    Args:
+        client: NexlaClient used for API calls
+        runs: Most recent runs considered per resource
+        error_rate_threshold: Errors per record above which a resource is flagged
+        stale_hours: Hours without a run after which a resource is flagged
+        drop_threshold: Fractional drop of the latest run's records below the
+            median of earlier runs that is flagged (0.5 = half)
+        z_threshold: Absolute z-score of the latest run's records that is flagged
+        concurrency: Maximum requests in flight
+
+    Examples:
+        health = FleetHealth(client, concurrency=32)
+        report = health.check([("data_sources", 5023), ("data_sinks", 5029)])
+        for resource in report.unhealthy[:20]:
+            print(resource.resource_id, resource.score, resource.issues)
+    """
+
+    def __init__(
+        self,
+        client,
+        runs: int = 20,
+        error_rate_threshold: float = 0.2,
+        stale_hours: float = 24.0,
+        drop_threshold: float = 0.5,
+        z_threshold: float = 3.0,
+        concurrency: Optional[int] = None,
+    ):
+        self.client = client
+        self.runs = runs
+        self.error_rate_threshold = error_rate_threshold
+        self.stale_hours = stale_hours
+        self.drop_threshold = drop_threshold
+        self.z_threshold = z_threshold
+        self.concurrency = concurrency
+
+    def fetch(
+        self, resources: Iterable[ResourceKey]
+    ) -> Tuple[RunColumns, Dict[ResourceKey, BaseException]]:
+        """
+        Fetch recent run summaries for every resource concurrently.
+
+        The API does not promise a sort direction for ``orderby=lastWritten``.
+        When the first page comes back oldest first and there are more pages,
+        pages are read from the last one backwards instead; either way the
+        runs are sorted here before the most recent ``runs`` are kept.
+        """
+        resources = list(dict.fromkeys(resources))
+
+        def fetch_page(
+            key: ResourceKey, page: int
+        ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+            response = self.client.metrics.get_resource_metrics_by_run(
+                key[0],
+                key[1],
+                groupby="runId",
+                orderby="lastWritten",
+                page=page,
+                size=self.runs,
+            )
+            data = response.metrics.get("data") or []
+            meta = response.metrics.get("meta") or {}
+            page_count = meta.get("pageCount") or meta.get("page_count")
+            return [row for row in data if isinstance(row, dict)], page_count
+
+        def fetch_runs(key: ResourceKey) -> List[Dict[str, Any]]:
+            rows, page_count = fetch_page(key, 1)
+            written = [w for w in map(_last_written, rows) if w is not None]
+            oldest_first = len(written) > 1 and written == sorted(written)
+            if oldest_first and page_count and page_count > 1:
+                first_page, rows = rows, []
+                page = page_count
+                while page > 1 and len(rows) < self.runs:
+                    rows = fetch_page(key, page)[0] + rows
+                    page -= 1
+                if len(rows) < self.runs:
+                    rows = first_page + rows
+            rows.sort(key=_recency, reverse=True)
+            return rows[: self.runs]
+
+        columns = RunColumns()
+        failed: Dict[ResourceKey, BaseException] = {}
+        outcomes = self.client.map(
+            fetch_runs, resources, concurrency=self.concurrency, return_exceptions=True
+        )
+        for key, outcome in zip(resources, outcomes):
+            if isinstance(outcome, BaseException):
+                failed[key] = outcome
+            else:
+                columns.add(key, outcome)
+        return columns, failed
+
+    def check(
+        self, resources: Iterable[ResourceKey], now: Optional[float] = None
+    ) -> FleetHealthReport:
+        """Fetch run summaries and evaluate every resource."""
+        columns, failed = self.fetch(resources)
+        report = self.evaluate(columns, now=now)
+        report.errors = {f"{key[0]}/{key[1]}": str(e) for key, e in failed.items()}
+        return report
+
+    def evaluate(
+        self, columns: RunColumns, now: Optional[float] = None
+    ) -> FleetHealthReport:
+        """Compute health features for already-fetched run columns."""
+        now = time.time() if now is None else now
+        features = _features(columns, now)
+        resources = []
+        for i, (resource_type, resource_id) in enumerate(columns.keys):
+            runs, error_rate, staleness, drop, z_score = (
+                column[i] for column in features
+            )
+            issues = []
+            score = 0.0
+            if runs == 0:
+                issues.append("No run history found")
+                score += 1.0
+            if error_rate > self.error_rate_threshold:
+                issues.append(f"High error rate: {error_rate:.1%}")
+                score += error_rate / self.error_rate_threshold
+            if staleness is not None and staleness > self.stale_hours:
+                issues.append(f"Stale: no run in {staleness:.1f} hours")
+                score += staleness / self.stale_hours
+            if drop > self.drop_threshold:
+                issues.append(f"Throughput drop: {drop:.0%} below median")
+                score += drop / self.drop_threshold
+            if abs(z_score) > self.z_threshold:
+                issues.append(f"Anomalous latest run: z={z_score:.1f}")
+                score += abs(z_score) / self.z_threshold
+            resources.append(
+                ResourceHealth(
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                    runs=runs,
+                    error_rate=error_rate,
+                    staleness_hours=staleness,
+                    throughput_drop=drop,
+                    z_score=z_score,
+                    score=score,
+                    issues=issues,
+                )
+            )
+        unhealthy = sorted(
+            (r for r in resources if r.issues), key=lambda r: r.score, reverse=True
+        )
+        return FleetHealthReport(
+            resources=resources, unhealthy=unhealthy, checked_at=now
+        )
+
+
+def _features(columns: RunColumns, now: float) -> Tuple[List, ...]:
+    """Per-resource (runs, error_rate, staleness_hours, drop, z_score) columns."""
+    if _numpy_available and len(columns):
+        return _features_numpy(columns, now)
+    return _features_python(columns, now)
+
+
+def _features_numpy(columns: RunColumns, now: float) -> Tuple[List, ...]:
+    offsets = np.asarray(columns.offsets)
+    counts = np.diff(offsets)
+    records = np.asarray(columns.records, dtype=float)
+    errors = np.asarray(columns.errors, dtype=float)
+    written = np.asarray(columns.written, dtype=float)
+    has_runs = counts > 0
+    starts = offsets[:-1][has_runs]
+
+    total_records = np.zeros(len(counts))
+    total_errors = np.zeros(len(counts))
+    newest = np.full(len(counts), -np.inf)
+    if len(records):
+        total_records[has_runs] = np.add.reduceat(records, starts)
+        total_errors[has_runs] = np.add.reduceat(errors, starts)
+        newest[has_runs] = np.maximum.reduceat(written, starts)
+    error_rate = np.divide(
+        total_errors,
+        total_records,
+        out=np.zeros(len(counts)),
+        where=total_records > 0,
+    )
+    staleness = np.where(np.isfinite(newest), (now - newest) / 3600.0, np.nan)
+
+    # Latest run versus the runs before it; ragged segments are padded with NaN
+    width = int(counts.max()) if len(counts) else 0
+    padded = np.full((len(counts), max(width, 1)), np.nan)
+    rows = np.repeat(np.arange(len(counts)), counts)
+    cols = np.arange(len(records)) - np.repeat(offsets[:-1], counts)
+    padded[rows, cols] = records
+    latest_idx = np.maximum(counts - 1, 0)
+    latest = padded[np.arange(len(counts)), latest_idx]
+    previous = padded.copy()
+    previous[np.arange(len(counts)), latest_idx] = np.nan
+    # Only resources with at least two earlier runs get drop/z-score features
+    enough = counts >= 3
+    drop = np.zeros(len(counts))
+    z_score = np.zeros(len(counts))
+    if enough.any():
+        earlier, last = previous[enough], latest[enough]
+        median = np.nanmedian(earlier, axis=1)
+        mean = np.nanmean(earlier, axis=1)
+        std = np.nanstd(earlier, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drop[enough] = np.where(median > 0, 1.0 - last / median, 0.0)
+            z_score[enough] = np.where(std > 0, (last - mean) / std, 0.0)
+    drop = np.clip(drop, 0.0, None)
+
+    return (
+        counts.tolist(),
+        error_rate.tolist(),
+        [None if math.isnan(s) else s for s in staleness.tolist()],
+        drop.tolist(),
+        z_score.tolist(),
+    )
+
+
+def _features_python(columns: RunColumns, now: float) -> Tuple[List, ...]:
+    runs, error_rates, staleness, drops, z_scores = [], [], [], [], []
+    for i in range(len(columns)):
+        start, end = columns.offsets[i], columns.offsets[i + 1]
+        records = columns.records[start:end]
+        errors = columns.errors[start:end]
+        written = [w for w in columns.written[start:end] if math.isfinite(w)]
+        total = sum(records)
+        runs.append(end - start)
+        error_rates.append(sum(errors) / total if total else 0.0)
+        staleness.append((now - max(written)) / 3600.0 if written else None)
+        drop, z_score = 0.0, 0.0
+        if len(records) >= 3:
+            latest, previous = records[-1], records[:-1]
+            median = _median(previous)
+            mean = sum(previous) / len(previous)
+            std = math.sqrt(sum((r - mean) ** 2 for r in previous) / len(previous))
+            if median > 0:
+                drop = max(0.0, 1.0 - latest / median)
+            if std > 0:
+                z_score = (latest - mean) / std
+        drops.append(drop)
+        z_scores.append(z_score)
+    return runs, error_rates, staleness, drops, z_scores
+
+
+def _median(values: Sequence[float]) -> float:
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2.0
+
+
+def _last_written(run: Dict[str, Any]) -> Optional[float]:
+    return _epoch_seconds(run.get("lastWritten", run.get("last_written")))
+
+
+def _recency(run: Dict[str, Any]) -> float:
+    written = _last_written(run)
+    return -math.inf if written is None else written
+
+
+def _epoch_seconds(value: Any) -> Optional[float]:
+    """Normalize a lastWritten value (epoch s/ms or ISO string) to epoch seconds."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000.0 if value > 1e11 else float(value)
+    if isinstance(value, dt.datetime):
+        parsed = value
+    else:
+        try:
+            parsed = dt.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+    return parsed.timestamp()
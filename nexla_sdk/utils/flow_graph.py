@@ -0,0 +1,335 @@
+"""In-memory index over flow trees returned by the flows API."""
+
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from nexla_sdk.models.common import FlowNode
+from nexla_sdk.models.destinations.responses import Destination
+from nexla_sdk.models.flows.responses import FlowResponse
+from nexla_sdk.models.nexsets.responses import Nexset
+from nexla_sdk.models.sources.responses import Source
+
+
+class FlowGraph:
+    """
+    Indexed view of one or more FlowResponse trees.
+
+    ``FlowResponse.flows`` is a recursive tree of FlowNode objects, with the
+    sources, nexsets and sinks it references in separate flat lists. FlowGraph
+    flattens those trees once and keeps dictionary indexes so that node,
+    resource, project and status lookups are O(1) and ancestor/descendant
+    sets are precomputed per node.
+
+    Flows are indexed independently (keyed by their origin node), so a single
+    flow can be replaced or removed without rebuilding the rest of the graph.
+
+    Examples:
+        graph = FlowGraph(client.flows.list())
+
+        node = graph.node_for_source(42)
+        sinks = graph.downstream_sinks(data_set_id=1001)
+        destinations = [graph.destination(n.data_sink_id) for n in sinks]
+        active = graph.nodes_with_status("ACTIVE")
+    """
+
+    def __init__(self, responses: Iterable[FlowResponse] = ()):
+        self._nodes: Dict[int, FlowNode] = {}
+        self._parent: Dict[int, Optional[int]] = {}
+        self._children: Dict[int, Tuple[int, ...]] = {}
+        self._origin: Dict[int, int] = {}
+        self._flow_nodes: Dict[int, Tuple[int, ...]] = {}
+        self._ancestors: Dict[int, Tuple[int, ...]] = {}
+        self._descendants: Dict[int, FrozenSet[int]] = {}
+
+        self._by_source: Dict[int, int] = {}
+        self._by_data_set: Dict[int, int] = {}
+        self._by_sink: Dict[int, int] = {}
+        self._by_project: Dict[int, Set[int]] = {}
+        self._by_status: Dict[str, Set[int]] = {}
+
+        self._sources: Dict[int, Source] = {}
+        self._nexsets: Dict[int, Nexset] = {}
+        self._destinations: Dict[int, Destination] = {}
+
+        for response in responses:
+            self.add_response(response)
+
+    # Building
+
+    def add_response(self, response: FlowResponse) -> None:
+        """Index every flow and resource element in a FlowResponse."""
+        for source in response.data_sources or []:
+            self._sources[source.id] = source
+        for nexset in response.data_sets or []:
+            self._nexsets[nexset.id] = nexset
+        for destination in response.data_sinks or []:
+            self._destinations[destination.id] = destination
+        for root in response.flows:
+            self.add_flow(root)
+
+    def add_flow(self, root: FlowNode) -> None:
+        """Index a single flow tree, replacing any flow with the same origin."""
+        origin_id = root.origin_node_id or root.id
+        self.remove_flow(origin_id)
+
+        members: List[int] = []
+        stack: List[Tuple[FlowNode, Optional[int], Tuple[int, ...]]] = [
+            (root, None, ())
+        ]
+        while stack:
+            node, parent_id, ancestors = stack.pop()
+            previous_origin = self._origin.get(node.id)
+            if previous_origin is not None and previous_origin != origin_id:
+                # The node moved here from another flow
+                self._detach(node.id, previous_origin)
+            members.append(node.id)
+            self._nodes[node.id] = node
+            self._parent[node.id] = parent_id
+            self._origin[node.id] = origin_id
+            self._ancestors[node.id] = ancestors
+            children = node.children or []
+            self._children[node.id] = tuple(child.id for child in children)
+            self._index_node(node)
+            child_ancestors = ancestors + (node.id,)
+            for child in reversed(children):
+                stack.append((child, node.id, child_ancestors))
+
+        # Members are in pre-order, so walking them backwards visits every
+        # child before its parent and lets descendant sets be built bottom-up.
+        for node_id in reversed(members):
+            descendants: Set[int] = set()
+            for child_id in self._children[node_id]:
+                descendants.add(child_id)
+                descendants.update(self._descendants[child_id])
+            self._descendants[node_id] = frozenset(descendants)
+
+        self._flow_nodes[origin_id] = tuple(members)
+
+    def remove_flow(self, origin_node_id: int) -> List[FlowNode]:
+        """
+        Drop a flow tree from the index and return its removed nodes.
+
+        Nodes that have since moved to another flow are left in place.
+        """
+        removed = []
+        for node_id in self._flow_nodes.pop(origin_node_id, ()):
+            if self._origin.get(node_id) != origin_node_id:
+                continue
+            node = self._nodes.pop(node_id)
+            self._unindex_node(node)
+            for index in (
+                self._parent,
+                self._children,
+                self._origin,
+                self._ancestors,
+                self._descendants,
+            ):
+                index.pop(node_id, None)
+            removed.append(node)
+        return removed
+
+    def _detach(self, node_id: int, origin_node_id: int) -> None:
+        """Take a node out of the flow it used to belong to."""
+        self._unindex_node(self._nodes[node_id])
+        self._flow_nodes[origin_node_id] = tuple(
+            member
+            for member in self._flow_nodes.get(origin_node_id, ())
+            if member != node_id
+        )
+        parent_id = self._parent.get(node_id)
+        if parent_id is not None and parent_id in self._children:
+            self._children[parent_id] = tuple(
+                child for child in self._children[parent_id] if child != node_id
+            )
+        for ancestor_id in self._ancestors.get(node_id, ()):
+            if ancestor_id in self._descendants:
+                self._descendants[ancestor_id] = self._descendants[ancestor_id] - {
+                    node_id
+                }
+
+    def _index_node(self, node: FlowNode) -> None:
+        if node.data_source_id is not None:
+            self._by_source[node.data_source_id] = node.id
+        if node.data_set_id is not None:
+            self._by_data_set[node.data_set_id] = node.id
+        if node.data_sink_id is not None:
+            self._by_sink[node.data_sink_id] = node.id
+        if node.project_id is not None:
+            self._by_project.setdefault(node.project_id, set()).add(node.id)
+        if node.status is not None:
+            self._by_status.setdefault(node.status, set()).add(node.id)
+
+    def _unindex_node(self, node: FlowNode) -> None:
+        for index, key in (
+            (self._by_source, node.data_source_id),
+            (self._by_data_set, node.data_set_id),
+            (self._by_sink, node.data_sink_id),
+        ):
+            if key is not None and index.get(key) == node.id:
+                del index[key]
+        for index, key in (
+            (self._by_project, node.project_id),
+            (self._by_status, node.status),
+        ):
+            if key is not None and key in index:
+                index[key].discard(node.id)
+                if not index[key]:
+                    del index[key]
+
+    # Node lookups
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._nodes
+
+    def __iter__(self) -> Iterator[FlowNode]:
+        return iter(self._nodes.values())
+
+    @property
+    def flow_ids(self) -> List[int]:
+        """Origin node IDs of every indexed flow."""
+        return list(self._flow_nodes)
+
+    def node(self, node_id: int) -> Optional[FlowNode]:
+        """Return a node by flow node ID."""
+        return self._nodes.get(node_id)
+
+    def node_for_source(self, data_source_id: int) -> Optional[FlowNode]:
+        """Return the flow node wrapping a data source."""
+        return self._lookup(self._by_source, data_source_id)
+
+    def node_for_data_set(self, data_set_id: int) -> Optional[FlowNode]:
+        """Return the flow node wrapping a nexset."""
+        return self._lookup(self._by_data_set, data_set_id)
+
+    def node_for_sink(self, data_sink_id: int) -> Optional[FlowNode]:
+        """Return the flow node wrapping a destination."""
+        return self._lookup(self._by_sink, data_sink_id)
+
+    def nodes_in_project(self, project_id: int) -> List[FlowNode]:
+        """Return all nodes belonging to a project."""
+        return self._resolve(self._by_project.get(project_id, ()))
+
+    def nodes_with_status(self, status: str) -> List[FlowNode]:
+        """Return all nodes with the given status (e.g. ``"ACTIVE"``)."""
+        return self._resolve(self._by_status.get(status, ()))
+
+    def flow_nodes(self, origin_node_id: int) -> List[FlowNode]:
+        """Return every node of one flow, root first."""
+        return self._resolve(self._flow_nodes.get(origin_node_id, ()))
+
+    # Traversal
+
+    def origin(self, node_id: int) -> Optional[FlowNode]:
+        """Return the root node of the flow containing ``node_id``."""
+        origin_id = self._origin.get(node_id)
+        return self._nodes.get(origin_id) if origin_id is not None else None
+
+    def origin_id(self, node_id: int) -> Optional[int]:
+        """Return the origin node ID of the flow containing ``node_id``."""
+        return self._origin.get(node_id)
+
+    def parent(self, node_id: int) -> Optional[FlowNode]:
+        """Return the parent of a node (None for roots)."""
+        parent_id = self._parent.get(node_id)
+        return self._nodes.get(parent_id) if parent_id is not None else None
+
+    def children(self, node_id: int) -> List[FlowNode]:
+        """Return the direct children of a node."""
+        return self._resolve(self._children.get(node_id, ()))
+
+    def ancestor_ids(self, node_id: int) -> Tuple[int, ...]:
+        """IDs of a node's ancestors, root first."""
+        return self._ancestors.get(node_id, ())
+
+    def descendant_ids(self, node_id: int) -> FrozenSet[int]:
+        """IDs of every node below ``node_id``."""
+        return self._descendants.get(node_id, frozenset())
+
+    def ancestors(self, node_id: int) -> List[FlowNode]:
+        """Nodes above ``node_id``, root first."""
+        return self._resolve(self.ancestor_ids(node_id))
+
+    def descendants(self, node_id: int) -> List[FlowNode]:
+        """Nodes below ``node_id``."""
+        return self._resolve(self.descendant_ids(node_id))
+
+    def downstream_sinks(
+        self,
+        node_id: Optional[int] = None,
+        data_set_id: Optional[int] = None,
+        data_source_id: Optional[int] = None,
+    ) -> List[FlowNode]:
+        """
+        Return sink nodes downstream of a node, nexset or source.
+
+        Exactly one of ``node_id``, ``data_set_id`` or ``data_source_id``
+        identifies the starting point.
+        """
+        start = self._start_node_id(node_id, data_set_id, data_source_id)
+        if start is None:
+            return []
+        return [
+            self._nodes[d]
+            for d in self._descendants.get(start, ())
+            if self._nodes[d].data_sink_id is not None
+        ]
+
+    def upstream_source(self, node_id: int) -> Optional[FlowNode]:
+        """Return the nearest ancestor (or the node itself) wrapping a source."""
+        for candidate in (node_id,) + tuple(reversed(self.ancestor_ids(node_id))):
+            node = self._nodes.get(candidate)
+            if node is not None and node.data_source_id is not None:
+                return node
+        return None
+
+    # Element joins
+
+    def source(self, data_source_id: int) -> Optional[Source]:
+        """Return the Source model included in the flow responses."""
+        return self._sources.get(data_source_id)
+
+    def nexset(self, data_set_id: int) -> Optional[Nexset]:
+        """Return the Nexset model included in the flow responses."""
+        return self._nexsets.get(data_set_id)
+
+    def destination(self, data_sink_id: int) -> Optional[Destination]:
+        """Return the Destination model included in the flow responses."""
+        return self._destinations.get(data_sink_id)
+
+    def element(self, node_id: int) -> Optional[object]:
+        """Return the Source, Nexset or Destination a node wraps, if loaded."""
+        node = self._nodes.get(node_id)
+        if node is None:
+            return None
+        if node.data_sink_id is not None:
+            return self._destinations.get(node.data_sink_id)
+        if node.data_set_id is not None:
+            return self._nexsets.get(node.data_set_id)
+        if node.data_source_id is not None:
+            return self._sources.get(node.data_source_id)
+        return None
+
+    # Helpers
+
+    def _lookup(self, index: Dict[int, int], key: int) -> Optional[FlowNode]:
+        node_id = index.get(key)
+        return self._nodes.get(node_id) if node_id is not None else None
+
+    def _resolve(self, node_ids: Iterable[int]) -> List[FlowNode]:
+        return [self._nodes[node_id] for node_id in node_ids if node_id in self._nodes]
+
+    def _start_node_id(
+        self,
+        node_id: Optional[int],
+        data_set_id: Optional[int],
+        data_source_id: Optional[int],
+    ) -> Optional[int]:
+        if node_id is not None:
+            return node_id
+        if data_set_id is not None:
+            return self._by_data_set.get(data_set_id)
+        if data_source_id is not None:
+            return self._by_source.get(data_source_id)
+        raise ValueError("One of node_id, data_set_id or data_source_id is required")
@@ -0,0 +1,375 @@
+"""Incremental synchronization of a local FlowGraph with the flows API."""
+
+import hashlib
+import json
+import logging
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from nexla_sdk.exceptions import FanOutError, NotFoundError
+from nexla_sdk.models.base import BaseModel
+from nexla_sdk.models.common import FlowNode
+from nexla_sdk.models.flows.responses import FlowResponse
+from nexla_sdk.utils.flow_graph import FlowGraph
+
+logger = logging.getLogger(__name__)
+
+
+class FlowChangeType(str, Enum):
+    """Kinds of change detected between two snapshots of a flow."""
+
+    FLOW_ADDED = "flow_added"
+    FLOW_REMOVED = "flow_removed"
+    NODE_ADDED = "node_added"
+    NODE_REMOVED = "node_removed"
+    STATUS_CHANGED = "status_changed"
+    REPARENTED = "reparented"
+    NODE_UPDATED = "node_updated"
+
+
+class FlowChangeEvent(BaseModel):
+    """A single change to a flow node detected by FlowSync."""
+
+    type: FlowChangeType
+    origin_node_id: int
+    node_id: int
+    node: Optional[FlowNode] = None
+    previous: Optional[FlowNode] = None
+    old_status: Optional[str] = None
+    new_status: Optional[str] = None
+    old_parent_id: Optional[int] = None
+    new_parent_id: Optional[int] = None
+
+
+class FlowSync:
+    """
+    Keep a FlowGraph up to date without re-downloading every flow.
+
+    ``load()`` (or ``resync()``) lists all flows once. After that,
+    ``refresh()`` re-fetches individual flows with
+    ``flows.get(id, flows_only=True)`` on the client's shared pool. A flow is
+    only re-indexed when the content hash of its tree changed, and when
+    per-flow ``updated_at`` stamps are supplied, flows whose stamp has not
+    moved are not fetched at all.
+
+    Each detected change is returned as a FlowChangeEvent and passed to the
+    optional ``on_change`` callback.
+
+    Args:
+        client: NexlaClient used for API calls
+        graph: Graph to maintain (a new empty FlowGraph by default)
+        on_change: Callback invoked with every change event
+        concurrency: Maximum flows fetched at once
+        per_page: Flows requested per page by ``resync()``
+
+    Examples:
+        sync = FlowSync(client)
+        sync.load()
+
+        # Later, with stamps from a change feed or a sources listing
+        for event in sync.refresh(updated_at={flow_id: stamp, ...}):
+            if event.type == FlowChangeType.STATUS_CHANGED:
+                print(event.node_id, event.old_status, "->", event.new_status)
+    """
+
+    def __init__(
+        self,
+        client,
+        graph: Optional[FlowGraph] = None,
+        on_change: Optional[Callable[[FlowChangeEvent], None]] = None,
+        concurrency: Optional[int] = None,
+        per_page: int = 100,
+    ):
+        self.client = client
+        self.per_page = per_page
+        self.graph = graph if graph is not None else FlowGraph()
+        self.on_change = on_change
+        self.concurrency = concurrency
+        self._flow_hashes: Dict[int, str] = {}
+        self._node_hashes: Dict[int, str] = {}
+        self._stamps: Dict[int, Any] = {}
+
+    def load(self) -> List[FlowChangeEvent]:
+        """Perform the initial full listing (same as ``resync()``)."""
+        return self.resync()
+
+    def resync(self) -> List[FlowChangeEvent]:
+        """
+        Reconcile against a full ``flows.list(flows_only=True)``.
+
+        Every page is listed before deletions are computed, so flows past the
+        first page are not reported as removed. This is the only way to
+        discover flows created elsewhere without knowing their IDs; it also
+        detects deleted flows.
+        """
+        roots: Dict[int, Optional[FlowNode]] = {}
+        for response in self.client.flows.iter_pages(
+            per_page=self.per_page, flows_only=True
+        ):
+            roots.update((_origin_id(root), root) for root in response.flows)
+
+        for origin_id in self.graph.flow_ids:
+            roots.setdefault(origin_id, None)
+        return self._emit(self._apply_all(roots))
+
+    def refresh(
+        self,
+        flow_ids: Optional[Iterable[int]] = None,
+        updated_at: Optional[Dict[int, Any]] = None,
+    ) -> List[FlowChangeEvent]:
+        """
+        Re-fetch selected flows and apply whatever changed.
+
+        Args:
+            flow_ids: Origin node IDs to refresh. Defaults to the keys of
+                ``updated_at`` when given, otherwise every known flow.
+            updated_at: Last-modified stamp per origin node ID. Flows whose
+                stamp equals the one seen on the previous refresh are skipped.
+
+        Returns:
+            Change events, in the order they were applied
+
+        Raises:
+            FanOutError: If some flows could not be fetched; changes from the
+                others are still applied and returned in ``results``
+        """
+        if flow_ids is None:
+            flow_ids = updated_at.keys() if updated_at else self.graph.flow_ids
+        stamps = updated_at or {}
+        candidates = [
+            flow_id
+            for flow_id in dict.fromkeys(flow_ids)
+            if flow_id not in stamps
+            or flow_id not in self._stamps
+            or stamps[flow_id] != self._stamps[flow_id]
+        ]
+
+        roots: Dict[int, Optional[FlowNode]] = {}
+        errors: List[Tuple[Any, BaseException]] = []
+        outcomes = self.client.map(
+            self._fetch,
+            candidates,
+            concurrency=self.concurrency,
+            return_exceptions=True,
+        )
+        for flow_id, outcome in zip(candidates, outcomes):
+            if isinstance(outcome, BaseException):
+                errors.append((flow_id, outcome))
+            else:
+                roots[flow_id] = outcome
+        events = self._apply_all(roots)
+        for flow_id in roots:
+            if flow_id in stamps:
+                self._stamps[flow_id] = stamps[flow_id]
+
+        self._emit(events)
+        if errors:
+            raise FanOutError(
+                f"{len(errors)} of {len(candidates)} flows could not be refreshed",
+                errors=errors,
+                results=events,
+                operation="flow_sync",
+            )
+        return events
+
+    def _fetch(self, flow_id: int) -> Optional[FlowNode]:
+        try:
+            response: FlowResponse = self.client.flows.get(flow_id, flows_only=True)
+        except NotFoundError:
+            return None
+        for root in response.flows:
+            if _origin_id(root) == flow_id:
+                return root
+        return None
+
+    def _apply_all(self, roots: Dict[int, Optional[FlowNode]]) -> List[FlowChangeEvent]:
+        """Apply new trees for several flows, tracking nodes moving between them."""
+        incoming = {
+            node.id: origin_id
+            for origin_id, root in roots.items()
+            if root is not None
+            for node in _walk(root)
+        }
+        moves: Dict[int, Tuple[FlowNode, Optional[int]]] = {}
+        events: List[FlowChangeEvent] = []
+        for origin_id, root in roots.items():
+            events.extend(self._apply(origin_id, root, incoming, moves))
+        # A node left an already applied flow for one that looked unchanged
+        # (it had taken the node before); index that flow again to get it back
+        for origin_id in dict.fromkeys(incoming[node_id] for node_id in list(moves)):
+            self._flow_hashes.pop(origin_id, None)
+            events.extend(self._apply(origin_id, roots[origin_id], incoming, moves))
+        return events
+
+    def _apply(
+        self,
+        origin_id: int,
+        root: Optional[FlowNode],
+        incoming: Dict[int, int],
+        moves: Dict[int, Tuple[FlowNode, Optional[int]]],
+    ) -> List[FlowChangeEvent]:
+        """
+        Index the new tree for a flow (None if deleted) and diff it.
+
+        ``incoming`` maps every node in this batch of trees to its flow.
+        Nodes leaving this flow for another one in the batch are parked in
+        ``moves`` (node before the move, old parent) instead of being
+        reported as removed, and nodes arriving from another flow are
+        reported as reparented.
+        """
+        flow_hash = _hash(root.model_dump(mode="json")) if root is not None else None
+        if flow_hash is not None and self._flow_hashes.get(origin_id) == flow_hash:
+            return []
+
+        old_nodes = {node.id: node for node in self.graph.flow_nodes(origin_id)}
+        old_parents = {node_id: self._parent_id(node_id) for node_id in old_nodes}
+        moved_in: Dict[int, Tuple[FlowNode, Optional[int]]] = {}
+        for node in _walk(root) if root is not None else ():
+            if node.id in moves:
+                moved_in[node.id] = moves.pop(node.id)
+            elif self.graph.origin_id(node.id) not in (None, origin_id):
+                moved_in[node.id] = (
+                    self.graph.node(node.id),
+                    self._parent_id(node.id),
+                )
+
+        self.graph.remove_flow(origin_id)
+        if root is not None:
+            self.graph.add_flow(root)
+            self._flow_hashes[origin_id] = flow_hash
+            stamp = getattr(root, "updated_at", None)
+            if stamp is not None:
+                self._stamps[origin_id] = stamp
+        else:
+            self._flow_hashes.pop(origin_id, None)
+            self._stamps.pop(origin_id, None)
+        new_nodes = {node.id: node for node in self.graph.flow_nodes(origin_id)}
+
+        events = []
+        if not old_nodes and new_nodes:
+            events.append(self._event(FlowChangeType.FLOW_ADDED, origin_id, root))
+        elif old_nodes and not new_nodes:
+            old_root = old_nodes.get(origin_id) or next(iter(old_nodes.values()))
+            events.append(
+                self._event(FlowChangeType.FLOW_REMOVED, origin_id, previous=old_root)
+            )
+
+        for node_id, node in new_nodes.items():
+            node_hash = _node_hash(node)
+            old_hash = self._node_hashes.get(node_id)
+            self._node_hashes[node_id] = node_hash
+            previous = old_nodes.get(node_id)
+            old_parent = old_parents.get(node_id)
+            moved = previous is None and node_id in moved_in
+            if moved:
+                previous, old_parent = moved_in[node_id]
+            if previous is None:
+                events.append(
+                    self._event(
+                        FlowChangeType.NODE_ADDED,
+                        origin_id,
+                        node,
+                        new_parent_id=self._parent_id(node_id),
+                    )
+                )
+                continue
+
+            changed = False
+            if previous.status != node.status:
+                changed = True
+                events.append(
+                    self._event(
+                        FlowChangeType.STATUS_CHANGED,
+                        origin_id,
+                        node,
+                        previous,
+                        old_status=previous.status,
+                        new_status=node.status,
+                    )
+                )
+            new_parent = self._parent_id(node_id)
+            if moved or old_parent != new_parent:
+                changed = True
+                events.append(
+                    self._event(
+                        FlowChangeType.REPARENTED,
+                        origin_id,
+                        node,
+                        previous,
+                        old_parent_id=old_parent,
+                        new_parent_id=new_parent,
+                    )
+                )
+            if not changed and old_hash != node_hash:
+                events.append(
+                    self._event(FlowChangeType.NODE_UPDATED, origin_id, node, previous)
+                )
+
+        for node_id, previous in old_nodes.items():
+            if node_id in new_nodes:
+                continue
+            if incoming.get(node_id, origin_id) != origin_id:
+                moves[node_id] = (previous, old_parents.get(node_id))
+                continue
+            self._node_hashes.pop(node_id, None)
+            events.append(
+                self._event(
+                    FlowChangeType.NODE_REMOVED,
+                    origin_id,
+                    previous=previous,
+                    old_parent_id=old_parents.get(node_id),
+                )
+            )
+        return events
+
+    def _parent_id(self, node_id: int) -> Optional[int]:
+        parent = self.graph.parent(node_id)
+        return parent.id if parent is not None else None
+
+    @staticmethod
+    def _event(
+        change_type: FlowChangeType,
+        origin_id: int,
+        node: Optional[FlowNode] = None,
+        previous: Optional[FlowNode] = None,
+        **fields: Any,
+    ) -> FlowChangeEvent:
+        node_id = node.id if node is not None else previous.id
+        return FlowChangeEvent(
+            type=change_type,
+            origin_node_id=origin_id,
+            node_id=node_id,
+            node=node,
+            previous=previous,
+            **fields,
+        )
+
+    def _emit(self, events: List[FlowChangeEvent]) -> List[FlowChangeEvent]:
+        if self.on_change is not None:
+            for event in events:
+                try:
+                    self.on_change(event)
+                except Exception as e:
+                    logger.warning(f"Flow change callback failed: {e}")
+        return events
+
+
+def _origin_id(root: FlowNode) -> int:
+    return root.origin_node_id or root.id
+
+
+def _walk(root: FlowNode) -> Iterator[FlowNode]:
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.children or [])
+
+
+def _hash(data: Any) -> str:
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _node_hash(node: FlowNode) -> str:
+    return _hash(node.model_dump(mode="json", exclude={"children"}))
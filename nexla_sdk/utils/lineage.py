@@ -0,0 +1,410 @@
+"""
+Lineage index over sources, nexsets and destinations.
+
+Answering "which sinks are downstream of source S" from the API means one
+``nexsets.get`` per hop. ``LineageIndex`` instead crawls the paginated
+``data_sets`` list once (plus ``data_sources`` and ``data_sinks`` for edges
+those records carry), interns every resource as a small integer and keeps
+upstream and downstream adjacency sets. Closure queries walk the graph in
+memory and are memoized until the index next changes.
+
+Nodes are ``(resource_type, id)`` tuples, with resource types
+``"data_source"``, ``"data_set"`` and ``"data_sink"``.
+"""
+
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from nexla_sdk.exceptions import NotFoundError
+
+Node = Tuple[str, int]
+
+DATA_SOURCE = "data_source"
+DATA_SET = "data_set"
+DATA_SINK = "data_sink"
+
+
+class LineageIndex:
+    """
+    Upstream/downstream index of Nexla resources.
+
+    Every edge remembers which records contributed it (a nexset's parents,
+    source and sinks; a source's data sets; a sink's data set), so one
+    record can be re-indexed or dropped without rebuilding the graph. A
+    re-indexed nexset is authoritative for its own source and sinks: edges
+    that source or sink records asserted for it, but that it no longer
+    lists, are dropped too. Removing a resource drops every edge touching it.
+
+    Args:
+        client: NexlaClient used to crawl resources
+        per_page: Page size for the crawl
+        include_sources: Also crawl sources for source -> nexset edges
+        include_sinks: Also crawl destinations for nexset -> sink edges
+        access_role: Access role filter for the crawl
+
+    Examples:
+        lineage = LineageIndex(client)
+        lineage.load()
+
+        sinks = lineage.downstream_sinks(data_source_id=42)
+        sources = lineage.upstream_sources(data_sink_id=7)
+        impact = lineage.downstream_many([("data_set", 1001), ("data_set", 1002)])
+
+        lineage.refresh([1001])   # re-index nexsets known to have changed
+    """
+
+    def __init__(
+        self,
+        client,
+        per_page: int = 100,
+        include_sources: bool = True,
+        include_sinks: bool = True,
+        access_role: Optional[str] = None,
+    ):
+        self.client = client
+        self.per_page = per_page
+        self.include_sources = include_sources
+        self.include_sinks = include_sinks
+        self.access_role = access_role
+
+        self._lock = threading.RLock()
+        self._ids: Dict[Node, int] = {}
+        self._nodes: List[Node] = []
+        self._names: Dict[int, str] = {}
+        self._down: List[Set[int]] = []
+        self._up: List[Set[int]] = []
+        # (from, to) -> number of records asserting the edge
+        self._edge_refs: Dict[Tuple[int, int], int] = {}
+        # record node -> edges it asserted
+        self._contributed: Dict[int, Set[Tuple[int, int]]] = {}
+        # nexset id -> updated_at seen at the last index
+        self._versions: Dict[int, Any] = {}
+        self._down_memo: Dict[int, FrozenSet[int]] = {}
+        self._up_memo: Dict[int, FrozenSet[int]] = {}
+
+    # Building
+
+    def load(self) -> int:
+        """
+        Crawl every nexset (and sources and sinks) and rebuild the index.
+
+        Returns:
+            Number of nexsets indexed
+        """
+        nexsets = list(self._crawl(self.client.nexsets))
+        sources = list(self._crawl(self.client.sources)) if self.include_sources else []
+        sinks = (
+            list(self._crawl(self.client.destinations)) if self.include_sinks else []
+        )
+        with self._lock:
+            self._clear()
+            for nexset in nexsets:
+                self.add_nexset(nexset)
+            for source in sources:
+                self.add_source(source)
+            for sink in sinks:
+                self.add_sink(sink)
+        return len(nexsets)
+
+    def refresh(self, data_set_ids: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Re-index nexsets that changed.
+
+        With ``data_set_ids``, those nexsets are fetched concurrently and
+        re-indexed (or dropped, if they no longer exist). Without, the
+        ``data_sets`` list is crawled again and only nexsets that are new,
+        gone or have a different ``updated_at`` are re-indexed.
+
+        Returns:
+            IDs of the nexsets whose index entries changed
+        """
+        if data_set_ids is None:
+            nexsets = {nexset.id: nexset for nexset in self._crawl(self.client.nexsets)}
+            with self._lock:
+                changed = [
+                    set_id
+                    for set_id, nexset in nexsets.items()
+                    if set_id not in self._versions
+                    or self._versions[set_id] != nexset.updated_at
+                ]
+                removed = [set_id for set_id in self._versions if set_id not in nexsets]
+                for set_id in changed:
+                    self.add_nexset(nexsets[set_id])
+                for set_id in removed:
+                    self.remove((DATA_SET, set_id))
+            return changed + removed
+
+        ids = list(dict.fromkeys(data_set_ids))
+        fetched = self.client.map(self.client.nexsets.get, ids, return_exceptions=True)
+        changed = []
+        with self._lock:
+            for set_id, nexset in zip(ids, fetched):
+                if isinstance(nexset, BaseException):
+                    if not isinstance(nexset, NotFoundError):
+                        raise nexset
+                    if self.remove((DATA_SET, set_id)):
+                        changed.append(set_id)
+                elif self.add_nexset(nexset):
+                    changed.append(set_id)
+        return changed
+
+    def add_nexset(self, nexset: Any) -> bool:
+        """
+        Index a Nexset, replacing edges it contributed before.
+
+        Returns:
+            Whether the nexset was new or its edges changed
+        """
+        node = self._intern((DATA_SET, nexset.id), nexset.name)
+        edges: Set[Tuple[int, int]] = set()
+        source_id = nexset.data_source_id or getattr(nexset.data_source, "id", None)
+        if source_id is not None:
+            edges.add((self._intern((DATA_SOURCE, source_id)), node))
+        for parent in nexset.parent_data_sets or []:
+            edges.add((self._intern((DATA_SET, parent.id)), node))
+        for sink in nexset.data_sinks or []:
+            edges.add((node, self._intern((DATA_SINK, sink.id), sink.name)))
+        # Only fields the API actually returned can overrule other records
+        fields = nexset.model_fields_set
+        with self._lock:
+            before = self._neighbours(node)
+            is_new = nexset.id not in self._versions
+            self._replace_edges(node, edges)
+            self._drop_foreign_edges(
+                node,
+                keep=edges,
+                sources="data_source_id" in fields or "data_source" in fields,
+                sinks="data_sinks" in fields,
+            )
+            self._versions[nexset.id] = nexset.updated_at
+            return is_new or self._neighbours(node) != before
+
+    def add_source(self, source: Any) -> None:
+        """Index a Source's nexsets."""
+        node = self._intern((DATA_SOURCE, source.id), source.name)
+        edges = {
+            (node, self._intern((DATA_SET, data_set.id)))
+            for data_set in source.data_sets or []
+        }
+        with self._lock:
+            self._replace_edges(node, edges)
+
+    def add_sink(self, sink: Any) -> None:
+        """Index a Destination's nexset."""
+        node = self._intern((DATA_SINK, sink.id), sink.name)
+        set_id = sink.data_set_id or getattr(sink.data_set, "id", None)
+        edges = set()
+        if set_id is not None:
+            edges.add((self._intern((DATA_SET, set_id)), node))
+        with self._lock:
+            self._replace_edges(node, edges)
+
+    def remove(self, node: Node) -> bool:
+        """
+        Drop every edge touching a resource, e.g. after it was deleted.
+
+        Returns:
+            Whether the index changed
+        """
+        with self._lock:
+            index = self._ids.get(node)
+            if index is None:
+                return False
+            known = node[0] == DATA_SET and node[1] in self._versions
+            had_edges = bool(self._up[index] or self._down[index])
+            self._replace_edges(index, set())
+            for other in list(self._up[index]) + list(self._down[index]):
+                # Edges other records asserted: a source's or sink's link to
+                # this nexset, a child nexset's parent link
+                self._withdraw(other, (other, index))
+                self._withdraw(other, (index, other))
+            if node[0] == DATA_SET:
+                self._versions.pop(node[1], None)
+            return known or had_edges
+
+    # Queries
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._ids
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def name(self, node: Node) -> Optional[str]:
+        index = self._ids.get(node)
+        return None if index is None else self._names.get(index)
+
+    def parents(self, node: Node) -> List[Node]:
+        """Direct upstream neighbours."""
+        index = self._ids.get(node)
+        return [] if index is None else self._resolve(self._up[index])
+
+    def children(self, node: Node) -> List[Node]:
+        """Direct downstream neighbours."""
+        index = self._ids.get(node)
+        return [] if index is None else self._resolve(self._down[index])
+
+    def downstream(self, node: Node) -> List[Node]:
+        """Every resource fed, directly or transitively, by ``node``."""
+        index = self._ids.get(node)
+        if index is None:
+            return []
+        with self._lock:
+            return self._resolve(self._closure(index, self._down, self._down_memo))
+
+    def upstream(self, node: Node) -> List[Node]:
+        """Every resource ``node`` depends on, directly or transitively."""
+        index = self._ids.get(node)
+        if index is None:
+            return []
+        with self._lock:
+            return self._resolve(self._closure(index, self._up, self._up_memo))
+
+    def downstream_many(self, nodes: Iterable[Node]) -> Dict[Node, List[Node]]:
+        """Downstream closures for many nodes; shared subgraphs are walked once."""
+        return {node: self.downstream(node) for node in nodes}
+
+    def upstream_many(self, nodes: Iterable[Node]) -> Dict[Node, List[Node]]:
+        """Upstream closures for many nodes; shared subgraphs are walked once."""
+        return {node: self.upstream(node) for node in nodes}
+
+    def downstream_sinks(
+        self,
+        data_source_id: Optional[int] = None,
+        data_set_id: Optional[int] = None,
+    ) -> List[int]:
+        """IDs of destinations downstream of a source or nexset."""
+        node = _start_node(DATA_SOURCE, data_source_id, DATA_SET, data_set_id)
+        return [id_ for kind, id_ in self.downstream(node) if kind == DATA_SINK]
+
+    def downstream_data_sets(
+        self,
+        data_source_id: Optional[int] = None,
+        data_set_id: Optional[int] = None,
+    ) -> List[int]:
+        """IDs of nexsets downstream of a source or nexset."""
+        node = _start_node(DATA_SOURCE, data_source_id, DATA_SET, data_set_id)
+        return [id_ for kind, id_ in self.downstream(node) if kind == DATA_SET]
+
+    def upstream_sources(
+        self,
+        data_set_id: Optional[int] = None,
+        data_sink_id: Optional[int] = None,
+    ) -> List[int]:
+        """IDs of sources a nexset or destination ultimately reads from."""
+        node = _start_node(DATA_SET, data_set_id, DATA_SINK, data_sink_id)
+        return [id_ for kind, id_ in self.upstream(node) if kind == DATA_SOURCE]
+
+    # Internals
+
+    def _crawl(self, resource: Any) -> Iterable[Any]:
+        return resource.paginate(per_page=self.per_page, access_role=self.access_role)
+
+    def _clear(self) -> None:
+        self._ids = {}
+        self._nodes = []
+        self._names = {}
+        self._down = []
+        self._up = []
+        self._edge_refs = {}
+        self._contributed = {}
+        self._versions = {}
+        self._down_memo = {}
+        self._up_memo = {}
+
+    def _intern(self, node: Node, name: Optional[str] = None) -> int:
+        with self._lock:
+            index = self._ids.get(node)
+            if index is None:
+                index = len(self._nodes)
+                self._ids[node] = index
+                self._nodes.append(node)
+                self._down.append(set())
+                self._up.append(set())
+            if name:
+                self._names[index] = name
+            return index
+
+    def _replace_edges(self, record: int, edges: Set[Tuple[int, int]]) -> None:
+        previous = self._contributed.get(record, set())
+        if previous == edges:
+            return
+        for edge in previous - edges:
+            self._edge_refs[edge] -= 1
+            if not self._edge_refs[edge]:
+                del self._edge_refs[edge]
+                self._down[edge[0]].discard(edge[1])
+                self._up[edge[1]].discard(edge[0])
+        for edge in edges - previous:
+            self._edge_refs[edge] = self._edge_refs.get(edge, 0) + 1
+            self._down[edge[0]].add(edge[1])
+            self._up[edge[1]].add(edge[0])
+        self._contributed[record] = edges
+        self._down_memo.clear()
+        self._up_memo.clear()
+
+    def _neighbours(self, node: int) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+        return frozenset(self._up[node]), frozenset(self._down[node])
+
+    def _drop_foreign_edges(
+        self, node: int, keep: Set[Tuple[int, int]], sources: bool, sinks: bool
+    ) -> None:
+        """Withdraw source/sink record edges touching ``node`` not in ``keep``."""
+        if sources:
+            for other in list(self._up[node]):
+                if self._nodes[other][0] == DATA_SOURCE and (other, node) not in keep:
+                    self._withdraw(other, (other, node))
+        if sinks:
+            for other in list(self._down[node]):
+                if self._nodes[other][0] == DATA_SINK and (node, other) not in keep:
+                    self._withdraw(other, (node, other))
+
+    def _withdraw(self, record: int, edge: Tuple[int, int]) -> None:
+        """Drop one edge from those ``record`` contributed, if it did."""
+        contributed = self._contributed.get(record)
+        if contributed and edge in contributed:
+            self._replace_edges(record, contributed - {edge})
+
+    def _closure(
+        self, start: int, adjacency: List[Set[int]], memo: Dict[int, FrozenSet[int]]
+    ) -> FrozenSet[int]:
+        """Reachable set from ``start``, reusing and filling ``memo``."""
+        if start in memo:
+            return memo[start]
+        # Iterative post-order walk so deep lineages do not hit recursion limits
+        result: Dict[int, Set[int]] = {}
+        stack: List[Tuple[int, bool]] = [(start, False)]
+        on_path: Set[int] = set()
+        while stack:
+            index, expanded = stack.pop()
+            if expanded:
+                reach: Set[int] = set()
+                for child in adjacency[index]:
+                    reach.add(child)
+                    child_reach = memo.get(child)
+                    if child_reach is None:
+                        child_reach = result.get(child, set())
+                    reach.update(child_reach)
+                on_path.discard(index)
+                result[index] = reach
+                memo[index] = frozenset(reach)
+                continue
+            if index in memo or index in result or index in on_path:
+                continue
+            on_path.add(index)
+            stack.append((index, True))
+            for child in adjacency[index]:
+                if child not in memo and child not in result and child not in on_path:
+                    stack.append((child, False))
+        return memo[start]
+
+    def _resolve(self, indexes: Iterable[int]) -> List[Node]:
+        return sorted(self._nodes[index] for index in indexes)
+
+
+def _start_node(
+    first_kind: str, first_id: Optional[int], second_kind: str, second_id: Optional[int]
+) -> Node:
+    if (first_id is None) == (second_id is None):
+        raise ValueError(f"Pass exactly one of {first_kind}_id or {second_kind}_id")
+    return (first_kind, first_id) if first_id is not None else (second_kind, second_id)
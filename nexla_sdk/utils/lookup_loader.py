@@ -0,0 +1,306 @@
+"""
+Streaming lookup loads from CSV, NDJSON and Parquet files.
+
+``LookupLoader`` reads a file row by row, maps source columns to lookup
+fields, converts values as each row is read and hands the rows to
+``lookups.bulk_upsert``, which uploads them in size-bounded chunks. Only the
+chunks in flight are held in memory, whatever the size of the file.
+
+Parquet support needs ``pyarrow`` (``pip install "nexla-sdk[parquet]"``);
+``.gz`` CSV and NDJSON files are decompressed on the fly. A ``.json``
+extension is ambiguous (a JSON array or one object per line), so such files
+need an explicit ``format="ndjson"``.
+"""
+
+import contextlib
+import csv
+import gzip
+import io
+import json
+import os
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+from pydantic import Field
+
+from nexla_sdk.models.base import BaseModel
+from nexla_sdk.models.lookups.responses import LookupBulkResult
+
+# Guard against missing pyarrow installation
+try:  # pragma: no cover - optional dependency
+    import pyarrow.parquet as pq  # type: ignore
+
+    _pyarrow_available = True
+except Exception:  # pragma: no cover
+    pq = None  # type: ignore
+    _pyarrow_available = False
+
+PathOrFile = Union[str, "os.PathLike[str]", IO]
+
+_FORMATS = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".jsonl": "ndjson",
+    ".ndjson": "ndjson",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+_TRUE = {"true", "t", "yes", "y", "1"}
+_FALSE = {"false", "f", "no", "n", "0"}
+# Invalid-row messages kept in a report
+_MAX_ERRORS = 100
+
+
+class LookupLoadReport(BaseModel):
+    """Summary of a LookupLoader.load() call."""
+
+    data_map_id: int
+    rows_read: int = 0
+    rows_invalid: int = 0
+    errors: List[str] = Field(default_factory=list)
+    upsert: Optional[LookupBulkResult] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether every row was valid and every chunk uploaded."""
+        return not self.rows_invalid and (self.upsert is None or self.upsert.ok)
+
+
+def iter_csv_rows(
+    source: PathOrFile, delimiter: Optional[str] = None, encoding: str = "utf-8"
+) -> Iterator[Dict[str, Any]]:
+    """Stream CSV rows as dicts keyed by the header (tab-delimited for .tsv)."""
+    if delimiter is None:
+        delimiter = "\t" if _suffix(source) == ".tsv" else ","
+    with _open_text(source, encoding) as handle:
+        yield from csv.DictReader(handle, delimiter=delimiter)
+
+
+def iter_ndjson_rows(
+    source: PathOrFile,
+    encoding: str = "utf-8",
+    on_error: Optional[Callable[[int, str], None]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream one JSON object per non-empty line.
+
+    A line that is not a JSON object raises ValueError naming the line,
+    unless ``on_error`` is given: it is then called with the line number and
+    message, and reading continues with the next line.
+    """
+    with _open_text(source, encoding) as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                message = f"Line {line_number}: invalid JSON: {e}"
+            else:
+                if isinstance(row, dict):
+                    yield row
+                    continue
+                message = f"Line {line_number}: expected a JSON object"
+            if on_error is None:
+                raise ValueError(message)
+            on_error(line_number, message)
+
+
+def iter_parquet_rows(
+    source: PathOrFile,
+    columns: Optional[Sequence[str]] = None,
+    batch_size: int = 10000,
+) -> Iterator[Dict[str, Any]]:
+    """Stream Parquet rows, one record batch at a time (requires pyarrow)."""
+    if not _pyarrow_available:
+        raise ImportError(
+            "Reading Parquet requires pyarrow: pip install 'nexla-sdk[parquet]'"
+        )
+    parquet_file = pq.ParquetFile(source)
+    for batch in parquet_file.iter_batches(
+        batch_size=batch_size, columns=list(columns) if columns else None
+    ):
+        yield from batch.to_pylist()
+
+
+class LookupLoader:
+    """
+    Load a file into a lookup with constant memory.
+
+    Args:
+        client: NexlaClient used for uploads
+        data_map_id: Lookup ID
+        columns: Source column -> lookup field mapping; when given, only the
+            mapped columns are loaded
+        types: Lookup field -> converter (``int``, ``float``, ``bool``, ``str``
+            or any callable); empty values become None
+        on_invalid: "skip" to drop and report rows that fail conversion, or
+            "raise" to stop at the first one
+        chunk_size: Maximum entries per upsert request
+        max_chunk_bytes: Maximum serialized entry bytes per request
+        concurrency: Maximum chunks uploaded at once
+
+    Examples:
+        loader = LookupLoader(
+            client,
+            55,
+            columns={"SKU": "sku", "Unit Price": "price"},
+            types={"price": float},
+            concurrency=8,
+        )
+        report = loader.load("catalog.csv.gz")
+        print(report.rows_read, report.rows_invalid, report.upsert.rows_upserted)
+    """
+
+    def __init__(
+        self,
+        client,
+        data_map_id: int,
+        columns: Optional[Dict[str, str]] = None,
+        types: Optional[Dict[str, Callable[[Any], Any]]] = None,
+        on_invalid: str = "skip",
+        chunk_size: int = 5000,
+        max_chunk_bytes: int = 4 * 1024 * 1024,
+        concurrency: Optional[int] = None,
+    ):
+        if on_invalid not in ("skip", "raise"):
+            raise ValueError("on_invalid must be 'skip' or 'raise'")
+        self.client = client
+        self.data_map_id = data_map_id
+        self.columns = columns
+        self.types = types or {}
+        self.on_invalid = on_invalid
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.concurrency = concurrency
+
+    def rows(
+        self, source: PathOrFile, format: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream raw rows from a file; format is inferred from the extension."""
+        return self._rows(source, format)
+
+    def _rows(
+        self,
+        source: PathOrFile,
+        format: Optional[str],
+        on_error: Optional[Callable[[int, str], None]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        format = format or _FORMATS.get(_suffix(source))
+        if format == "csv":
+            return iter_csv_rows(source)
+        if format == "ndjson":
+            return iter_ndjson_rows(source, on_error=on_error)
+        if format == "parquet":
+            return iter_parquet_rows(source, columns=self.columns)
+        raise ValueError(
+            f"Cannot infer file format of {source!r}; pass format='csv', "
+            "'ndjson' or 'parquet'"
+        )
+
+    def load(
+        self,
+        source: PathOrFile,
+        format: Optional[str] = None,
+        on_progress: Optional[Callable[[Any], None]] = None,
+    ) -> LookupLoadReport:
+        """
+        Stream a file into the lookup.
+
+        Args:
+            source: Path or open file
+            format: 'csv', 'ndjson' or 'parquet'; inferred when omitted
+            on_progress: Called with each LookupChunkResult as it completes
+
+        Returns:
+            LookupLoadReport with row counts, invalid rows and upload results
+
+        Raises:
+            ValueError: For an invalid row (including a malformed NDJSON
+                line) when ``on_invalid="raise"``
+        """
+        report = LookupLoadReport(data_map_id=self.data_map_id)
+
+        def invalid(message: str, cause: Optional[Exception] = None) -> None:
+            if self.on_invalid == "raise":
+                raise ValueError(message) from cause
+            report.rows_invalid += 1
+            if len(report.errors) < _MAX_ERRORS:
+                report.errors.append(message)
+
+        def malformed(line_number: int, message: str) -> None:
+            report.rows_read += 1
+            invalid(message)
+
+        def entries() -> Iterator[Dict[str, Any]]:
+            for row in self._rows(source, format, on_error=malformed):
+                report.rows_read += 1
+                try:
+                    entry = self._convert(row)
+                except (TypeError, ValueError) as e:
+                    invalid(f"Row {report.rows_read}: {e}", e)
+                    continue
+                yield entry
+
+        report.upsert = self.client.lookups.bulk_upsert(
+            self.data_map_id,
+            entries(),
+            chunk_size=self.chunk_size,
+            max_chunk_bytes=self.max_chunk_bytes,
+            concurrency=self.concurrency,
+            on_progress=on_progress,
+        )
+        return report
+
+    def _convert(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        if self.columns:
+            row = {field: row.get(column) for column, field in self.columns.items()}
+        for field, converter in self.types.items():
+            if field in row:
+                row[field] = _convert_value(row[field], converter, field)
+        return row
+
+
+def _convert_value(value: Any, converter: Callable[[Any], Any], field: str) -> Any:
+    if value is None or value == "":
+        return None
+    if converter is bool and isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+        raise ValueError(f"{field}: not a boolean: {value!r}")
+    try:
+        return converter(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{field}: {e}") from e
+
+
+def _suffix(source: PathOrFile) -> str:
+    name = getattr(source, "name", source)
+    if not isinstance(name, (str, os.PathLike)):
+        return ""
+    root, ext = os.path.splitext(os.fspath(name).lower())
+    if ext == ".gz":
+        ext = os.path.splitext(root)[1]
+    return ext
+
+
+@contextlib.contextmanager
+def _open_text(source: PathOrFile, encoding: str) -> Iterator[IO[str]]:
+    """Open a path (gzip-aware) as text, or borrow a caller's file object."""
+    if hasattr(source, "read"):
+        if isinstance(source, io.TextIOBase):
+            yield source
+            return
+        wrapper = io.TextIOWrapper(source, encoding=encoding, newline="")
+        try:
+            yield wrapper
+        finally:
+            # Leave the caller's binary file open
+            wrapper.detach()
+        return
+    path = os.fspath(source)
+    opener = gzip.open if path.lower().endswith(".gz") else open
+    with opener(path, "rt", encoding=encoding, newline="") as handle:
+        yield handle
@@ -0,0 +1,327 @@
+"""
+Local read-through replica of a lookup (data map).
+
+``LookupReplica`` loads every entry of a data map once (``GET
+/data_maps/{id}/entries/*``) into a key index and answers ``get`` and
+``get_many`` locally. Keys missing from the replica are fetched from the API
+on demand and remembered, the whole map is reloaded when the TTL expires, and
+writes made through the replica are applied locally as well.
+
+Small maps are indexed in a dict. Large maps can be kept in a SQLite file
+opened with memory mapping (``path=...``), which keeps the process memory
+flat while key lookups stay index hits.
+
+Reloads are built beside the live index, in batches, without holding the
+replica's lock; reads keep being served from the previous copy until the new
+one is swapped in.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Memory-map up to this many bytes of an on-disk replica
+_MMAP_BYTES = 1 << 30
+# Entries indexed and written to the store at a time during a reload
+_LOAD_BATCH = 10_000
+
+
+class _DictStore:
+    """In-memory key index."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        return {key: self._entries[key] for key in keys if key in self._entries}
+
+    def put_many(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        self._entries.update(entries)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def staging(self) -> "_DictStore":
+        """Empty store to build a reload in."""
+        return _DictStore()
+
+    def swap(self, staged: "_DictStore") -> None:
+        self._entries = staged._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        self._entries = {}
+
+
+class _SqliteStore:
+    """Memory-mapped SQLite key index for maps too large to hold as dicts."""
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "entries",
+        db: Optional[sqlite3.Connection] = None,
+    ) -> None:
+        self._table = table
+        if db is None:
+            db = sqlite3.connect(path, check_same_thread=False)
+            db.execute(f"PRAGMA mmap_size = {_MMAP_BYTES}")
+        self._db = db
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, entry TEXT)"
+        )
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        # Stay below SQLite's default bound-parameter limit
+        for i in range(0, len(keys), 900):
+            batch = keys[i : i + 900]
+            placeholders = ",".join("?" * len(batch))
+            for key, entry in self._db.execute(
+                f"SELECT key, entry FROM {self._table} WHERE key IN ({placeholders})",
+                batch,
+            ):
+                found[key] = json.loads(entry)
+        return found
+
+    def put_many(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        with self._db:
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?)",
+                ((key, json.dumps(entry)) for key, entry in entries.items()),
+            )
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._db:
+            self._db.executemany(
+                f"DELETE FROM {self._table} WHERE key = ?", ((key,) for key in keys)
+            )
+
+    def staging(self) -> "_SqliteStore":
+        """Empty side table, in the same file, to build a reload in."""
+        with self._db:
+            self._db.execute(f"DROP TABLE IF EXISTS {self._table}_staging")
+        return _SqliteStore("", table=f"{self._table}_staging", db=self._db)
+
+    def swap(self, staged: "_SqliteStore") -> None:
+        with self._db:
+            self._db.execute(f"DROP TABLE {self._table}")
+            self._db.execute(f"ALTER TABLE {staged._table} RENAME TO {self._table}")
+
+    def __len__(self) -> int:
+        return self._db.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class LookupReplica:
+    """
+    Read-through local copy of a lookup's entries.
+
+    Args:
+        client: NexlaClient used to load and write entries
+        data_map_id: Lookup ID
+        key_field: Primary key field of the entries; fetched from the
+            lookup's ``map_primary_key`` when omitted
+        ttl: Seconds before the whole map is reloaded (None never expires)
+        path: SQLite file for an on-disk, memory-mapped replica; entries are
+            held in memory when omitted
+        read_through: Fetch keys missing from the replica from the API
+        clock: Time source for TTL expiry
+
+    Examples:
+        with LookupReplica(client, 55, ttl=600) as replica:
+            label = replica.get("A1", {}).get("label")
+            entries = replica.get_many(codes)
+
+            replica.upsert_entries([{"code": "A1", "label": "new"}])
+    """
+
+    def __init__(
+        self,
+        client,
+        data_map_id: int,
+        key_field: Optional[str] = None,
+        ttl: Optional[float] = 300.0,
+        path: Optional[str] = None,
+        read_through: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.client = client
+        self.data_map_id = data_map_id
+        self.key_field = key_field
+        self.ttl = ttl
+        self.read_through = read_through
+        self._clock = clock
+        self._store = _SqliteStore(path) if path else _DictStore()
+        self._missing: set = set()
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.RLock()
+        # Held by the one thread reloading the map
+        self._load_lock = threading.Lock()
+        # Local writes made while a reload is being built, replayed onto it
+        self._writes: Optional[List[Tuple[str, Any]]] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def load(self) -> int:
+        """
+        Fetch every entry and rebuild the index.
+
+        The new index is written to a staging store in batches while the
+        current one keeps serving reads, then swapped in.
+
+        Returns:
+            Number of entries loaded
+        """
+        with self._load_lock:
+            return self._reload()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the entry for ``key``, or ``default`` if the lookup has none."""
+        return self.get_many([key]).get(str(key), default)
+
+    def get_many(self, keys: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Return entries for many keys, in the order requested.
+
+        Keys not in the replica are fetched together in one batched call when
+        ``read_through`` is set; keys the lookup does not have are remembered
+        until the next reload.
+        """
+        self._ensure_fresh()
+        keys = list(dict.fromkeys(str(key) for key in keys))
+        with self._lock:
+            found = self._store.get_many(keys)
+            unknown = [k for k in keys if k not in found and k not in self._missing]
+        if unknown and self.read_through:
+            result = self.client.lookups.get_entries_map(
+                self.data_map_id, unknown, key_field=self.key_field
+            )
+            with self._lock:
+                self._store.put_many(result.entries)
+                self._missing.update(result.missing)
+            found.update(result.entries)
+        return {key: found[key] for key in keys if key in found}
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        with self._lock:
+            return len(self._store)
+
+    def upsert_entries(self, entries: List[Dict[str, Any]]) -> Any:
+        """Upsert entries remotely and apply them to the replica."""
+        response = self.client.lookups.upsert_entries(self.data_map_id, entries)
+        if self.loaded:
+            index = self._index(entries)
+            with self._lock:
+                self._store.put_many(index)
+                self._missing.difference_update(index)
+                if self._writes is not None:
+                    self._writes.append(("put", index))
+        return response
+
+    def delete_entries(self, keys: Iterable[Any]) -> Any:
+        """Delete entries remotely and from the replica."""
+        keys = [str(key) for key in keys]
+        response = self.client.lookups.delete_entries(self.data_map_id, keys)
+        with self._lock:
+            self._store.delete_many(keys)
+            self._missing.update(keys)
+            if self._writes is not None:
+                self._writes.append(("delete", keys))
+        return response
+
+    def invalidate(self, keys: Optional[Iterable[Any]] = None) -> None:
+        """
+        Forget entries so the next read fetches them again.
+
+        Without ``keys`` the whole replica is marked stale and reloaded on
+        the next read.
+        """
+        with self._lock:
+            if keys is None:
+                self._loaded_at = None
+                return
+            keys = [str(key) for key in keys]
+            self._store.delete_many(keys)
+            self._missing.difference_update(keys)
+            if self._writes is not None:
+                self._writes.append(("delete", keys))
+
+    def close(self) -> None:
+        """Release the key index."""
+        with self._lock:
+            self._store.close()
+
+    def __enter__(self) -> "LookupReplica":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _ensure_fresh(self) -> None:
+        if not self._stale():
+            return
+        # One thread reloads; meanwhile the others keep reading the previous
+        # copy, or wait for the first one when there is none yet
+        if not self._load_lock.acquire(blocking=self._loaded_at is None):
+            return
+        try:
+            if self._stale():
+                self._reload()
+        finally:
+            self._load_lock.release()
+
+    def _reload(self) -> int:
+        if self.key_field is None:
+            self.key_field = self.client.lookups.get(self.data_map_id).map_primary_key
+        with self._lock:
+            self._writes = []
+        try:
+            entries = self.client.lookups.get_entries(self.data_map_id, "*") or []
+            with self._lock:
+                staged = self._store.staging()
+            for start in range(0, len(entries), _LOAD_BATCH):
+                batch = self._index(entries[start : start + _LOAD_BATCH])
+                with self._lock:
+                    staged.put_many(batch)
+            del entries
+            with self._lock:
+                for op, arg in self._writes:
+                    if op == "put":
+                        staged.put_many(arg)
+                    else:
+                        staged.delete_many(arg)
+                count = len(staged)
+                self._store.swap(staged)
+                self._missing = set()
+                self._loaded_at = self._clock()
+        finally:
+            with self._lock:
+                self._writes = None
+        return count
+
+    def _stale(self) -> bool:
+        with self._lock:
+            return self._loaded_at is None or (
+                self.ttl is not None and self._clock() - self._loaded_at >= self.ttl
+            )
+
+    def _index(self, entries: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        return {
+            str(entry[self.key_field]): entry
+            for entry in entries
+            if isinstance(entry, dict) and entry.get(self.key_field) is not None
+        }
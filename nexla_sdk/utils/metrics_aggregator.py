@@ -0,0 +1,346 @@
+"""
+Concurrent flow metrics aggregation into columnar time series.
+
+``FlowsResource.get_metrics`` returns one page of untyped metric rows for one
+resource. ``MetricsAggregator`` fetches every page for many resources on the
+client's shared pool and turns the rows into ``MetricsSeries`` columns
+(records, size, errors keyed by runId or date) with vectorized rollups.
+
+Columns are NumPy arrays when NumPy is installed (``pip install
+"nexla-sdk[metrics]"``); otherwise the same API is served from plain lists.
+"""
+
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from nexla_sdk.models.flows.responses import FlowMetricsApiResponse
+
+# Guard against missing NumPy installation
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+
+    _numpy_available = True
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+    _numpy_available = False
+
+METRIC_COLUMNS = ("records", "size", "errors")
+
+ResourceKey = Tuple[str, int]
+
+# Row fields that identify the group a metric row belongs to
+_KEY_FIELDS = {
+    "runId": ("runId", "run_id"),
+    "run_id": ("runId", "run_id"),
+}
+_DATE_FIELDS = ("reporting_date", "reportingDate", "date", "lastWritten")
+
+
+def is_numpy_available() -> bool:
+    """Whether metric columns are NumPy arrays."""
+    return _numpy_available
+
+
+class MetricsSeries:
+    """
+    Metric columns for one resource (or a combination), ordered by key.
+
+    Attributes:
+        keys: runIds or dates, one per row
+        records: Records processed per row
+        size: Bytes processed per row
+        errors: Errors per row
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[Any],
+        records: Sequence[float],
+        size: Sequence[float],
+        errors: Sequence[float],
+    ):
+        self.keys = list(keys)
+        self.records = _array(records)
+        self.size = _array(size)
+        self.errors = _array(errors)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[Any, Dict[str, Any]]]) -> "MetricsSeries":
+        """Build a series from ``(key, row)`` pairs, summing rows sharing a key."""
+        sums: Dict[Any, List[float]] = {}
+        for key, row in rows:
+            values = sums.setdefault(key, [0, 0, 0])
+            for i, column in enumerate(METRIC_COLUMNS):
+                values[i] += row.get(column) or 0
+        keys = sorted(sums, key=_sort_key)
+        return cls(
+            keys,
+            [sums[k][0] for k in keys],
+            [sums[k][1] for k in keys],
+            [sums[k][2] for k in keys],
+        )
+
+    @classmethod
+    def combine(cls, series: Iterable["MetricsSeries"]) -> "MetricsSeries":
+        """Sum several series key by key."""
+        return cls.from_rows(
+            (key, dict(zip(METRIC_COLUMNS, values)))
+            for s in series
+            for key, values in zip(s.keys, zip(s.records, s.size, s.errors))
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def column(self, name: str) -> Any:
+        """Return a metric column by name (records, size or errors)."""
+        if name not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric column: {name}")
+        return getattr(self, name)
+
+    def totals(self) -> Dict[str, float]:
+        """Sum of each metric column."""
+        return {name: _sum(self.column(name)) for name in METRIC_COLUMNS}
+
+    def error_rates(self) -> Any:
+        """Errors per record for each row (0 where no records were processed)."""
+        return _divide(self.errors, self.records)
+
+    def error_rate(self) -> float:
+        """Errors per record across the whole series."""
+        totals = self.totals()
+        return totals["errors"] / totals["records"] if totals["records"] else 0.0
+
+    def percentile(self, column: str, q: float) -> float:
+        """Percentile ``q`` (0-100) of a column, linearly interpolated."""
+        return _percentile(self.column(column), q)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate rows as dictionaries."""
+        for i, key in enumerate(self.keys):
+            yield {
+                "key": key,
+                "records": self.records[i],
+                "size": self.size[i],
+                "errors": self.errors[i],
+            }
+
+    def __repr__(self) -> str:
+        return f"MetricsSeries(rows={len(self)}, totals={self.totals()})"
+
+
+class MetricsReport:
+    """
+    Per-resource metric series returned by MetricsAggregator.fetch().
+
+    Attributes:
+        series: Series per ``(resource_type, resource_id)``
+        errors: ``((resource_type, resource_id), exception)`` for resources
+            whose metrics could not be fetched
+    """
+
+    def __init__(
+        self,
+        series: Dict[ResourceKey, MetricsSeries],
+        errors: Optional[List[Tuple[ResourceKey, BaseException]]] = None,
+    ):
+        self.series = series
+        self.errors = errors or []
+
+    def combined(self) -> MetricsSeries:
+        """All resources summed per runId or date."""
+        return MetricsSeries.combine(self.series.values())
+
+    def totals(self) -> Dict[ResourceKey, Dict[str, float]]:
+        """Column totals per resource."""
+        return {key: s.totals() for key, s in self.series.items()}
+
+    def percentiles(
+        self, column: str = "records", q: Sequence[float] = (50, 90, 99)
+    ) -> Dict[float, float]:
+        """Percentiles of per-resource totals of a column."""
+        values = _array([s.totals()[column] for s in self.series.values()])
+        return {p: _percentile(values, p) for p in q}
+
+    def top(self, column: str = "errors", n: int = 10) -> List[ResourceKey]:
+        """Resources with the largest totals of a column."""
+        totals = self.totals()
+        return sorted(totals, key=lambda key: totals[key][column], reverse=True)[:n]
+
+
+class MetricsAggregator:
+    """
+    Fetch flow metrics for many resources concurrently.
+
+    All first pages are requested at once, then every remaining page, all on
+    the client's shared fan-out pool.
+
+    Args:
+        client: NexlaClient used for API calls
+        concurrency: Maximum requests in flight
+        per_page: Rows requested per page
+
+    Examples:
+        aggregator = MetricsAggregator(client, concurrency=16)
+        report = aggregator.fetch(
+            [("data_sources", 5023), ("data_sinks", 5029)],
+            from_date="2024-01-01",
+            to_date="2024-01-07",
+        )
+        weekly = report.combined()
+        print(weekly.totals(), weekly.error_rate(), weekly.percentile("records", 95))
+    """
+
+    def __init__(self, client, concurrency: Optional[int] = None, per_page: int = 100):
+        self.client = client
+        self.concurrency = concurrency
+        self.per_page = per_page
+
+    def fetch(
+        self,
+        resources: Iterable[ResourceKey],
+        from_date: str,
+        to_date: Optional[str] = None,
+        groupby: str = "runId",
+    ) -> MetricsReport:
+        """
+        Fetch and aggregate metrics for ``(resource_type, resource_id)`` pairs.
+
+        Args:
+            resources: Resources to fetch
+            from_date: Start date (ISO format, e.g. '2024-01-17')
+            to_date: End date (ISO format)
+            groupby: Group rows by 'runId' or by date
+
+        Returns:
+            MetricsReport with one series per resource that could be fetched
+        """
+        resources = list(dict.fromkeys(resources))
+        rows: Dict[ResourceKey, List[Tuple[Any, Dict[str, Any]]]] = {
+            key: [] for key in resources
+        }
+        failed: Dict[ResourceKey, BaseException] = {}
+
+        def fetch_page(task: Tuple[ResourceKey, int]) -> Tuple[Any, int]:
+            (resource_type, resource_id), page = task
+            response = self.client.flows.get_metrics(
+                resource_type,
+                resource_id,
+                from_date,
+                to_date=to_date,
+                groupby=groupby,
+                page=page,
+                per_page=self.per_page,
+            )
+            return response, _page_count(response)
+
+        first_pages = [(key, 1) for key in resources]
+        remaining: List[Tuple[ResourceKey, int]] = []
+        for task, outcome in zip(first_pages, self._map(fetch_page, first_pages)):
+            key = task[0]
+            if isinstance(outcome, BaseException):
+                failed[key] = outcome
+                continue
+            response, page_count = outcome
+            rows[key].extend(_metric_rows(response, groupby))
+            remaining.extend((key, page) for page in range(2, page_count + 1))
+
+        for task, outcome in zip(remaining, self._map(fetch_page, remaining)):
+            key = task[0]
+            if key in failed:
+                continue
+            if isinstance(outcome, BaseException):
+                failed[key] = outcome
+                continue
+            rows[key].extend(_metric_rows(outcome[0], groupby))
+
+        series = {
+            key: MetricsSeries.from_rows(key_rows)
+            for key, key_rows in rows.items()
+            if key not in failed
+        }
+        return MetricsReport(series, list(failed.items()))
+
+    def _map(self, fn, tasks: List[Any]) -> Iterator[Any]:
+        return self.client.map(
+            fn, tasks, concurrency=self.concurrency, return_exceptions=True
+        )
+
+
+def _page_count(response: Union[FlowMetricsApiResponse, Dict[str, Any]]) -> int:
+    if isinstance(response, FlowMetricsApiResponse):
+        meta = response.metrics.meta if response.metrics else None
+        return (meta.page_count if meta else None) or 1
+    meta = (response.get("metrics") or {}).get("meta") or {}
+    return meta.get("pageCount") or meta.get("page_count") or 1
+
+
+def _metric_rows(
+    response: Union[FlowMetricsApiResponse, Dict[str, Any]], groupby: str
+) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """Extract ``(key, row)`` pairs from a get_metrics() response."""
+    if isinstance(response, FlowMetricsApiResponse):
+        data = response.metrics.data if response.metrics else None
+    else:
+        data = (response.get("metrics") or {}).get("data")
+    key_fields = _KEY_FIELDS.get(groupby, (groupby,) + _DATE_FIELDS)
+    yield from _walk_rows(data, None, key_fields)
+
+
+def _walk_rows(
+    data: Any, parent_key: Any, key_fields: Sequence[str]
+) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _walk_rows(item, parent_key, key_fields)
+    elif isinstance(data, dict):
+        if any(column in data for column in METRIC_COLUMNS):
+            key = next(
+                (data[f] for f in key_fields if data.get(f) is not None), parent_key
+            )
+            yield key, data
+        else:
+            for key, value in data.items():
+                yield from _walk_rows(value, key, key_fields)
+
+
+def _sort_key(key: Any) -> Tuple[int, Any]:
+    if isinstance(key, (int, float)):
+        return (0, key)
+    if isinstance(key, str) and key.isdigit():
+        return (0, int(key))
+    return (1, str(key))
+
+
+# Backend helpers: NumPy when available, plain Python otherwise
+
+
+def _array(values: Sequence[float]) -> Any:
+    if _numpy_available:
+        return np.asarray(values, dtype=float)
+    return [float(v) for v in values]
+
+
+def _sum(values: Any) -> float:
+    if _numpy_available:
+        return float(np.sum(values))
+    return float(math.fsum(values))
+
+
+def _divide(numerators: Any, denominators: Any) -> Any:
+    if _numpy_available:
+        out = np.zeros_like(numerators, dtype=float)
+        return np.divide(numerators, denominators, out=out, where=denominators != 0)
+    return [n / d if d else 0.0 for n, d in zip(numerators, denominators)]
+
+
+def _percentile(values: Any, q: float) -> float:
+    if len(values) == 0:
+        return 0.0
+    if _numpy_available:
+        return float(np.percentile(values, q))
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
@@ -0,0 +1,369 @@
+"""
+Local incremental store for resource metrics.
+
+Daily metrics for past days and the metrics of finished runs do not change,
+so ``MetricsStore`` keeps them in a SQLite database and only asks the API for
+what it does not hold yet: days never fetched plus the most recent days, and
+run summary pages until it reaches runs it already has.
+"""
+
+import datetime as dt
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from nexla_sdk.models.metrics.responses import ResourceMetricDaily, ResourceMetricsByRun
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_metrics (
+    resource_type TEXT NOT NULL,
+    resource_id INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    records INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    PRIMARY KEY (resource_type, resource_id, day)
+);
+CREATE TABLE IF NOT EXISTS daily_coverage (
+    resource_type TEXT NOT NULL,
+    resource_id INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    PRIMARY KEY (resource_type, resource_id, day)
+);
+CREATE TABLE IF NOT EXISTS run_metrics (
+    resource_type TEXT NOT NULL,
+    resource_id INTEGER NOT NULL,
+    run_id INTEGER NOT NULL,
+    data_set_id INTEGER NOT NULL,
+    last_written INTEGER,
+    records INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    PRIMARY KEY (resource_type, resource_id, run_id, data_set_id)
+);
+"""
+
+
+def default_cache_dir() -> str:
+    """Directory used for SDK caches (``$NEXLA_CACHE_DIR`` or ``~/.cache/nexla_sdk``)."""
+    configured = os.environ.get("NEXLA_CACHE_DIR")
+    if configured:
+        return configured
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "nexla_sdk")
+
+
+class MetricsStore:
+    """
+    SQLite-backed cache answering metrics range queries locally.
+
+    Args:
+        client: NexlaClient used to fetch missing data
+        path: Database file, or ":memory:"; defaults to ``metrics.sqlite``
+            in default_cache_dir()
+        refresh_days: Most recent days (including today, at least one) that
+            are always re-fetched because they may still change; they are
+            only cached as final once they fall out of this window
+        concurrency: Maximum gap ranges fetched at once
+
+    Examples:
+        with MetricsStore(client) as store:
+            days = store.daily_metrics("data_sources", 5023, "2024-01-01", "2024-03-31")
+            runs = store.metrics_by_run("data_sources", 5023)
+    """
+
+    def __init__(
+        self,
+        client,
+        path: Optional[str] = None,
+        refresh_days: int = 1,
+        concurrency: Optional[int] = None,
+    ):
+        if path is None:
+            cache_dir = default_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)
+            path = os.path.join(cache_dir, "metrics.sqlite")
+        self.client = client
+        self.path = path
+        self.refresh_days = refresh_days
+        self.concurrency = concurrency
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    # Daily metrics
+
+    def daily_metrics(
+        self,
+        resource_type: str,
+        resource_id: int,
+        from_date: str,
+        to_date: Optional[str] = None,
+    ) -> List[ResourceMetricDaily]:
+        """
+        Daily metrics for a date range, fetching only days not held locally.
+
+        Args:
+            resource_type: Type of resource (data_sources, data_sets, data_sinks)
+            resource_id: Resource ID
+            from_date: Start date (YYYY-MM-DD)
+            to_date: End date (YYYY-MM-DD, inclusive); defaults to today (UTC)
+
+        Returns:
+            One entry per day that has metrics, in date order
+        """
+        today = dt.datetime.now(dt.timezone.utc).date()
+        start = dt.date.fromisoformat(from_date[:10])
+        end = dt.date.fromisoformat(to_date[:10]) if to_date else today
+        self.sync_daily(resource_type, resource_id, start, end, today)
+
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT day, records, size, errors FROM daily_metrics "
+                "WHERE resource_type = ? AND resource_id = ? AND day BETWEEN ? AND ? "
+                "ORDER BY day",
+                (resource_type, resource_id, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [
+            ResourceMetricDaily(time=day, records=records, size=size, errors=errors)
+            for day, records, size, errors in rows
+        ]
+
+    def sync_daily(
+        self,
+        resource_type: str,
+        resource_id: int,
+        start: dt.date,
+        end: dt.date,
+        today: Optional[dt.date] = None,
+    ) -> List[Tuple[dt.date, dt.date]]:
+        """
+        Fetch the missing and recent days of ``[start, end]``.
+
+        Returns:
+            The date ranges that were requested from the API
+        """
+        today = today or dt.datetime.now(dt.timezone.utc).date()
+        # Today and the other recent days may still change: they are always
+        # re-fetched and never recorded as covered
+        recent = today - dt.timedelta(days=max(self.refresh_days, 1) - 1)
+        with self._lock:
+            covered = {
+                row[0]
+                for row in self._db.execute(
+                    "SELECT day FROM daily_coverage "
+                    "WHERE resource_type = ? AND resource_id = ? AND day BETWEEN ? AND ?",
+                    (resource_type, resource_id, start.isoformat(), end.isoformat()),
+                )
+            }
+        missing = [
+            day
+            for day in _days(start, end)
+            if day.isoformat() not in covered or day >= recent
+        ]
+        gaps = _ranges(missing)
+
+        def fetch(gap: Tuple[dt.date, dt.date]) -> List[Any]:
+            response = self.client.metrics.get_resource_daily_metrics(
+                resource_type,
+                resource_id,
+                from_date=gap[0].isoformat(),
+                to_date=gap[1].isoformat(),
+            )
+            return response.metrics
+
+        for gap, metrics in zip(
+            gaps, self.client.map(fetch, gaps, concurrency=self.concurrency)
+        ):
+            self._store_daily(resource_type, resource_id, gap, metrics, recent)
+        return gaps
+
+    def _store_daily(
+        self,
+        resource_type: str,
+        resource_id: int,
+        gap: Tuple[dt.date, dt.date],
+        metrics: List[Any],
+        recent: dt.date,
+    ) -> None:
+        key = (resource_type, resource_id)
+        low, high = gap[0].isoformat(), gap[1].isoformat()
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM daily_metrics WHERE resource_type = ? AND resource_id = ? "
+                "AND day BETWEEN ? AND ?",
+                key + (low, high),
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO daily_metrics VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    key
+                    + (
+                        str(row["time"])[:10],
+                        row.get("records") or 0,
+                        row.get("size") or 0,
+                        row.get("errors") or 0,
+                    )
+                    for row in metrics
+                    if isinstance(row, dict) and row.get("time")
+                ],
+            )
+            settled = min(gap[1], recent - dt.timedelta(days=1))
+            self._db.executemany(
+                "INSERT OR IGNORE INTO daily_coverage VALUES (?, ?, ?)",
+                [key + (day.isoformat(),) for day in _days(gap[0], settled)],
+            )
+
+    # Metrics by run
+
+    def metrics_by_run(
+        self, resource_type: str, resource_id: int, page_size: int = 100
+    ) -> List[ResourceMetricsByRun]:
+        """
+        Metrics for every run of a resource, fetching only new or changed runs.
+
+        Returns:
+            Run metrics ordered by runId
+        """
+        self.sync_runs(resource_type, resource_id, page_size=page_size)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT run_id, last_written, data_set_id, records, size, errors "
+                "FROM run_metrics WHERE resource_type = ? AND resource_id = ? "
+                "ORDER BY run_id, data_set_id",
+                (resource_type, resource_id),
+            ).fetchall()
+        return [
+            ResourceMetricsByRun(
+                runId=run_id,
+                lastWritten=last_written,
+                dataSetId=data_set_id,
+                records=records,
+                size=size,
+                errors=errors,
+            )
+            for run_id, last_written, data_set_id, records, size, errors in rows
+        ]
+
+    def sync_runs(
+        self, resource_type: str, resource_id: int, page_size: int = 100
+    ) -> int:
+        """
+        Page through run summaries newest first until reaching known runs.
+
+        Paging stops at the first page whose runs are all held unchanged,
+        provided the API returned that page newest first; otherwise every page
+        is read so no new run can be missed.
+
+        Returns:
+            Number of pages fetched
+        """
+        key = (resource_type, resource_id)
+        page = 1
+        while True:
+            response = self.client.metrics.get_resource_metrics_by_run(
+                resource_type,
+                resource_id,
+                groupby="runId",
+                orderby="lastWritten",
+                page=page,
+                size=page_size,
+            )
+            data = response.metrics.get("data") or []
+            rows = [_run_row(row) for row in data if isinstance(row, dict)]
+            rows = [row for row in rows if row is not None]
+            if not rows:
+                return page
+            unchanged = self._store_runs(key, rows)
+            written = [row[1] for row in rows if row[1] is not None]
+            newest_first = written == sorted(written, reverse=True)
+            meta = response.metrics.get("meta") or {}
+            page_count = meta.get("pageCount") or meta.get("page_count")
+            if (unchanged and newest_first) or (page_count and page >= page_count):
+                return page
+            if len(rows) < page_size and not page_count:
+                return page
+            page += 1
+
+    def _store_runs(self, key: Tuple[str, int], rows: List[Tuple]) -> bool:
+        """Upsert run rows; return True if every row was already held as-is."""
+        with self._lock, self._db:
+            unchanged = True
+            for row in rows:
+                held = self._db.execute(
+                    "SELECT last_written, records, size, errors FROM run_metrics "
+                    "WHERE resource_type = ? AND resource_id = ? AND run_id = ? "
+                    "AND data_set_id = ?",
+                    key + (row[0], row[2]),
+                ).fetchone()
+                if held != (row[1],) + row[3:]:
+                    unchanged = False
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO run_metrics "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        key + (row[0], row[2], row[1]) + row[3:],
+                    )
+            return unchanged
+
+    # Maintenance
+
+    def invalidate(
+        self, resource_type: Optional[str] = None, resource_id: Optional[int] = None
+    ) -> None:
+        """Forget stored metrics, for one resource or everything."""
+        clause, params = "", ()
+        if resource_type is not None:
+            clause, params = " WHERE resource_type = ?", (resource_type,)
+            if resource_id is not None:
+                clause += " AND resource_id = ?"
+                params += (resource_id,)
+        with self._lock, self._db:
+            for table in ("daily_metrics", "daily_coverage", "run_metrics"):
+                self._db.execute(f"DELETE FROM {table}{clause}", params)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "MetricsStore":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def _days(start: dt.date, end: dt.date) -> Iterator[dt.date]:
+    day = start
+    while day <= end:
+        yield day
+        day += dt.timedelta(days=1)
+
+
+def _ranges(days: List[dt.date]) -> List[Tuple[dt.date, dt.date]]:
+    """Group sorted days into contiguous ``(first, last)`` ranges."""
+    ranges: List[Tuple[dt.date, dt.date]] = []
+    for day in days:
+        if ranges and day - ranges[-1][1] == dt.timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+def _run_row(row: Dict[str, Any]) -> Optional[Tuple]:
+    """Normalize a run summary row to (run_id, last_written, data_set_id, r, s, e)."""
+    run_id = row.get("runId", row.get("run_id"))
+    if run_id is None:
+        return None
+    return (
+        run_id,
+        row.get("lastWritten", row.get("last_written")),
+        row.get("dataSetId", row.get("data_set_id")) or 0,
+        row.get("records") or 0,
+        row.get("size") or 0,
+        row.get("errors") or 0,
+    )
@@ -0,0 +1,362 @@
+"""
+Organization dashboard aggregation.
+
+An org overview needs the dashboard, account and daily metrics of every
+member plus the org's account summary and flow account metrics.
+``OrgDashboard`` issues all of those calls at once on the client's shared
+pool, keeps per-user results in a TTL cache and merges everything into an
+``OrgDashboardSummary`` whose per-user metrics are ``MetricsSeries`` columns.
+"""
+
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pydantic import Field
+
+from nexla_sdk.models.base import BaseModel
+from nexla_sdk.models.organizations.responses import AccountSummary
+from nexla_sdk.utils.metrics_aggregator import METRIC_COLUMNS, MetricsSeries
+
+_DATE_FIELDS = ("time", "date", "reporting_date", "reportingDate")
+
+
+class UserDashboard(BaseModel):
+    """Raw dashboard, account and daily metrics for one user."""
+
+    user_id: int
+    dashboard: Dict[str, Any] = Field(default_factory=dict)
+    account_metrics: Dict[str, Any] = Field(default_factory=dict)
+    daily_metrics: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    fetched_at: float = 0.0
+
+
+class OrgDashboardSummary:
+    """
+    Merged org overview returned by OrgDashboard.summary().
+
+    Attributes:
+        org_id: Organization ID
+        account_summary: Org account summary, if it could be fetched
+        flow_account_metrics: Org flow account metrics, if they could be fetched
+        users: Per-user raw results, by user ID
+        last_24h: Dashboard (24 hour) records, size and errors keyed by user ID
+        account: Account metrics for the requested range keyed by user ID
+        daily: Org-wide daily metrics per resource type (SOURCE, SINK) keyed by date
+        statuses: Count of dashboard resource statuses (OK, WARNING, ERROR)
+            per user ID
+        errors: Failed calls, keyed ``"<user_id|org>/<call>"``
+        cached_users: IDs of users served from the cache
+    """
+
+    def __init__(
+        self,
+        org_id: int,
+        users: Dict[int, UserDashboard],
+        account_summary: Optional[AccountSummary] = None,
+        flow_account_metrics: Optional[Dict[str, Any]] = None,
+        errors: Optional[Dict[str, str]] = None,
+        cached_users: Sequence[int] = (),
+    ):
+        self.org_id = org_id
+        self.users = users
+        self.account_summary = account_summary
+        self.flow_account_metrics = flow_account_metrics
+        self.errors = errors or {}
+        self.cached_users = list(cached_users)
+
+        user_ids = sorted(users)
+        self.last_24h = _user_series(user_ids, [users[u].dashboard for u in user_ids])
+        self.account = _user_series(
+            user_ids, [users[u].account_metrics for u in user_ids]
+        )
+        resource_types = sorted({t for u in users.values() for t in u.daily_metrics})
+        self.daily = {
+            resource_type: MetricsSeries.from_rows(
+                (_date_key(row), row)
+                for user in users.values()
+                for row in _metric_rows(user.daily_metrics.get(resource_type))
+            )
+            for resource_type in resource_types
+        }
+        self.statuses = {
+            user_id: _status_counts(users[user_id].dashboard) for user_id in user_ids
+        }
+
+    @property
+    def user_ids(self) -> List[int]:
+        return list(self.last_24h.keys)
+
+    def totals(self) -> Dict[str, float]:
+        """Org-wide 24 hour records, size and errors."""
+        return self.last_24h.totals()
+
+    def top(
+        self, column: str = "errors", n: int = 10, window: str = "24h"
+    ) -> List[int]:
+        """User IDs with the largest values of a column ('24h' or 'account' window)."""
+        series = self.last_24h if window == "24h" else self.account
+        values = series.column(column)
+        ranked = sorted(range(len(series)), key=lambda i: values[i], reverse=True)
+        return [series.keys[i] for i in ranked[:n]]
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """One flat row per user, for tables and exports."""
+        for i, user_id in enumerate(self.last_24h.keys):
+            row: Dict[str, Any] = {"user_id": user_id}
+            for column in METRIC_COLUMNS:
+                row[f"{column}_24h"] = self.last_24h.column(column)[i]
+                row[column] = self.account.column(column)[i]
+            row.update(self.statuses[user_id])
+            yield row
+
+    def __repr__(self) -> str:
+        return (
+            f"OrgDashboardSummary(org_id={self.org_id}, users={len(self.users)}, "
+            f"errors={len(self.errors)})"
+        )
+
+
+class OrgDashboard:
+    """
+    Concurrent org dashboard aggregator with a per-user TTL cache.
+
+    Args:
+        client: NexlaClient used for API calls
+        ttl: Seconds a user's results are reused (0 disables caching)
+        concurrency: Maximum requests in flight
+        daily_resource_types: Resource types fetched with get_daily_metrics
+        clock: Time source for cache expiry
+
+    Examples:
+        dashboard = OrgDashboard(client, ttl=300, concurrency=32)
+        summary = dashboard.summary(org_id, from_date="2024-01-01")
+        print(summary.totals(), summary.top("errors", n=5))
+        for row in summary.rows():
+            print(row)
+    """
+
+    def __init__(
+        self,
+        client,
+        ttl: float = 300.0,
+        concurrency: Optional[int] = None,
+        daily_resource_types: Sequence[str] = ("SOURCE", "SINK"),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.daily_resource_types = [
+            getattr(t, "value", t) for t in daily_resource_types
+        ]
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple, UserDashboard] = {}
+
+    def summary(
+        self,
+        org_id: int,
+        from_date: str,
+        to_date: Optional[str] = None,
+        user_ids: Optional[Iterable[int]] = None,
+        access_role: Optional[str] = None,
+    ) -> OrgDashboardSummary:
+        """
+        Fetch and merge the org overview.
+
+        Args:
+            org_id: Organization ID
+            from_date: Start date (YYYY-MM-DD) for account and daily metrics
+            to_date: End date (optional)
+            user_ids: Users to include; defaults to the org's members
+            access_role: Access role filter for dashboard metrics
+
+        Returns:
+            OrgDashboardSummary; failed calls are listed in ``errors``
+        """
+        if user_ids is None:
+            user_ids = [m.id for m in self.client.organizations.get_members(org_id)]
+        user_ids = list(dict.fromkeys(user_ids))
+
+        users: Dict[int, UserDashboard] = {}
+        cached: List[int] = []
+        missing: List[int] = []
+        for user_id in user_ids:
+            key = (user_id, org_id, from_date, to_date, access_role)
+            entry = self._cached(key)
+            if entry is not None:
+                users[user_id] = entry
+                cached.append(user_id)
+            else:
+                missing.append(user_id)
+
+        calls: List[Tuple[str, str, Callable[[], Any]]] = [
+            (
+                "org",
+                "account_summary",
+                lambda: self.client.organizations.get_account_summary(org_id),
+            ),
+            (
+                "org",
+                "flow_account_metrics",
+                lambda: self.client.organizations.get_org_flow_account_metrics(
+                    org_id, from_date, to_date
+                ),
+            ),
+        ]
+        for user_id in missing:
+            calls.extend(
+                self._user_calls(user_id, org_id, from_date, to_date, access_role)
+            )
+
+        outcomes = self.client.map(
+            lambda call: call[2](),
+            calls,
+            concurrency=self.concurrency,
+            return_exceptions=True,
+        )
+        results: Dict[Tuple[str, str], Any] = {}
+        errors: Dict[str, str] = {}
+        for (owner, name, _), outcome in zip(calls, outcomes):
+            if isinstance(outcome, BaseException):
+                errors[f"{owner}/{name}"] = str(outcome)
+            else:
+                results[(owner, name)] = outcome
+
+        now = self._clock()
+        for user_id in missing:
+            owner = str(user_id)
+            user = UserDashboard(
+                user_id=user_id,
+                dashboard=results.get((owner, "dashboard")) or {},
+                account_metrics=results.get((owner, "account_metrics")) or {},
+                daily_metrics={
+                    t: results[(owner, f"daily_metrics:{t}")]
+                    for t in self.daily_resource_types
+                    if (owner, f"daily_metrics:{t}") in results
+                },
+                fetched_at=now,
+            )
+            users[user_id] = user
+            if not any(error.startswith(f"{owner}/") for error in errors):
+                self._store((user_id, org_id, from_date, to_date, access_role), user)
+
+        return OrgDashboardSummary(
+            org_id,
+            users,
+            account_summary=results.get(("org", "account_summary")),
+            flow_account_metrics=results.get(("org", "flow_account_metrics")),
+            errors=errors,
+            cached_users=cached,
+        )
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop cached results, for one user or everyone."""
+        with self._lock:
+            if user_id is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[0] == user_id]:
+                    del self._cache[key]
+
+    def _user_calls(
+        self,
+        user_id: int,
+        org_id: int,
+        from_date: str,
+        to_date: Optional[str],
+        access_role: Optional[str],
+    ) -> List[Tuple[str, str, Callable[[], Any]]]:
+        users = self.client.users
+        owner = str(user_id)
+        calls = [
+            (
+                owner,
+                "dashboard",
+                lambda: users.get_dashboard_metrics(user_id, access_role=access_role),
+            ),
+            (
+                owner,
+                "account_metrics",
+                lambda: users.get_account_metrics(
+                    user_id, from_date, to_date=to_date, org_id=org_id
+                ),
+            ),
+        ]
+        for resource_type in self.daily_resource_types:
+            calls.append(
+                (
+                    owner,
+                    f"daily_metrics:{resource_type}",
+                    lambda t=resource_type: users.get_daily_metrics(
+                        user_id, t, from_date, to_date=to_date, org_id=org_id
+                    ),
+                )
+            )
+        return calls
+
+    def _cached(self, key: Tuple) -> Optional[UserDashboard]:
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if self._clock() - entry.fetched_at >= self.ttl:
+                del self._cache[key]
+                return None
+            return entry
+
+    def _store(self, key: Tuple, entry: UserDashboard) -> None:
+        if self.ttl > 0:
+            with self._lock:
+                self._cache[key] = entry
+
+
+def _metric_rows(data: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every dict carrying records, size or errors within a response."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _metric_rows(item)
+    elif isinstance(data, dict):
+        if any(column in data for column in METRIC_COLUMNS):
+            yield data
+        else:
+            for value in data.values():
+                yield from _metric_rows(value)
+
+
+def _user_series(user_ids: List[int], responses: List[Dict[str, Any]]) -> MetricsSeries:
+    sums = [
+        [
+            sum(row.get(c) or 0 for row in _metric_rows(r.get("metrics")))
+            for r in responses
+        ]
+        for c in METRIC_COLUMNS
+    ]
+    return MetricsSeries(user_ids, *sums)
+
+
+def _date_key(row: Dict[str, Any]) -> Any:
+    value = next((row[f] for f in _DATE_FIELDS if row.get(f) is not None), None)
+    return str(value)[:10] if value is not None else None
+
+
+def _status_counts(response: Dict[str, Any]) -> Dict[str, int]:
+    counts = {"OK": 0, "WARNING": 0, "ERROR": 0}
+    for row in _metric_rows(response.get("metrics")):
+        status = row.get("status")
+        if isinstance(status, str):
+            counts[status.upper()] = counts.get(status.upper(), 0) + 1
+    return counts
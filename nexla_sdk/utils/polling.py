@@ -0,0 +1,53 @@
+"""Adaptive polling intervals for status watchers."""
+
+import random
+from typing import Optional
+
+
+class AdaptivePoller:
+    """
+    Exponential polling intervals with jitter.
+
+    Each call to ``next_interval()`` grows the interval by ``factor`` up to
+    ``max_interval``; ``reset()`` drops it back to ``min_interval``, which
+    watchers do right after observing a change because related changes tend
+    to follow quickly. Jitter spreads the polls of many concurrent watchers
+    so they do not hit the API in lockstep.
+
+    Args:
+        min_interval: First and smallest interval, in seconds
+        max_interval: Largest interval, in seconds
+        factor: Growth factor applied after each quiet poll
+        jitter: Fraction of the interval randomized (0 disables jitter)
+        rng: Random generator used for jitter
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        factor: float = 2.0,
+        jitter: float = 0.2,
+        rng: Optional[random.Random] = None,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Require 0 < min_interval <= max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self._current = min_interval
+
+    def next_interval(self) -> float:
+        """Return the next interval to sleep and grow the base interval."""
+        base = self._current
+        self._current = min(self.max_interval, self._current * self.factor)
+        if not self.jitter:
+            return base
+        spread = base * self.jitter
+        return max(0.0, base - spread + self._rng.random() * 2 * spread)
+
+    def reset(self) -> None:
+        """Return to the minimum interval."""
+        self._current = self.min_interval
@@ -0,0 +1,269 @@
+"""
+Asyncio webhook sender.
+
+``AsyncWebhookSender`` lets one event loop drive many concurrent
+``send_many_records`` calls. Requests share a pool of keep-alive connections
+sized by ``max_connections``, each webhook URL gets its own concurrency
+limit so one slow endpoint cannot take every connection, and the auth
+header and query parameters are built once per sender rather than per call.
+Every batch reports its latency in the returned WebhookDelivery.
+
+With ``aiohttp`` installed (``pip install "nexla-sdk[async]"``) requests are
+non-blocking. Without it, or when the webhooks resource was given its own
+HTTP client (directly or through ``NexlaClient(http_client=...)``), they run
+on a dedicated thread pool over a requests session whose connection pool
+has ``max_connections`` slots.
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from nexla_sdk.deadlines import fits_deadline
+from nexla_sdk.exceptions import NexlaError, is_retryable_error
+from nexla_sdk.http_client import (
+    HttpClientError,
+    RequestsHttpClient,
+    no_transport_retries,
+)
+from nexla_sdk.models.webhooks.requests import WebhookSendOptions
+from nexla_sdk.models.webhooks.responses import WebhookDelivery, WebhookResponse
+from nexla_sdk.utils.polling import AdaptivePoller
+
+# Guard against missing aiohttp installation
+try:  # pragma: no cover - optional dependency
+    import aiohttp  # type: ignore
+
+    _aiohttp_available = True
+except Exception:  # pragma: no cover
+    aiohttp = None  # type: ignore
+    _aiohttp_available = False
+
+
+class AsyncWebhookSender:
+    """
+    Send record batches to webhooks concurrently from asyncio code.
+
+    A sender belongs to the event loop it is first used in.
+
+    Args:
+        webhooks: WebhooksResource providing the API key (and, optionally, a
+            custom HTTP client)
+        max_connections: Keep-alive connections shared by all webhooks
+        per_url_concurrency: Requests in flight per webhook URL
+        timeout: Seconds allowed per request
+        retries: Extra attempts for batches failing with a rate limit, server
+            or connection error
+        backoff: First retry delay in seconds (doubles per attempt)
+        options: Send options applied to every batch
+        auth_method: Webhook authentication method ("query" or "header")
+
+    Examples:
+        webhooks = client.create_webhook_client(api_key="your-api-key")
+        async with webhooks.async_sender(max_connections=200) as sender:
+            deliveries = await sender.send_all(
+                (webhook_url, batch) for batch in batches
+            )
+        slowest = max(d.latency for d in deliveries)
+    """
+
+    def __init__(
+        self,
+        webhooks,
+        max_connections: int = 100,
+        per_url_concurrency: int = 16,
+        timeout: float = 30.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        options: Optional[WebhookSendOptions] = None,
+        auth_method: str = "query",
+    ):
+        if max_connections < 1 or per_url_concurrency < 1:
+            raise ValueError("max_connections and per_url_concurrency must be positive")
+        self.webhooks = webhooks
+        self.max_connections = max_connections
+        self.per_url_concurrency = per_url_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._headers, self._params = webhooks._auth_material(options, auth_method)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._session = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._http_client = None
+        self._owns_http_client = False
+
+    @property
+    def uses_aiohttp(self) -> bool:
+        """Whether requests go through aiohttp rather than the thread pool."""
+        return _aiohttp_available and not self.webhooks._custom_http_client
+
+    async def send_many_records(
+        self, webhook_url: str, records: List[Dict[str, Any]]
+    ) -> WebhookDelivery:
+        """
+        Send one batch of records, waiting for a free slot for its URL.
+
+        Failures are reported in the returned delivery rather than raised.
+
+        Args:
+            webhook_url: Full URL of the Nexla webhook endpoint
+            records: JSON objects to send as records
+
+        Returns:
+            WebhookDelivery whose ``latency`` covers the request and any
+            retries, but not the wait for a slot
+        """
+        records = list(records)
+        body = json.dumps(records, separators=(",", ":"), default=str).encode()
+        poller = AdaptivePoller(self.backoff, self.backoff * 2 ** max(self.retries, 0))
+        attempts = 0
+        async with self._semaphore(webhook_url):
+            started = time.monotonic()
+            while True:
+                attempts += 1
+                try:
+                    response = await self._post(webhook_url, records, body)
+                except NexlaError as e:
+                    delay = poller.next_interval()
+                    if (
+                        attempts <= self.retries
+                        and is_retryable_error(e)
+                        and fits_deadline(delay)
+                    ):
+                        await asyncio.sleep(delay)
+                        continue
+                    return WebhookDelivery(
+                        webhook_url=webhook_url,
+                        records=len(records),
+                        bytes=len(body),
+                        success=False,
+                        attempts=attempts,
+                        error=str(e),
+                        latency=time.monotonic() - started,
+                    )
+                return WebhookDelivery(
+                    webhook_url=webhook_url,
+                    records=len(records),
+                    bytes=len(body),
+                    success=True,
+                    attempts=attempts,
+                    response=WebhookResponse.model_validate(response or {}),
+                    latency=time.monotonic() - started,
+                )
+
+    async def send_all(
+        self, batches: Iterable[Tuple[str, List[Dict[str, Any]]]]
+    ) -> List[WebhookDelivery]:
+        """
+        Send many ``(webhook_url, records)`` batches concurrently.
+
+        Returns:
+            One WebhookDelivery per batch, in input order
+        """
+        return list(
+            await asyncio.gather(
+                *(self.send_many_records(url, records) for url, records in batches)
+            )
+        )
+
+    async def close(self) -> None:
+        """Close pooled connections and stop the worker threads."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._owns_http_client:
+            self._http_client.session.close()
+        self._http_client = None
+        self._owns_http_client = False
+
+    async def __aenter__(self) -> "AsyncWebhookSender":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    def _semaphore(self, webhook_url: str) -> asyncio.Semaphore:
+        # Created inside the running loop so they bind to it
+        semaphore = self._semaphores.get(webhook_url)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_url_concurrency)
+            self._semaphores[webhook_url] = semaphore
+        return semaphore
+
+    async def _post(self, url: str, records: List[Dict[str, Any]], body: bytes) -> Any:
+        try:
+            if self.uses_aiohttp:
+                return await self._post_aiohttp(url, body)
+            return await self._post_threaded(url, records)
+        except NexlaError:
+            raise
+        except Exception as e:
+            raise NexlaError(
+                message=f"Webhook request failed: {e}",
+                operation="webhook_send",
+                context={"url": url, "method": "POST"},
+                original_error=e,
+            ) from e
+
+    async def _post_aiohttp(self, url: str, body: bytes) -> Any:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        async with self._session.post(
+            url, data=body, headers=self._headers, params=self._params
+        ) as response:
+            text = await response.text()
+            try:
+                payload = json.loads(text) if text else {}
+            except ValueError:
+                payload = {"raw_text": text}
+            if response.status >= 400:
+                raise HttpClientError(
+                    f"HTTP error {response.status}: {text[:200]}",
+                    status_code=response.status,
+                    response=payload if isinstance(payload, dict) else {},
+                    headers=dict(response.headers),
+                )
+            return payload
+
+    async def _post_threaded(self, url: str, records: List[Dict[str, Any]]) -> Any:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_connections, thread_name_prefix="nexla-webhook"
+            )
+            if self.webhooks._custom_http_client:
+                self._http_client = self.webhooks._http_client
+            else:
+                # Retries happen here, so the session should not retry too
+                self._http_client = RequestsHttpClient(
+                    timeout=self.timeout,
+                    max_retries=0,
+                    pool_maxsize=self.max_connections,
+                )
+                self._owns_http_client = True
+        call = functools.partial(
+            self._http_client.request,
+            method="POST",
+            url=url,
+            headers=self._headers,
+            params=self._params,
+            json=records,
+        )
+        # A caller-supplied client may retry on its own; attempts are
+        # retried in send_many_records instead
+        with no_transport_retries():
+            context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(context.run, call)
+        )
@@ -0,0 +1,466 @@
+"""
+Buffered, background webhook producer.
+
+``WebhooksResource.send_one_record`` costs one HTTP round trip per record.
+``WebhookProducer`` accepts records without waiting on the network, buffers
+them per webhook URL and a background thread ships each buffer through
+``send_many_records`` once it reaches ``batch_size`` records,
+``max_batch_bytes`` or has waited ``linger`` seconds, much like a Kafka
+producer. The number of records buffered or in flight is bounded, so a slow
+webhook pushes back on ``send()`` instead of growing memory.
+
+With a ``WebhookSpool``, each batch is written to disk before it is sent and
+acknowledged after the webhook accepts it. A spooled batch that still fails
+with a retryable error after its retries is resent in the background, with
+a backoff capped at ``max_redrive_interval``, for as long as the producer is
+open. Batches left unacknowledged by a crash or by closing the producer are
+sent again when a producer is next started on the same spool; batches the
+webhook rejects for good are moved to the spool's dead-letter file. A batch reaches the spool only when a
+worker picks it up: records still buffered or lingering in ``send()``'s
+buffer are in memory only and are lost if the process dies, so call
+``flush()`` where a durability point is needed.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from nexla_sdk.exceptions import BufferFullError, NexlaError, is_retryable_error
+from nexla_sdk.http_client import no_transport_retries
+from nexla_sdk.models.webhooks.requests import WebhookSendOptions
+from nexla_sdk.models.webhooks.responses import WebhookDelivery
+from nexla_sdk.utils.polling import AdaptivePoller
+from nexla_sdk.utils.webhook_spool import WebhookSpool
+
+logger = logging.getLogger(__name__)
+
+DeliveryCallback = Callable[[WebhookDelivery], Any]
+
+
+class _Batch:
+    """Records buffered for one webhook URL."""
+
+    __slots__ = ("url", "records", "callbacks", "bytes", "created", "seq", "poller")
+
+    def __init__(self, url: str, created: float):
+        self.url = url
+        self.records: List[Any] = []
+        self.callbacks: List[DeliveryCallback] = []
+        self.bytes = 0
+        self.created = created
+        # Spool sequence number once written to disk
+        self.seq: Optional[int] = None
+        # Backoff of a spooled batch being resent in the background
+        self.poller: Optional[AdaptivePoller] = None
+
+    def add(self, record: Any, size: int, callback: Optional[DeliveryCallback]):
+        self.records.append(record)
+        self.bytes += size
+        if callback is not None:
+            self.callbacks.append(callback)
+
+
+class WebhookProducer:
+    """
+    Batch records to webhooks in the background.
+
+    Args:
+        webhooks: WebhooksResource used to send batches
+        batch_size: Records per batch that trigger an immediate send
+        max_batch_bytes: Serialized bytes per batch that trigger a send
+        linger: Seconds a partial batch waits for more records
+        max_buffered_records: Records buffered or in flight before send()
+            blocks
+        max_block: Seconds send() blocks on a full buffer before raising
+            BufferFullError (None waits indefinitely, 0 never waits)
+        workers: Batches sent concurrently
+        retries: Extra attempts for batches failing with a rate limit, server
+            or connection error
+        backoff: First retry delay in seconds (doubles per attempt)
+        options: Send options applied to every batch
+        auth_method: Webhook authentication method ("query" or "header")
+        on_delivery: Called with a WebhookDelivery for every batch
+        spool: WebhookSpool that persists batches until delivered; its
+            unacknowledged batches are replayed first and rejected ones are
+            dead-lettered. Records are spooled when their batch is sent, not
+            on send(). The caller closes it.
+        max_redrive_interval: Longest wait, in seconds, between background
+            resends of a spooled batch that keeps failing with a retryable
+            error
+
+    Examples:
+        webhooks = client.create_webhook_client(api_key="your-api-key")
+        with webhooks.producer(batch_size=1000, linger=0.1) as producer:
+            for event in clickstream:
+                producer.send(webhook_url, event)
+        # leaving the block flushes and stops the producer
+    """
+
+    def __init__(
+        self,
+        webhooks,
+        batch_size: int = 500,
+        max_batch_bytes: int = 1024 * 1024,
+        linger: float = 0.05,
+        max_buffered_records: int = 100000,
+        max_block: Optional[float] = None,
+        workers: int = 4,
+        retries: int = 3,
+        backoff: float = 0.5,
+        options: Optional[WebhookSendOptions] = None,
+        auth_method: str = "query",
+        on_delivery: Optional[DeliveryCallback] = None,
+        spool: Optional[WebhookSpool] = None,
+        max_redrive_interval: float = 60.0,
+    ):
+        if batch_size < 1 or max_batch_bytes < 1 or max_buffered_records < 1:
+            raise ValueError(
+                "batch_size, max_batch_bytes and max_buffered_records must be positive"
+            )
+        self.webhooks = webhooks
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.linger = linger
+        self.max_buffered_records = max_buffered_records
+        self.max_block = max_block
+        self.retries = retries
+        self.backoff = backoff
+        self.options = options
+        self.auth_method = auth_method
+        self.on_delivery = on_delivery
+        self.spool = spool
+        self.max_redrive_interval = max_redrive_interval
+        self.delivered = 0
+        self.failed = 0
+
+        self._cond = threading.Condition()
+        self._open: Dict[str, _Batch] = {}
+        self._ready: Deque[_Batch] = deque()
+        # Spooled batches waiting to be resent: seq -> (due time, backoff)
+        self._parked: Dict[int, Tuple[float, AdaptivePoller]] = {}
+        self._pending = 0
+        self._flush_requested = False
+        self._closed = False
+        self._replaying = spool is not None and len(spool) > 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="nexla-webhook"
+        )
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name="nexla-webhook-producer", daemon=True
+        )
+        self._dispatcher.start()
+
+    def send(
+        self,
+        webhook_url: str,
+        record: Dict[str, Any],
+        callback: Optional[DeliveryCallback] = None,
+    ) -> None:
+        """
+        Buffer a record for delivery.
+
+        Returns immediately unless the buffer is full, in which case it waits
+        up to ``max_block`` seconds for deliveries to free space.
+
+        Args:
+            webhook_url: Full URL of the Nexla webhook endpoint
+            record: JSON object to send
+            callback: Called with the WebhookDelivery of the record's batch
+
+        Raises:
+            BufferFullError: If the buffer stayed full for ``max_block`` seconds
+            NexlaError: If the producer is closed
+        """
+        size = _record_size(record)
+        with self._cond:
+            self._wait_for_space()
+            batch = self._open.get(webhook_url)
+            if batch is not None and batch.bytes + size > self.max_batch_bytes:
+                self._seal(batch)
+                batch = None
+            if batch is None:
+                batch = self._open[webhook_url] = _Batch(webhook_url, time.monotonic())
+                self._cond.notify_all()
+            batch.add(record, size, callback)
+            self._pending += 1
+            if len(batch.records) >= self.batch_size:
+                self._seal(batch)
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send every buffered record and wait for the deliveries.
+
+        Returns:
+            True if everything was delivered (or failed) within ``timeout``
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending or self._replaying:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush, then stop the background threads.
+
+        Returns:
+            True if every buffered record was delivered before stopping
+        """
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._dispatcher.join(timeout)
+        self._executor.shutdown(wait=flushed)
+        return flushed
+
+    def __len__(self) -> int:
+        """Records buffered or in flight."""
+        with self._cond:
+            return self._pending
+
+    def __enter__(self) -> "WebhookProducer":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    # Background side
+
+    def _wait_for_space(self) -> None:
+        deadline = None if self.max_block is None else time.monotonic() + self.max_block
+        while True:
+            if self._closed:
+                raise NexlaError(
+                    "Webhook producer is closed", operation="webhook_produce"
+                )
+            if self._pending < self.max_buffered_records:
+                return
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise BufferFullError(
+                    f"Webhook producer buffer full ({self._pending} records pending)",
+                    context={"max_buffered_records": self.max_buffered_records},
+                )
+            self._cond.wait(remaining)
+
+    def _seal(self, batch: _Batch) -> None:
+        if self._open.get(batch.url) is batch:
+            del self._open[batch.url]
+        self._ready.append(batch)
+
+    def _replay(self) -> None:
+        """Resend batches a previous run spooled but never delivered."""
+        try:
+            self._replay_pending()
+        finally:
+            with self._cond:
+                self._replaying = False
+                self._cond.notify_all()
+
+    def _replay_pending(self) -> None:
+        for spooled in self.spool.pending():
+            batch = _Batch(spooled.webhook_url, time.monotonic())
+            batch.seq = spooled.seq
+            for record in spooled.records:
+                batch.add(record, _record_size(record), None)
+            with self._cond:
+                while self._pending and (
+                    self._pending + len(batch.records) > self.max_buffered_records
+                ):
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                self._pending += len(batch.records)
+            self._executor.submit(self._deliver, batch)
+
+    def _park(self, batch: _Batch) -> None:
+        """Schedule a spooled batch that failed retryably to be resent."""
+        if batch.poller is None:
+            first = min(
+                self.backoff * 2 ** max(self.retries, 0), self.max_redrive_interval
+            )
+            batch.poller = AdaptivePoller(first, max(first, self.max_redrive_interval))
+        with self._cond:
+            self._parked[batch.seq] = (
+                time.monotonic() + batch.poller.next_interval(),
+                batch.poller,
+            )
+            self._cond.notify_all()
+
+    def _redrive(self, seq: int, poller: AdaptivePoller) -> None:
+        spooled = self.spool.get(seq)
+        if spooled is None:
+            return
+        batch = _Batch(spooled.webhook_url, time.monotonic())
+        batch.seq = seq
+        batch.poller = poller
+        for record in spooled.records:
+            batch.add(record, _record_size(record), None)
+        with self._cond:
+            self._pending += len(batch.records)
+        self._executor.submit(self._deliver, batch)
+
+    def _dispatch(self) -> None:
+        if self._replaying:
+            self._replay()
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    for batch in list(self._open.values()):
+                        if (
+                            self._flush_requested
+                            or self._closed
+                            or now - batch.created >= self.linger
+                        ):
+                            self._seal(batch)
+                    self._flush_requested = False
+                    if self._closed and not self._ready:
+                        # Parked batches stay spooled for the next producer
+                        return
+                    due = [
+                        (seq, poller)
+                        for seq, (at, poller) in self._parked.items()
+                        if at <= now
+                    ]
+                    for seq, _ in due:
+                        del self._parked[seq]
+                    if self._ready or due:
+                        batches = list(self._ready)
+                        self._ready.clear()
+                        break
+                    wakeups = [at for at, _ in self._parked.values()]
+                    if self._open:
+                        oldest = min(b.created for b in self._open.values())
+                        wakeups.append(oldest + self.linger)
+                    timeout = max(0.0, min(wakeups) - now) if wakeups else None
+                    self._cond.wait(timeout)
+            for batch in batches:
+                self._executor.submit(self._deliver, batch)
+            for seq, poller in due:
+                self._redrive(seq, poller)
+
+    def _deliver(self, batch: _Batch) -> None:
+        redrive = batch.poller is not None
+        try:
+            try:
+                delivery = self._send(batch)
+            except Exception as e:
+                with self._cond:
+                    self.failed += len(batch.records)
+                delivery = WebhookDelivery(
+                    webhook_url=batch.url,
+                    records=len(batch.records),
+                    bytes=batch.bytes,
+                    success=False,
+                    error=f"Webhook delivery failed: {e}",
+                )
+            if redrive and not (delivery.success or delivery.dead_lettered):
+                # Failed again; the first failure was already reported
+                return
+            callbacks = list(batch.callbacks)
+            if self.on_delivery is not None:
+                callbacks.insert(0, self.on_delivery)
+            for callback in callbacks:
+                # One failing callback must not keep the others from running
+                try:
+                    callback(delivery)
+                except Exception as e:
+                    logger.warning(f"Webhook delivery callback failed: {e}")
+        finally:
+            with self._cond:
+                self._pending -= len(batch.records)
+                self._cond.notify_all()
+
+    def _send(self, batch: _Batch) -> WebhookDelivery:
+        if self.spool is not None and batch.seq is None:
+            try:
+                batch.seq = self.spool.append(batch.url, batch.records)
+            except (OSError, ValueError) as e:
+                with self._cond:
+                    self.failed += len(batch.records)
+                return WebhookDelivery(
+                    webhook_url=batch.url,
+                    records=len(batch.records),
+                    bytes=batch.bytes,
+                    success=False,
+                    attempts=0,
+                    error=f"Spool write failed: {e}",
+                )
+        poller = AdaptivePoller(self.backoff, self.backoff * 2 ** max(self.retries, 0))
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                # Retried below, so each attempt is a single request
+                with no_transport_retries():
+                    response = self.webhooks.send_many_records(
+                        batch.url,
+                        batch.records,
+                        options=self.options,
+                        auth_method=self.auth_method,
+                    )
+            except NexlaError as e:
+                retryable = is_retryable_error(e)
+                if attempts <= self.retries and retryable:
+                    time.sleep(poller.next_interval())
+                    continue
+                if batch.poller is None:
+                    with self._cond:
+                        self.failed += len(batch.records)
+                # Retryable failures stay spooled and are resent in the
+                # background; rejected batches would fail the same way, so
+                # they are set aside
+                dead_lettered = False
+                if batch.seq is not None and retryable:
+                    self._park(batch)
+                elif batch.seq is not None:
+                    try:
+                        self.spool.dead_letter(batch.seq, str(e))
+                        dead_lettered = True
+                    except (OSError, ValueError) as spool_error:
+                        logger.warning(
+                            f"Could not dead-letter webhook batch: {spool_error}"
+                        )
+                return WebhookDelivery(
+                    webhook_url=batch.url,
+                    records=len(batch.records),
+                    bytes=batch.bytes,
+                    success=False,
+                    attempts=attempts,
+                    error=str(e),
+                    dead_lettered=dead_lettered,
+                )
+            if batch.seq is not None:
+                try:
+                    self.spool.ack(batch.seq)
+                except (OSError, ValueError) as spool_error:
+                    # Delivered all the same; the batch is sent again later
+                    logger.warning(
+                        f"Could not acknowledge webhook batch: {spool_error}"
+                    )
+            with self._cond:
+                self.delivered += len(batch.records)
+            return WebhookDelivery(
+                webhook_url=batch.url,
+                records=len(batch.records),
+                bytes=batch.bytes,
+                success=True,
+                attempts=attempts,
+                response=response,
+            )
+
+
+def _record_size(record: Any) -> int:
+    return len(json.dumps(record, separators=(",", ":"), default=str)) + 1
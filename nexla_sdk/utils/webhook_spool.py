@@ -0,0 +1,434 @@
+"""
+Durable on-disk spool for webhook batches.
+
+``WebhookSpool`` is an append-only log of batches waiting for delivery. Each
+batch is written as one JSON line to the active segment file before it is
+sent, and acknowledged once the webhook accepts it. Batches that were never
+acknowledged (the process died, or the webhook kept failing) are still on
+disk and are returned by ``pending()`` when the spool is reopened, so
+delivery is at-least-once. Segments whose batches are all acknowledged are
+deleted, keeping disk usage proportional to the backlog. Batches the
+webhook rejects for good (a 4xx other than 429) are moved to a dead-letter
+file instead of being replayed forever.
+
+Only an index of unacknowledged batches (a few numbers per batch) is held in
+memory; records are read back from disk when replayed.
+
+Layout of the spool directory::
+
+    00000000000000000001.log      batches, one JSON line each
+    00000000000000000001.ack      sequence numbers acknowledged in that segment
+    00000000000000004097.log      active segment
+    dead_letter.ndjson            rejected batches, with the error
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from nexla_sdk.models.base import BaseModel
+
+_FSYNC_POLICIES = ("always", "interval", "never")
+_DEAD_LETTER_FILE = "dead_letter.ndjson"
+
+
+class SpooledBatch(BaseModel):
+    """A batch read back from the spool."""
+
+    seq: int
+    webhook_url: str
+    records: List[Any]
+    created_at: float
+    error: Optional[str] = None
+
+
+class SpoolLag(BaseModel):
+    """Backlog of a spool: what is written but not yet acknowledged."""
+
+    pending_batches: int
+    pending_records: int
+    pending_bytes: int
+    oldest_age: Optional[float] = None
+    segments: int
+    disk_bytes: int
+    appended: int
+    acked: int
+    dead_lettered: int = 0
+
+
+class _Segment:
+    """One log file plus its acknowledgement sidecar."""
+
+    __slots__ = ("first_seq", "log_path", "ack_path", "unacked", "size")
+
+    def __init__(self, directory: str, first_seq: int):
+        self.first_seq = first_seq
+        self.log_path = os.path.join(directory, f"{first_seq:020d}.log")
+        self.ack_path = os.path.join(directory, f"{first_seq:020d}.ack")
+        self.unacked = 0
+        self.size = 0
+
+
+class WebhookSpool:
+    """
+    Append-only, segmented disk log of webhook batches.
+
+    Args:
+        directory: Spool directory (created if missing); reopening it
+            recovers every unacknowledged batch
+        segment_bytes: Size at which the active segment is closed and a new
+            one started
+        fsync: "always" fsyncs each appended batch, "interval" at most every
+            ``fsync_interval`` seconds, "never" leaves flushing to the OS.
+            Acknowledgements are never fsynced: losing one only means the
+            batch is sent again.
+        fsync_interval: Seconds between fsyncs with ``fsync="interval"``
+
+    Examples:
+        with WebhookSpool("/var/spool/nexla") as spool:
+            with webhooks.producer(spool=spool) as producer:
+                for event in clickstream:
+                    producer.send(webhook_url, event)
+            print(spool.lag().pending_batches)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        fsync: str = "always",
+        fsync_interval: float = 1.0,
+    ):
+        if fsync not in _FSYNC_POLICIES:
+            raise ValueError("fsync must be 'always', 'interval' or 'never'")
+        if segment_bytes < 1:
+            raise ValueError("segment_bytes must be positive")
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.appended = 0
+        self.acked = 0
+        self.dead_lettered = 0
+        self.dead_letter_path = os.path.join(directory, _DEAD_LETTER_FILE)
+
+        self._lock = threading.Lock()
+        self._segments: Dict[int, _Segment] = {}
+        # seq -> (segment first_seq, offset, records, bytes, created_at)
+        self._index: Dict[int, Tuple[int, int, int, int, float]] = {}
+        self._next_seq = 1
+        self._last_fsync = 0.0
+        self._log = None
+        self._acks = None
+        self._active: Optional[_Segment] = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+        self._roll()
+
+    def append(self, webhook_url: str, records: List[Any]) -> int:
+        """
+        Write a batch to the log.
+
+        Returns:
+            Sequence number to pass to ``ack()`` once the batch is delivered
+        """
+        created_at = time.time()
+        with self._lock:
+            self._check_open()
+            seq = self._next_seq
+            line = (
+                json.dumps(
+                    {
+                        "seq": seq,
+                        "url": webhook_url,
+                        "records": records,
+                        "ts": created_at,
+                    },
+                    separators=(",", ":"),
+                    default=str,
+                ).encode()
+                + b"\n"
+            )
+            if self._active.size and self._active.size + len(line) > self.segment_bytes:
+                self._roll()
+            segment = self._active
+            self._log.write(line)
+            self._log.flush()
+            self._sync(self._log)
+            self._index[seq] = (
+                segment.first_seq,
+                segment.size,
+                len(records),
+                len(line),
+                created_at,
+            )
+            segment.size += len(line)
+            segment.unacked += 1
+            self._next_seq += 1
+            self.appended += 1
+            return seq
+
+    def ack(self, seq: int) -> None:
+        """Mark a batch delivered; fully acknowledged segments are deleted."""
+        with self._lock:
+            self._ack(seq)
+
+    def dead_letter(self, seq: int, error: str) -> None:
+        """
+        Move a batch that can never be delivered to the dead-letter file.
+
+        The batch is appended to ``dead_letter.ndjson`` together with
+        ``error`` and then acknowledged, so it is no longer replayed.
+        """
+        with self._lock:
+            self._check_open()
+            entry = self._index.get(seq)
+            if entry is None:
+                return
+            first_seq, offset, _, size, _ = entry
+            with open(self._segments[first_seq].log_path, "rb") as handle:
+                handle.seek(offset)
+                data = json.loads(handle.read(size))
+            data["error"] = error
+            with open(self.dead_letter_path, "ab") as handle:
+                handle.write(
+                    json.dumps(data, separators=(",", ":"), default=str).encode()
+                    + b"\n"
+                )
+                handle.flush()
+                self._sync(handle)
+            self.dead_lettered += 1
+            self._ack(seq)
+
+    def get(self, seq: int) -> Optional[SpooledBatch]:
+        """Read one unacknowledged batch back, or None if it was acknowledged."""
+        with self._lock:
+            entry = self._index.get(seq)
+            if entry is None:
+                return None
+            first_seq, offset, _, size, _ = entry
+            with open(self._segments[first_seq].log_path, "rb") as handle:
+                handle.seek(offset)
+                data = json.loads(handle.read(size))
+        return SpooledBatch(
+            seq=seq,
+            webhook_url=data["url"],
+            records=data["records"],
+            created_at=data["ts"],
+        )
+
+    def dead_letters(self) -> Iterator[SpooledBatch]:
+        """Stream dead-lettered batches, oldest first."""
+        if not os.path.exists(self.dead_letter_path):
+            return
+        with open(self.dead_letter_path, "rb") as handle:
+            for line in handle:
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    continue  # torn final line
+                yield SpooledBatch(
+                    seq=data["seq"],
+                    webhook_url=data["url"],
+                    records=data["records"],
+                    created_at=data["ts"],
+                    error=data.get("error"),
+                )
+
+    def pending(self) -> Iterator[SpooledBatch]:
+        """
+        Stream unacknowledged batches, oldest first.
+
+        Batches are read from disk one at a time; ones acknowledged while
+        iterating are skipped.
+        """
+        with self._lock:
+            seqs = sorted(self._index)
+        handles: Dict[int, Any] = {}
+        try:
+            for seq in seqs:
+                with self._lock:
+                    entry = self._index.get(seq)
+                    if entry is None:
+                        continue
+                    first_seq, offset, _, size, _ = entry
+                    if first_seq not in handles:
+                        handles[first_seq] = open(
+                            self._segments[first_seq].log_path, "rb"
+                        )
+                handle = handles[first_seq]
+                handle.seek(offset)
+                data = json.loads(handle.read(size))
+                yield SpooledBatch(
+                    seq=seq,
+                    webhook_url=data["url"],
+                    records=data["records"],
+                    created_at=data["ts"],
+                )
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    def compact(self) -> int:
+        """
+        Delete the active segment if every batch in it is acknowledged.
+
+        Other segments are deleted as soon as their last batch is
+        acknowledged; this reclaims the active one too, e.g. when idle.
+
+        Returns:
+            Number of segments deleted
+        """
+        with self._lock:
+            self._check_open()
+            if self._active.unacked or not self._active.size:
+                return 0
+            self._roll()
+            return 1
+
+    def lag(self) -> SpoolLag:
+        """Current backlog: batches, records and bytes not yet acknowledged."""
+        with self._lock:
+            entries = list(self._index.values())
+            oldest = min((entry[4] for entry in entries), default=None)
+            return SpoolLag(
+                pending_batches=len(entries),
+                pending_records=sum(entry[2] for entry in entries),
+                pending_bytes=sum(entry[3] for entry in entries),
+                oldest_age=None if oldest is None else max(0.0, time.time() - oldest),
+                segments=len(self._segments),
+                disk_bytes=sum(segment.size for segment in self._segments.values()),
+                appended=self.appended,
+                acked=self.acked,
+                dead_lettered=self.dead_lettered,
+            )
+
+    def __len__(self) -> int:
+        """Unacknowledged batches."""
+        with self._lock:
+            return len(self._index)
+
+    def flush(self) -> None:
+        """Flush and fsync the active segment and its acknowledgements."""
+        with self._lock:
+            self._check_open()
+            for handle in (self._log, self._acks):
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._last_fsync = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the active segment."""
+        with self._lock:
+            if self._log is None:
+                return
+            for handle in (self._log, self._acks):
+                handle.flush()
+                os.fsync(handle.fileno())
+                handle.close()
+            self._log = self._acks = None
+
+    def __enter__(self) -> "WebhookSpool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    # Internals
+
+    def _check_open(self) -> None:
+        if self._log is None:
+            raise ValueError("Webhook spool is closed")
+
+    def _ack(self, seq: int) -> None:
+        entry = self._index.pop(seq, None)
+        if entry is None:
+            return
+        segment = self._segments[entry[0]]
+        segment.unacked -= 1
+        self.acked += 1
+        if segment is self._active:
+            self._acks.write(f"{seq}\n".encode())
+            self._acks.flush()
+        elif segment.unacked == 0:
+            self._remove(segment)
+        else:
+            with open(segment.ack_path, "ab") as handle:
+                handle.write(f"{seq}\n".encode())
+
+    def _sync(self, handle: Any) -> None:
+        if self.fsync == "never":
+            return
+        now = time.monotonic()
+        if self.fsync == "always" or now - self._last_fsync >= self.fsync_interval:
+            os.fsync(handle.fileno())
+            self._last_fsync = now
+
+    def _roll(self) -> None:
+        """Start a new active segment, dropping the old one if fully acked."""
+        for handle in (self._log, self._acks):
+            if handle is not None:
+                handle.flush()
+                os.fsync(handle.fileno())
+                handle.close()
+        previous = self._active
+        segment = _Segment(self.directory, self._next_seq)
+        self._segments[segment.first_seq] = segment
+        self._active = segment
+        self._log = open(segment.log_path, "ab")
+        self._acks = open(segment.ack_path, "ab")
+        if previous is not None and previous.unacked == 0:
+            self._remove(previous)
+
+    def _remove(self, segment: _Segment) -> None:
+        for path in (segment.log_path, segment.ack_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        del self._segments[segment.first_seq]
+
+    def _recover(self) -> None:
+        """Rebuild the index from segment files left by a previous run."""
+        names = sorted(
+            name
+            for name in os.listdir(self.directory)
+            if name.endswith(".log") and name[:-4].isdigit()
+        )
+        for name in names:
+            segment = _Segment(self.directory, int(name[:-4]))
+            acked = set()
+            if os.path.exists(segment.ack_path):
+                with open(segment.ack_path, "rb") as handle:
+                    acked = {int(line) for line in handle if line.strip().isdigit()}
+            offset = 0
+            with open(segment.log_path, "rb") as handle:
+                for line in handle:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("incomplete line")
+                        data = json.loads(line)
+                        seq = data["seq"]
+                    except (ValueError, KeyError, TypeError):
+                        # Torn write from a crash: drop the partial tail
+                        break
+                    self._next_seq = max(self._next_seq, seq + 1)
+                    if seq not in acked:
+                        self._index[seq] = (
+                            segment.first_seq,
+                            offset,
+                            len(data["records"]),
+                            len(line),
+                            data["ts"],
+                        )
+                        segment.unacked += 1
+                    offset += len(line)
+            if offset != os.path.getsize(segment.log_path):
+                os.truncate(segment.log_path, offset)
+            segment.size = offset
+            self._segments[segment.first_seq] = segment
+            if segment.unacked == 0:
+                self._remove(segment)
@@ -0,0 +1,201 @@
+"""Unit tests for per-endpoint-family circuit breakers."""
+
+import time
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    endpoint_family,
+)
+from nexla_sdk.exceptions import (
+    AuthenticationError,
+    CircuitOpenError,
+    NotFoundError,
+    ServerError,
+)
+from tests.utils.fixtures import MockHTTPClient, create_http_error
+
+pytestmark = pytest.mark.unit
+
+
+class TestEndpointFamily:
+    def test_numeric_ids_collapse(self):
+        assert endpoint_family("/data_credentials/42/probe") == (
+            "/data_credentials/*/probe"
+        )
+
+    def test_query_string_is_ignored(self):
+        assert endpoint_family("/data_flows/data_sources/7/metrics?from=x") == (
+            "/data_flows/data_sources/*/metrics"
+        )
+
+    def test_lookup_keys_collapse(self):
+        assert endpoint_family("/data_maps/5/entries/key1,key2") == (
+            "/data_maps/*/entries/*"
+        )
+
+    def test_everything_after_entries_is_one_segment(self):
+        for path in ("/data_maps/5/entries/active", "/data_maps/5/entries/a/b"):
+            assert endpoint_family(path) == "/data_maps/*/entries/*"
+
+
+class TestCircuitBreakerRegistry:
+    def test_registry_size_is_capped(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1, max_families=3)
+        tripped = registry.get("/probe_a/1")
+        tripped.record_failure()
+        for name in ("b", "c", "d", "e"):
+            registry.get(f"/name_{name}")
+
+        families = set(registry.metrics())
+        assert len(families) == 3
+        # Closed breakers are evicted before an open one
+        assert "/probe_a/*" in families
+        assert registry.get("/probe_a/2") is tripped
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker("/x", failure_threshold=2, recovery_timeout=60)
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.endpoint_family == "/x"
+        assert exc_info.value.retry_after > 0
+        assert breaker.metrics()["rejected"] == 1
+
+    def test_success_resets_consecutive_failures(self):
+        breaker = CircuitBreaker("/x", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_probe_closes_on_success(self):
+        breaker = CircuitBreaker("/x", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.before_request()  # probe slot granted
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()  # only one probe at a time
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_probe_failure_reopens(self):
+        breaker = CircuitBreaker("/x", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.metrics()["state"] == "open"
+        assert breaker.metrics()["times_opened"] == 2
+
+
+class TestClientIntegration:
+    @pytest.fixture
+    def mock_http_client(self):
+        return MockHTTPClient()
+
+    @pytest.fixture
+    def client(self, mock_http_client):
+        return NexlaClient(
+            access_token="test-token",
+            http_client=mock_http_client,
+            circuit_breaker=CircuitBreakerRegistry(failure_threshold=2),
+        )
+
+    def test_fails_fast_once_open(self, client, mock_http_client):
+        mock_http_client.add_error("/probe", create_http_error(503, "Unavailable"))
+
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                client.credentials.probe(1)
+        with pytest.raises(CircuitOpenError):
+            client.credentials.probe(2)
+
+        # Only the two real attempts reached the HTTP layer
+        assert len(mock_http_client.get_requests_by_url_pattern("/probe")) == 2
+        metrics = client.circuit_breakers.metrics()
+        assert metrics["/data_credentials/*/probe"]["state"] == "open"
+
+    def test_other_families_unaffected(self, client, mock_http_client):
+        mock_http_client.add_error("/probe", create_http_error(503, "Unavailable"))
+        mock_http_client.add_response("/data_sources", [])
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                client.credentials.probe(1)
+
+        assert client.sources.list() == []
+
+    def test_client_errors_do_not_trip_breaker(self, client, mock_http_client):
+        mock_http_client.add_error("/data_sources/", create_http_error(404, "Nope"))
+        for _ in range(3):
+            with pytest.raises(NotFoundError):
+                client.sources.get(1)
+        assert client.circuit_breakers.get("/data_sources/1").state == (
+            CircuitState.CLOSED
+        )
+
+    def test_interrupted_probe_releases_half_open_slot(self, mock_http_client):
+        def interrupt(request):
+            raise KeyboardInterrupt
+
+        mock_http_client.add_response("/probe", interrupt)
+        client = NexlaClient(
+            access_token="t",
+            http_client=mock_http_client,
+            circuit_breaker=CircuitBreakerRegistry(
+                failure_threshold=1, recovery_timeout=0.01
+            ),
+        )
+        breaker = client.circuit_breakers.get("/data_credentials/1/probe")
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        with pytest.raises(KeyboardInterrupt):
+            client.credentials.probe(1)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.before_request()  # the slot was given back
+
+    def test_errors_before_sending_record_nothing(self, mock_http_client):
+        client = NexlaClient(
+            access_token="t",
+            http_client=mock_http_client,
+            circuit_breaker=CircuitBreakerRegistry(
+                failure_threshold=1, recovery_timeout=0.01
+            ),
+        )
+
+        def refresh_failed(**kwargs):
+            raise AuthenticationError("token refresh failed")
+
+        client.auth_handler.execute_authenticated_request = refresh_failed
+        breaker = client.circuit_breakers.get("/data_credentials/1/probe")
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        with pytest.raises(AuthenticationError):
+            client.credentials.probe(1)
+
+        # Not counted as a successful probe, and the probe slot was freed
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.metrics()["total_successes"] == 0
+        breaker.before_request()
+
+    def test_can_be_disabled(self, mock_http_client):
+        client = NexlaClient(
+            access_token="t", http_client=mock_http_client, circuit_breaker=False
+        )
+        assert client.circuit_breakers is None
@@ -0,0 +1,156 @@
+"""Unit tests for client.map / client.gather fan-out."""
+
+import threading
+import time
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.concurrency import FanOut, RateLimiter
+from nexla_sdk.deadlines import current_deadline, deadline
+from nexla_sdk.exceptions import DeadlineExceededError, FanOutError
+from tests.utils.fixtures import MockHTTPClient
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def fanout():
+    pool = FanOut(max_workers=4)
+    yield pool
+    pool.shutdown()
+
+
+class TestFanOutMap:
+    def test_ordered_results(self, fanout):
+        def work(n):
+            time.sleep(0.01 * (5 - n))
+            return n * n
+
+        assert list(fanout.map(work, range(5))) == [0, 1, 4, 9, 16]
+
+    def test_unordered_streams_as_completed(self, fanout):
+        def work(n):
+            time.sleep(0.1 if n == 0 else 0.0)
+            return n
+
+        results = list(fanout.map(work, range(4), ordered=False))
+        assert sorted(results) == [0, 1, 2, 3]
+        assert results[-1] == 0
+
+    def test_concurrency_bound(self, fanout):
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work(n):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+            return n
+
+        list(fanout.map(work, range(10), concurrency=2))
+        assert state["peak"] <= 2
+
+    def test_errors_are_aggregated(self, fanout):
+        def work(n):
+            if n % 2:
+                raise ValueError(n)
+            return n
+
+        results = []
+        with pytest.raises(FanOutError) as exc_info:
+            for result in fanout.map(work, range(6)):
+                results.append(result)
+
+        assert results == [0, 2, 4]
+        assert [item for item, _ in exc_info.value.errors] == [1, 3, 5]
+
+    def test_return_exceptions(self, fanout):
+        def work(n):
+            if n == 1:
+                raise ValueError("bad")
+            return n
+
+        results = list(fanout.map(work, range(3), return_exceptions=True))
+        assert results[0] == 0 and results[2] == 2
+        assert isinstance(results[1], ValueError)
+
+    def test_nested_map_runs_inline(self):
+        pool = FanOut(max_workers=1)
+        try:
+            outer = pool.map(lambda n: sum(pool.map(lambda m: m, range(n))), [3, 4])
+            assert list(outer) == [3, 6]
+        finally:
+            pool.shutdown()
+
+    def test_deadline_propagates_into_tasks(self, fanout):
+        with deadline(5.0) as active:
+            seen = list(fanout.map(lambda _: current_deadline(), range(3)))
+        assert seen == [active, active, active]
+
+    def test_expired_deadline_stops_submission(self, fanout):
+        started = []
+
+        def work(n):
+            started.append(n)
+            time.sleep(0.03)
+            return n
+
+        with deadline(0.02):
+            with pytest.raises(DeadlineExceededError):
+                list(fanout.map(work, range(100), concurrency=2))
+        assert len(started) < 100
+
+
+class TestGather:
+    def test_gather_results_in_order(self, fanout):
+        assert fanout.gather([lambda: 1, lambda: 2, lambda: 3]) == [1, 2, 3]
+
+    def test_gather_failure_keeps_partial_results(self, fanout):
+        def boom():
+            raise RuntimeError("x")
+
+        with pytest.raises(FanOutError) as exc_info:
+            fanout.gather([lambda: 1, boom, lambda: 3])
+        assert exc_info.value.results == [1, None, 3]
+        assert exc_info.value.errors[0][0] == 1
+
+
+class TestRateLimiter:
+    def test_rate_limits_starts(self):
+        limiter = RateLimiter(rate=50, burst=1)
+        started = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        assert time.monotonic() - started >= 0.09
+
+
+class TestClientFanOut:
+    def test_client_map_and_gather(self):
+        mock_http = MockHTTPClient()
+        mock_http.add_response("/limits", {"limit": 100})
+        with NexlaClient(access_token="t", http_client=mock_http) as client:
+            results = list(
+                client.map(lambda _: client.metrics.get_rate_limits(), range(5))
+            )
+            assert results == [{"limit": 100}] * 5
+
+            first, second = client.gather(
+                client.metrics.get_rate_limits, client.metrics.get_rate_limits
+            )
+            assert first == second == {"limit": 100}
+
+    def test_client_wide_request_rate(self):
+        mock_http = MockHTTPClient()
+        client = NexlaClient(
+            access_token="t", http_client=mock_http, max_request_rate=50
+        )
+        client._request_limiter.capacity = 1
+        client._request_limiter._tokens = 1
+        started = time.monotonic()
+        list(client.map(lambda _: client.metrics.get_rate_limits(), range(6)))
+        assert time.monotonic() - started >= 0.09
+        client.close()
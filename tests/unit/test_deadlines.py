@@ -0,0 +1,156 @@
+"""Unit tests for deadlines and per-operation timeout profiles."""
+
+import time
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.deadlines import (
+    TimeoutProfiles,
+    bound_timeout,
+    current_deadline,
+    deadline,
+)
+from nexla_sdk.exceptions import DeadlineExceededError
+from nexla_sdk.http_client import HttpClientError
+from nexla_sdk.utils.pagination import Paginator
+from tests.utils.fixtures import MockHTTPClient, create_auth_token_response
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingHTTPClient(MockHTTPClient):
+    """Mock client that also records the timeout passed to each request."""
+
+    def __init__(self):
+        super().__init__()
+        self.timeouts = []
+
+    def request(self, method, url, headers, **kwargs):
+        self.timeouts.append(kwargs.get("timeout"))
+        return super().request(method, url, headers, **kwargs)
+
+
+class TestDeadlineContext:
+    def test_no_deadline_by_default(self):
+        assert current_deadline() is None
+        assert bound_timeout(10.0) == 10.0
+
+    def test_timeout_clamped_to_remaining_budget(self):
+        with deadline(0.5):
+            assert bound_timeout(10.0) <= 0.5
+            assert bound_timeout(None) <= 0.5
+        assert current_deadline() is None
+
+    def test_nested_deadline_cannot_extend_outer(self):
+        with deadline(0.2) as outer:
+            with deadline(30.0) as inner:
+                assert inner is outer
+
+    def test_expired_deadline_raises(self):
+        with deadline(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceededError):
+                bound_timeout(10.0)
+
+
+class TestTimeoutProfiles:
+    def test_builtin_profiles(self):
+        profiles = TimeoutProfiles()
+        assert profiles.timeout_for("/data_credentials/12/probe") == 60.0
+        assert profiles.timeout_for("/token") == 5.0
+        assert profiles.timeout_for("/data_sources/1") is None
+
+    def test_overrides_take_precedence(self):
+        profiles = TimeoutProfiles(
+            {"/data_credentials/*/probe": 5.0, "/data_sets/*/samples": 45.0},
+            default=8.0,
+        )
+        assert profiles.timeout_for("/data_credentials/12/probe") == 5.0
+        assert profiles.timeout_for("/data_sets/3/samples") == 45.0
+        assert profiles.timeout_for("/data_sources/1") == 8.0
+
+
+class TestClientDeadlines:
+    @pytest.fixture
+    def mock_http(self):
+        mock_http = RecordingHTTPClient()
+        mock_http.add_response("/token", create_auth_token_response())
+        return mock_http
+
+    @pytest.fixture
+    def client(self, mock_http):
+        return NexlaClient(service_key="sk", http_client=mock_http)
+
+    def test_profile_timeout_passed_to_http_client(self, client, mock_http):
+        mock_http.add_response("/probe", {"status": "ok"})
+        client.credentials.probe(3)
+        # token request, then the probe
+        assert mock_http.timeouts == [5.0, 60.0]
+
+    def test_deadline_bounds_token_and_request(self, client, mock_http):
+        mock_http.add_response("/probe", {"status": "ok"})
+        with client.deadline(1.0):
+            client.credentials.probe(3)
+        assert all(t is not None and t <= 1.0 for t in mock_http.timeouts)
+
+    def test_expired_deadline_fails_fast_across_pages(self, client, mock_http):
+        def slow_page(_req):
+            time.sleep(0.03)
+            return [{"id": 1}]
+
+        mock_http.add_response("/data_maps", slow_page)
+        paginator = Paginator(
+            lambda **params: client.request("GET", "/data_maps", params=params),
+            page_size=1,
+        )
+        with client.deadline(0.05):
+            with pytest.raises(DeadlineExceededError):
+                for _ in paginator:
+                    pass
+        # Fails before sending once the budget is spent
+        assert len(mock_http.get_requests_by_url_pattern("/data_maps")) <= 2
+
+    def test_transport_error_after_deadline_is_reported_as_deadline(
+        self, client, mock_http
+    ):
+        def timeout_error(_req):
+            time.sleep(0.03)
+            raise HttpClientError("read timed out")
+
+        mock_http.add_response("/data_sources", timeout_error)
+        with client.deadline(0.01):
+            with pytest.raises(DeadlineExceededError):
+                client.sources.list()
+        # The caller's deadline, not the backend, caused the timeout
+        breaker = client.circuit_breakers.get("/data_sources")
+        assert breaker.metrics()["total_failures"] == 0
+
+
+class TestDeadlineAwareRetry:
+    def test_retries_stop_once_deadline_passes(self):
+        from nexla_sdk.http_client import _DeadlineAwareRetry
+
+        retry = _DeadlineAwareRetry(total=3, backoff_factor=10)
+        assert not retry.is_exhausted()
+        with deadline(0.01):
+            time.sleep(0.02)
+            assert retry.is_exhausted()
+
+    def test_no_transport_retries_exhausts_immediately(self):
+        from nexla_sdk.http_client import _DeadlineAwareRetry, no_transport_retries
+
+        retry = _DeadlineAwareRetry(total=3)
+        with no_transport_retries():
+            assert retry.is_exhausted()
+        assert not retry.is_exhausted()
+
+    def test_backoff_clamped_to_budget(self):
+        from nexla_sdk.http_client import _DeadlineAwareRetry
+
+        retry = _DeadlineAwareRetry(total=5, backoff_factor=10)
+        for _ in range(3):
+            retry = retry.increment(method="GET", url="/x")
+        assert retry.get_backoff_time() > 1.0
+        with deadline(0.5):
+            assert retry.get_backoff_time() <= 0.5
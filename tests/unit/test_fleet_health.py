@@ -0,0 +1,121 @@
+"""Unit tests for the fleet health engine."""
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.utils import fleet_health
+from nexla_sdk.utils.fleet_health import FleetHealth, RunColumns
+from tests.utils.fixtures import MockHTTPClient, create_http_error
+
+pytestmark = pytest.mark.unit
+
+NOW = 1_700_000_000.0
+HOUR = 3600.0
+
+
+def _runs(records, errors=0, last_hours_ago=1.0):
+    """Runs one hour apart, the last one ``last_hours_ago`` before NOW (epoch ms)."""
+    count = len(records)
+    return [
+        {
+            "runId": i,
+            "lastWritten": int((NOW - (last_hours_ago + count - 1 - i) * HOUR) * 1000),
+            "dataSetId": 1,
+            "records": r,
+            "size": r * 10,
+            "errors": errors,
+        }
+        for i, r in enumerate(records)
+    ]
+
+
+RUNS = {
+    1: _runs([100] * 10),
+    2: _runs([100] * 10, errors=50),
+    3: _runs([100] * 10, last_hours_ago=48),
+    4: _runs([90, 100, 110, 95, 105, 100, 10]),
+    5: [],
+}
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        if not fleet_health._numpy_available:
+            pytest.skip("numpy not installed")
+    else:
+        monkeypatch.setattr(fleet_health, "_numpy_available", False)
+    return request.param
+
+
+@pytest.fixture
+def client():
+    def handler(request):
+        resource_id = int(request["url"].split("/")[-3])
+        if resource_id not in RUNS:
+            raise create_http_error(500, "boom")
+        # newest first, as the API returns them
+        return {"status": 200, "metrics": {"data": RUNS[resource_id][::-1]}}
+
+    mock_http = MockHTTPClient()
+    mock_http.add_response("/metrics/run_summary", handler)
+    client = NexlaClient(access_token="t", http_client=mock_http)
+    yield client
+    client.close()
+
+
+class TestFleetHealth:
+    def test_ranked_unhealthy_resources(self, client, backend):
+        resources = [("data_sources", i) for i in range(1, 7)]
+        report = FleetHealth(client).check(resources, now=NOW)
+
+        by_id = {r.resource_id: r for r in report.resources}
+        assert by_id[1].healthy
+        assert by_id[1].staleness_hours == pytest.approx(1.0)
+        assert by_id[2].error_rate == pytest.approx(0.5)
+        assert by_id[3].staleness_hours == pytest.approx(48.0)
+        assert by_id[4].throughput_drop == pytest.approx(0.9)
+        assert by_id[4].z_score < -3
+        assert by_id[5].issues == ["No run history found"]
+        assert report.errors.keys() == {"data_sources/6"}
+
+        ranked = [r.resource_id for r in report.unhealthy]
+        assert set(ranked) == {2, 3, 4, 5}
+        assert ranked[0] == 4
+        scores = [r.score for r in report.unhealthy]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_evaluate_prebuilt_columns(self, client, backend):
+        columns = RunColumns()
+        columns.add(("data_sinks", 9), [])
+        columns.add(("data_sinks", 10), _runs([5, 5, 5, 5]))
+
+        report = FleetHealth(client, stale_hours=0.5).evaluate(columns, now=NOW)
+
+        assert [r.resource_id for r in report.unhealthy] == [10, 9]
+        assert report.resources[1].runs == 4
+
+    def test_latest_runs_found_when_api_sorts_oldest_first(self, backend):
+        runs = _runs([100] * 6 + [10])
+
+        def ascending(request):
+            size, page = request["params"]["size"], request["params"]["page"]
+            return {
+                "status": 200,
+                "metrics": {
+                    "data": runs[(page - 1) * size : page * size],
+                    "meta": {"currentPage": page, "pageCount": -(-len(runs) // size)},
+                },
+            }
+
+        mock_http = MockHTTPClient()
+        mock_http.add_response("/metrics/run_summary", ascending)
+        client = NexlaClient(access_token="t", http_client=mock_http)
+
+        columns, _ = FleetHealth(client, runs=3).fetch([("data_sources", 1)])
+        client.close()
+
+        # The three newest runs, read from the last pages
+        assert columns.records == [100.0, 100.0, 10.0]
+        pages = [r["params"]["page"] for r in mock_http.requests]
+        assert pages == [1, 3, 2]
@@ -0,0 +1,151 @@
+"""Unit tests for the FlowGraph index."""
+
+import pytest
+
+from nexla_sdk.models.flows.responses import FlowResponse
+from nexla_sdk.utils.flow_graph import FlowGraph
+from tests.utils.mock_builders import MockDataFactory
+
+pytestmark = pytest.mark.unit
+
+
+def _node(node_id, origin, children=(), **kwargs):
+    return {
+        "id": node_id,
+        "origin_node_id": origin,
+        "status": kwargs.pop("status", "ACTIVE"),
+        "children": list(children),
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def response():
+    """Source 10 -> set 100 -> {sink 1000, set 101 -> sink 1001}, plus a second flow."""
+    factory = MockDataFactory()
+    tree = _node(
+        1,
+        1,
+        [
+            _node(
+                2,
+                1,
+                [
+                    _node(3, 1, data_sink_id=1000),
+                    _node(
+                        4,
+                        1,
+                        [_node(5, 1, data_sink_id=1001, status="PAUSED")],
+                        data_set_id=101,
+                    ),
+                ],
+                data_set_id=100,
+            )
+        ],
+        data_source_id=10,
+        project_id=7,
+    )
+    other = _node(20, 20, [_node(21, 20, data_set_id=200)], data_source_id=11)
+    return FlowResponse.model_validate(
+        {
+            "flows": [tree, other],
+            "data_sources": [factory.create_mock_source(id=10)],
+            "data_sets": [factory.create_mock_nexset(id=100)],
+            "data_sinks": [factory.create_mock_destination(id=1001)],
+        }
+    )
+
+
+class TestFlowGraph:
+    def test_indexes(self, response):
+        graph = FlowGraph([response])
+
+        assert len(graph) == 7
+        assert sorted(graph.flow_ids) == [1, 20]
+        assert graph.node_for_source(10).id == 1
+        assert graph.node_for_data_set(101).id == 4
+        assert graph.node_for_sink(1001).id == 5
+        assert [n.id for n in graph.nodes_in_project(7)] == [1]
+        assert [n.id for n in graph.nodes_with_status("PAUSED")] == [5]
+        assert [n.id for n in graph.flow_nodes(1)] == [1, 2, 3, 4, 5]
+
+    def test_ancestors_and_descendants(self, response):
+        graph = FlowGraph([response])
+
+        assert graph.ancestor_ids(5) == (1, 2, 4)
+        assert graph.descendant_ids(2) == frozenset({3, 4, 5})
+        assert graph.parent(4).id == 2
+        assert graph.origin(5).id == 1
+        assert [n.id for n in graph.children(2)] == [3, 4]
+        assert graph.upstream_source(5).data_source_id == 10
+
+    def test_downstream_sinks(self, response):
+        graph = FlowGraph([response])
+
+        sinks = {n.data_sink_id for n in graph.downstream_sinks(data_set_id=100)}
+        assert sinks == {1000, 1001}
+        assert [n.data_sink_id for n in graph.downstream_sinks(data_set_id=101)] == [
+            1001
+        ]
+        assert graph.downstream_sinks(data_source_id=11) == []
+        assert graph.downstream_sinks(data_set_id=999) == []
+        with pytest.raises(ValueError):
+            graph.downstream_sinks()
+
+    def test_element_joins(self, response):
+        graph = FlowGraph([response])
+
+        assert graph.source(10).id == 10
+        assert graph.nexset(100).id == 100
+        assert graph.destination(1001).id == 1001
+        assert graph.element(5) is graph.destination(1001)
+        assert graph.element(3) is None
+
+    def test_replace_and_remove_flow(self, response):
+        graph = FlowGraph([response])
+        updated = FlowResponse.model_validate(
+            {"flows": [_node(1, 1, data_source_id=10, status="PAUSED")]}
+        )
+
+        graph.add_response(updated)
+        assert graph.flow_nodes(1)[0].status == "PAUSED"
+        assert graph.node_for_sink(1001) is None
+        assert graph.descendant_ids(1) == frozenset()
+        assert graph.nodes_with_status("PAUSED")[0].id == 1
+
+        removed = graph.remove_flow(20)
+        assert [n.id for n in removed] == [20, 21]
+        assert graph.node_for_source(11) is None
+        assert 21 not in graph
+
+    def test_node_moving_between_flows(self, response):
+        graph = FlowGraph([response])
+        # Sink node 3 moves from flow 1 to flow 20
+        graph.add_flow(
+            FlowResponse.model_validate(
+                {
+                    "flows": [
+                        _node(
+                            20,
+                            20,
+                            [_node(21, 20, [_node(3, 20, data_sink_id=1000)])],
+                            data_source_id=11,
+                        )
+                    ]
+                }
+            ).flows[0]
+        )
+
+        assert graph.origin(3).id == 20
+        assert [n.id for n in graph.flow_nodes(1)] == [1, 2, 4, 5]
+        assert 3 not in graph.descendant_ids(1)
+
+        # Re-indexing or removing the old flow leaves the moved node alone
+        graph.add_flow(response.flows[0].model_copy(update={"children": []}))
+        assert graph.node(3).id == 3
+        assert graph.node_for_sink(1000).id == 3
+        graph.remove_flow(1)
+        assert graph.origin(3).id == 20
+        assert [n.data_sink_id for n in graph.downstream_sinks(data_source_id=11)] == [
+            1000
+        ]
@@ -0,0 +1,204 @@
+"""Unit tests for incremental flow synchronization."""
+
+import copy
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.exceptions import FanOutError
+from nexla_sdk.utils.flow_sync import FlowChangeType, FlowSync
+from tests.utils.fixtures import MockHTTPClient, create_http_error
+
+pytestmark = pytest.mark.unit
+
+
+def _node(node_id, origin, children=(), status="ACTIVE", **kwargs):
+    return {
+        "id": node_id,
+        "origin_node_id": origin,
+        "status": status,
+        "children": list(children),
+        **kwargs,
+    }
+
+
+class FlowServer:
+    """Serves /flows and /flows/{id} from an editable in-memory state."""
+
+    def __init__(self, flows):
+        self.flows = {flow["id"]: flow for flow in flows}
+        self.missing = set()
+        self.failing = set()
+
+    def __call__(self, request):
+        path = request["url"].split("/flows", 1)[1].strip("/")
+        if not path:
+            flows = list(self.flows.values())
+            params = request.get("params") or {}
+            if "page" not in params:
+                return {"flows": copy.deepcopy(flows)}
+            per_page = params["per_page"]
+            start = (params["page"] - 1) * per_page
+            return {
+                "flows": copy.deepcopy(flows[start : start + per_page]),
+                "meta": {"pageCount": -(-len(flows) // per_page)},
+            }
+        flow_id = int(path)
+        if flow_id in self.failing:
+            raise create_http_error(500, "boom")
+        if flow_id not in self.flows:
+            raise create_http_error(404, "not found")
+        return {"flows": [copy.deepcopy(self.flows[flow_id])]}
+
+
+@pytest.fixture
+def server():
+    return FlowServer(
+        [
+            _node(1, 1, [_node(2, 1, [_node(3, 1)]), _node(4, 1)]),
+            _node(10, 10, [_node(11, 10)]),
+        ]
+    )
+
+
+@pytest.fixture
+def client(server):
+    mock_http = MockHTTPClient()
+    mock_http.add_response("/flows", server)
+    client = NexlaClient(access_token="t", http_client=mock_http)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def sync(client):
+    sync = FlowSync(client)
+    sync.load()
+    return sync
+
+
+def _types(events):
+    return [(event.type, event.node_id) for event in events]
+
+
+class TestFlowSync:
+    def test_initial_load(self, client):
+        received = []
+        sync = FlowSync(client, on_change=received.append)
+        events = sync.load()
+
+        assert len(sync.graph) == 6
+        assert (FlowChangeType.FLOW_ADDED, 1) in _types(events)
+        assert sum(e.type == FlowChangeType.NODE_ADDED for e in events) == 6
+        assert received == events
+
+    def test_unchanged_flows_produce_no_events(self, sync):
+        assert sync.refresh() == []
+
+    def test_status_change_and_reparent(self, sync, server):
+        root = server.flows[1]
+        root["children"][0]["status"] = "PAUSED"
+        moved = root["children"][0]["children"].pop()
+        root["children"][1]["children"].append(moved)
+
+        events = sync.refresh([1])
+
+        assert _types(events) == [
+            (FlowChangeType.STATUS_CHANGED, 2),
+            (FlowChangeType.REPARENTED, 3),
+        ]
+        assert events[0].old_status == "ACTIVE" and events[0].new_status == "PAUSED"
+        assert events[1].old_parent_id == 2 and events[1].new_parent_id == 4
+        assert sync.graph.parent(3).id == 4
+
+    def test_added_removed_and_updated_nodes(self, sync, server):
+        root = server.flows[10]
+        root["name"] = "renamed"
+        root["children"] = [_node(12, 10)]
+
+        events = sync.refresh([10])
+
+        assert set(_types(events)) == {
+            (FlowChangeType.NODE_UPDATED, 10),
+            (FlowChangeType.NODE_ADDED, 12),
+            (FlowChangeType.NODE_REMOVED, 11),
+        }
+
+    def test_deleted_flow(self, sync, server):
+        del server.flows[10]
+
+        events = sync.refresh([10])
+
+        assert (FlowChangeType.FLOW_REMOVED, 10) in _types(events)
+        assert 10 not in sync.graph.flow_ids
+        assert 11 not in sync.graph
+
+    def test_updated_at_stamps_skip_fetches(self, sync, client):
+        sync.refresh(updated_at={1: "t1", 10: "t1"})
+        client.http_client.clear_requests()
+
+        sync.refresh(updated_at={1: "t1", 10: "t2"})
+
+        urls = [r["url"] for r in client.http_client.requests]
+        assert len(urls) == 1 and urls[0].endswith("/flows/10")
+
+    def test_failures_keep_other_changes(self, sync, server):
+        server.failing.add(1)
+        server.flows[10]["status"] = "PAUSED"
+
+        with pytest.raises(FanOutError) as exc_info:
+            sync.refresh()
+
+        assert exc_info.value.errors[0][0] == 1
+        assert _types(exc_info.value.results) == [(FlowChangeType.STATUS_CHANGED, 10)]
+        assert sync.graph.node(10).status == "PAUSED"
+
+    def test_resync_discovers_new_and_deleted_flows(self, sync, server):
+        del server.flows[1]
+        server.flows[20] = _node(20, 20)
+
+        events = sync.resync()
+
+        assert (FlowChangeType.FLOW_ADDED, 20) in _types(events)
+        assert (FlowChangeType.FLOW_REMOVED, 1) in _types(events)
+        assert sorted(sync.graph.flow_ids) == [10, 20]
+
+    def test_resync_reads_every_page(self, client, server):
+        for origin in range(20, 25):
+            server.flows[origin] = _node(origin, origin)
+        sync = FlowSync(client, per_page=2)
+        sync.load()
+        assert len(sync.graph.flow_ids) == 7
+
+        del server.flows[24]
+        events = sync.resync()
+
+        assert {event.origin_node_id for event in events} == {24}
+        assert (FlowChangeType.FLOW_REMOVED, 24) in _types(events)
+        assert sorted(sync.graph.flow_ids) == [1, 10, 20, 21, 22, 23]
+
+    def test_resync_stops_at_page_count(self, client, server):
+        for origin in range(20, 24):
+            server.flows[origin] = _node(origin, origin)
+        sync = FlowSync(client, per_page=2)
+
+        sync.load()
+
+        pages = [r["params"]["page"] for r in client.http_client.requests]
+        assert pages == [1, 2, 3]
+        assert len(sync.graph.flow_ids) == 6
+
+    @pytest.mark.parametrize("order", [[1, 10], [10, 1]])
+    def test_node_moving_between_flows_is_reparented(self, sync, server, order):
+        moved = server.flows[1]["children"][0]["children"].pop()
+        moved["origin_node_id"] = 10
+        server.flows[10]["children"][0]["children"].append(moved)
+
+        events = sync.refresh(order)
+
+        assert _types(events) == [(FlowChangeType.REPARENTED, 3)]
+        assert events[0].old_parent_id == 2 and events[0].new_parent_id == 11
+        assert sync.graph.origin_id(3) == 10
+        assert sync.graph.parent(3).id == 11
+        # Its hash was kept, so nothing is reported on the next refresh
+        assert sync.refresh() == []
@@ -1,23 +1,26 @@
 """Unit tests for flows resource."""
 
+import asyncio
+import json
 from unittest.mock import patch
 
 import pytest
 
 from nexla_sdk import NexlaClient
-from nexla_sdk.exceptions import ServerError
+from nexla_sdk.exceptions import DeadlineExceededError, ServerError
 from nexla_sdk.http_client import HttpClientError
 from nexla_sdk.models.common import FlowNode
 from nexla_sdk.models.flows.requests import FlowCopyOptions
 from nexla_sdk.models.flows.responses import (
     DocsRecommendation,
+    FlowLogEntry,
     FlowLogsResponse,
     FlowMetrics,
     FlowMetricsApiResponse,
     FlowResponse,
 )
 from tests.utils.assertions import NexlaAssertions
-from tests.utils.fixtures import MockHTTPClient
+from tests.utils.fixtures import MockHTTPClient, create_http_error
 from tests.utils.mock_builders import MockDataFactory, MockResponseBuilder
 
 pytestmark = pytest.mark.unit
@@ -681,3 +684,344 @@ class TestFlowsUnit:
         assert last_request["params"]["orderby"] == "created_at"
         assert last_request["params"]["page"] == 2
         assert last_request["params"]["per_page"] == 100
+
+
+class TestFlowsBulk:
+    """Unit tests for activate_many / pause_many."""
+
+    @pytest.fixture
+    def mock_http_client(self) -> MockHTTPClient:
+        return MockHTTPClient()
+
+    @pytest.fixture
+    def mock_client(self, mock_http_client) -> NexlaClient:
+        client = NexlaClient(
+            access_token="test-access-token", http_client=mock_http_client
+        )
+        yield client
+        client.close()
+
+    @staticmethod
+    def _flow_handler(failing=()):
+        def handler(request):
+            flow_id = int(request["url"].rstrip("/").split("/")[-2])
+            if flow_id in failing:
+                raise HttpClientError("boom", status_code=422, response={})
+            return {"flows": [{"id": flow_id, "origin_node_id": flow_id}]}
+
+        return handler
+
+    def test_activate_many(self, mock_client, mock_http_client):
+        mock_http_client.add_response("/activate", self._flow_handler())
+        progress = []
+
+        result = mock_client.flows.activate_many(
+            [1, 2, 3],
+            all=True,
+            async_mode=True,
+            concurrency=2,
+            on_progress=lambda item, done, total: progress.append((done, total)),
+        )
+
+        assert result.ok
+        assert sorted(item.id for item in result.succeeded) == [1, 2, 3]
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        requests = mock_http_client.get_requests_by_url_pattern("/activate")
+        assert all(r["params"] == {"all": 1, "async": 1} for r in requests)
+
+    def test_pause_many_by_resource(self, mock_client, mock_http_client):
+        mock_http_client.add_response("/pause", self._flow_handler())
+
+        result = mock_client.flows.pause_many(
+            resource_type="data_sources", resource_ids=[7, 8]
+        )
+
+        assert result.action == "pause"
+        assert len(result.succeeded) == 2
+        urls = sorted(r["url"] for r in mock_http_client.requests)
+        assert urls[0].endswith("/data_sources/7/pause")
+
+    def test_failures_are_reported_and_rolled_back(self, mock_client, mock_http_client):
+        mock_http_client.add_response("/activate", self._flow_handler(failing={2}))
+        mock_http_client.add_response("/pause", self._flow_handler())
+        mock_http_client.add_response(
+            "/flows/", {"flows": [{"id": 1, "origin_node_id": 1, "status": "PAUSED"}]}
+        )
+
+        result = mock_client.flows.activate_many([1, 2, 3], rollback=True)
+
+        assert not result.ok
+        assert [item.id for item in result.failed] == [2]
+        assert result.failed[0].status_code == 422
+        assert sorted(item.id for item in result.rolled_back) == [1, 3]
+        paused = mock_http_client.get_requests_by_url_pattern("/pause")
+        assert len(paused) == 2
+
+    def test_rollback_skips_flows_already_in_target_state(
+        self, mock_client, mock_http_client
+    ):
+        statuses = {1: "PAUSED", 2: "PAUSED", 3: "ACTIVE"}
+
+        def current(request):
+            flow_id = int(request["url"].rstrip("/").split("/")[-1])
+            return {
+                "flows": [
+                    {
+                        "id": flow_id,
+                        "origin_node_id": flow_id,
+                        "status": statuses[flow_id],
+                    }
+                ]
+            }
+
+        mock_http_client.add_response("/activate", self._flow_handler(failing={2}))
+        mock_http_client.add_response("/pause", self._flow_handler())
+        mock_http_client.add_response("/flows/", current)
+
+        result = mock_client.flows.activate_many([1, 2, 3], rollback=True)
+
+        assert sorted(item.id for item in result.succeeded) == [1, 3]
+        # Flow 3 was already active before the call, so it stays active
+        assert [item.id for item in result.rolled_back] == [1]
+        paused = mock_http_client.get_requests_by_url_pattern("/pause")
+        assert [r["url"].split("/")[-2] for r in paused] == ["1"]
+
+    def test_requires_one_target_kind(self, mock_client):
+        with pytest.raises(ValueError):
+            mock_client.flows.activate_many()
+        with pytest.raises(ValueError):
+            mock_client.flows.pause_many(resource_ids=[1])
+
+
+class TestFlowsWatch:
+    """Unit tests for flows.watch / watch_async."""
+
+    @pytest.fixture
+    def mock_http_client(self) -> MockHTTPClient:
+        return MockHTTPClient()
+
+    @pytest.fixture
+    def mock_client(self, mock_http_client) -> NexlaClient:
+        client = NexlaClient(
+            access_token="test-access-token", http_client=mock_http_client
+        )
+        yield client
+        client.close()
+
+    @staticmethod
+    def _status_server(sequences):
+        """Serve each flow's statuses in turn, repeating the last one."""
+        calls = {flow_id: 0 for flow_id in sequences}
+
+        def node(flow_id):
+            statuses = sequences[flow_id]
+            status = statuses[min(calls[flow_id], len(statuses) - 1)]
+            calls[flow_id] += 1
+            return {"id": flow_id, "origin_node_id": flow_id, "status": status}
+
+        def handler(request):
+            tail = request["url"].split("/flows", 1)[1].strip("/")
+            if tail:
+                return {"flows": [node(int(tail))]}
+            return {"flows": [node(flow_id) for flow_id in sequences]}
+
+        return handler
+
+    def test_watch_yields_transitions_until_status(self, mock_client, mock_http_client):
+        mock_http_client.add_response(
+            "/flows",
+            self._status_server(
+                {1: ["PAUSED", "PAUSED", "ACTIVE"], 2: ["PAUSED", "ACTIVE"]}
+            ),
+        )
+
+        changes = [
+            (c.flow_id, c.old_status, c.new_status)
+            for c in mock_client.flows.watch([1, 2], until="active", min_interval=0.01)
+        ]
+
+        assert changes == [
+            (1, None, "PAUSED"),
+            (2, None, "PAUSED"),
+            (2, "PAUSED", "ACTIVE"),
+            (1, "PAUSED", "ACTIVE"),
+        ]
+
+    def test_watch_batches_large_sets_into_one_list(
+        self, mock_client, mock_http_client
+    ):
+        sequences = {flow_id: ["PAUSED", "ACTIVE"] for flow_id in range(1, 6)}
+        mock_http_client.add_response("/flows", self._status_server(sequences))
+
+        list(
+            mock_client.flows.watch(
+                list(sequences), min_interval=0.01, batch_threshold=2
+            )
+        )
+
+        urls = [r["url"] for r in mock_http_client.requests]
+        assert len(urls) == 2
+        assert all(url.endswith("/flows") for url in urls)
+
+    def test_watch_pages_through_the_listing(self, mock_client, mock_http_client):
+        flows = [
+            {"id": flow_id, "origin_node_id": flow_id, "status": "ACTIVE"}
+            for flow_id in range(1, 251)
+        ]
+
+        def handler(request):
+            params = request["params"]
+            start = (params["page"] - 1) * params["per_page"]
+            return {
+                "flows": flows[start : start + params["per_page"]],
+                "meta": {"pageCount": 3},
+            }
+
+        mock_http_client.add_response("/flows", handler)
+
+        changes = list(mock_client.flows.watch([1, 2, 120], batch_threshold=2))
+
+        assert sorted(c.flow_id for c in changes) == [1, 2, 120]
+        # Stops paging once every watched flow was seen; no per-flow gets
+        assert [r["params"]["page"] for r in mock_http_client.requests] == [1, 2]
+
+    def test_watch_reports_deleted_flows(self, mock_client, mock_http_client):
+        mock_http_client.add_error("/flows/2", create_http_error(404, "not found"))
+        mock_http_client.add_response(
+            "/flows", self._status_server({1: ["PAUSED", "ACTIVE"]})
+        )
+
+        changes = [
+            (c.flow_id, c.old_status, c.new_status)
+            for c in mock_client.flows.watch([1, 2], min_interval=0.01)
+        ]
+
+        assert changes == [
+            (1, None, "PAUSED"),
+            (2, None, "DELETED"),
+            (1, "PAUSED", "ACTIVE"),
+        ]
+        assert (
+            sum(r["url"].endswith("/flows/2") for r in mock_http_client.requests) == 1
+        )
+
+    def test_watch_timeout(self, mock_client, mock_http_client):
+        mock_http_client.add_response("/flows", self._status_server({1: ["PAUSED"]}))
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            list(mock_client.flows.watch(1, timeout=0.05, min_interval=0.01))
+        assert exc_info.value.context["pending"] == {1: "PAUSED"}
+
+    def test_watch_async(self, mock_client, mock_http_client):
+        mock_http_client.add_response(
+            "/flows", self._status_server({1: ["ACTIVE", "ACTIVE", "PAUSED"]})
+        )
+
+        async def collect():
+            return [
+                c.new_status
+                async for c in mock_client.flows.watch_async(
+                    1, until="PAUSED", min_interval=0.01
+                )
+            ]
+
+        assert asyncio.run(collect()) == ["ACTIVE", "PAUSED"]
+
+
+class TestFlowsLogIteration:
+    """Unit tests for iter_logs and its variants."""
+
+    PATH = "/data_flows/data_sources/5023/logs"
+
+    @pytest.fixture
+    def mock_http_client(self) -> MockHTTPClient:
+        http = MockHTTPClient()
+        http.add_response(self.PATH, self._log_server(list(range(1000, 1100))))
+        return http
+
+    @pytest.fixture
+    def mock_client(self, mock_http_client) -> NexlaClient:
+        client = NexlaClient(
+            access_token="test-access-token", http_client=mock_http_client
+        )
+        yield client
+        client.close()
+
+    @staticmethod
+    def _log_server(timestamps):
+        """Serve one log entry per timestamp, newest first, paginated."""
+
+        def handler(request):
+            params = request["params"]
+            per_page = params.get("per_page", 10)
+            page = params.get("page", 1)
+            upper = params.get("to", max(timestamps))
+            matching = sorted(
+                (t for t in timestamps if params["from"] <= t <= upper), reverse=True
+            )
+            chunk = matching[(page - 1) * per_page : page * per_page]
+            return {
+                "status": 200,
+                "message": "Ok",
+                "logs": [
+                    {"timestamp": ts, "level": "INFO", "message": f"m{ts}"}
+                    for ts in chunk
+                ],
+                "meta": {
+                    "currentPage": page,
+                    "pageCount": max(1, -(-len(matching) // per_page)),
+                    "totalCount": len(matching),
+                },
+            }
+
+        return handler
+
+    def test_iter_logs_pages_sequentially(self, mock_client, mock_http_client):
+        entries = list(
+            mock_client.flows.iter_logs(
+                "data_sources", 5023, 1, 1000, 1099, per_page=25
+            )
+        )
+
+        assert len(entries) == 100
+        assert all(isinstance(entry, FlowLogEntry) for entry in entries)
+        pages = [r["params"]["page"] for r in mock_http_client.requests]
+        assert pages == [1, 2, 3, 4]
+
+    def test_iter_logs_windows_merge_in_timestamp_order(
+        self, mock_client, mock_http_client
+    ):
+        entries = list(
+            mock_client.flows.iter_logs(
+                "data_sources", 5023, 1, 1000, 1099, per_page=10, window_seconds=30
+            )
+        )
+
+        stamps = [int(entry.timestamp.timestamp()) for entry in entries]
+        assert stamps == list(range(1000, 1100))
+        windows = {
+            (r["params"]["from"], r["params"]["to"]) for r in mock_http_client.requests
+        }
+        assert windows == {(1000, 1029), (1030, 1059), (1060, 1089), (1090, 1099)}
+
+    def test_iter_logs_async(self, mock_client):
+        async def collect():
+            return [
+                entry
+                async for entry in mock_client.flows.iter_logs_async(
+                    "data_sources", 5023, 1, 1000, 1099, window_seconds=50, chunk_size=7
+                )
+            ]
+
+        assert len(asyncio.run(collect())) == 100
+
+    def test_export_logs_ndjson(self, mock_client, tmp_path):
+        path = tmp_path / "logs.ndjson"
+
+        count = mock_client.flows.export_logs_ndjson(
+            path, "data_sources", 5023, 1, 1000, 1049, window_seconds=25
+        )
+
+        lines = path.read_text().splitlines()
+        assert count == len(lines) == 50
+        assert json.loads(lines[0])["message"] == "m1000"
@@ -0,0 +1,104 @@
+"""Unit tests for hedged GET requests."""
+
+import threading
+import time
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.exceptions import ServerError
+from nexla_sdk.hedging import HedgingPolicy
+from tests.utils.fixtures import MockHTTPClient, create_http_error
+
+pytestmark = pytest.mark.unit
+
+
+def _make_client(policy: HedgingPolicy, mock_http: MockHTTPClient) -> NexlaClient:
+    return NexlaClient(access_token="test-token", http_client=mock_http, hedging=policy)
+
+
+class TestHedgingPolicy:
+    def test_applies_only_to_matching_gets(self):
+        policy = HedgingPolicy(families=["/flows/*"])
+        assert policy.applies_to("GET", "/flows/12")
+        assert not policy.applies_to("PUT", "/flows/12")
+        assert not policy.applies_to("GET", "/data_sources/12")
+
+    def test_delay_uses_percentile_once_warm(self):
+        policy = HedgingPolicy(percentile=50, min_samples=3, initial_delay=1.0)
+        assert policy.hedge_delay("/flows/1") == 1.0
+        for seconds in (0.1, 0.2, 0.3):
+            policy.record_latency("/flows/1", seconds)
+        assert policy.hedge_delay("/flows/2") == pytest.approx(0.2)
+
+    def test_delay_is_clamped(self):
+        policy = HedgingPolicy(min_samples=1, max_delay=0.5)
+        policy.record_latency("/flows/1", 30.0)
+        assert policy.hedge_delay("/flows/1") == 0.5
+
+
+class TestHedgedRequests:
+    def test_fast_request_is_not_hedged(self):
+        mock_http = MockHTTPClient()
+        mock_http.add_response("/flows/1", {"flows": []})
+        policy = HedgingPolicy(initial_delay=1.0)
+        client = _make_client(policy, mock_http)
+
+        client.flows.get(1)
+
+        assert len(mock_http.requests) == 1
+        assert policy.metrics()["hedges_sent"] == 0
+
+    def test_slow_request_is_hedged_and_hedge_wins(self):
+        mock_http = MockHTTPClient()
+        calls = {"n": 0}
+        lock = threading.Lock()
+
+        def responder(_req):
+            with lock:
+                calls["n"] += 1
+                attempt = calls["n"]
+            if attempt == 1:
+                time.sleep(0.5)
+            return {"flows": [], "attempt": attempt}
+
+        mock_http.add_response("/flows/1", responder)
+        policy = HedgingPolicy(initial_delay=0.05, max_hedge_ratio=1.0)
+        client = _make_client(policy, mock_http)
+
+        started = time.monotonic()
+        client.flows.get(1)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.4
+        metrics = policy.metrics()
+        assert metrics["hedges_sent"] == 1
+        assert metrics["hedges_won"] == 1
+        policy.shutdown()
+
+    def test_hedge_rate_is_capped(self):
+        mock_http = MockHTTPClient()
+
+        def slow(_req):
+            time.sleep(0.05)
+            return {"flows": []}
+
+        mock_http.add_response("/flows/", slow)
+        policy = HedgingPolicy(initial_delay=0.01, min_delay=0.0, max_hedge_ratio=0.0)
+        client = _make_client(policy, mock_http)
+
+        for flow_id in range(3):
+            client.flows.get(flow_id)
+
+        metrics = policy.metrics()
+        assert metrics["hedges_sent"] == 1  # single burst allowance
+        assert metrics["hedges_denied"] == 2
+        policy.shutdown()
+
+    def test_errors_propagate_when_all_attempts_fail(self):
+        mock_http = MockHTTPClient()
+        mock_http.add_error("/flows/1", create_http_error(500, "boom"))
+        client = _make_client(HedgingPolicy(initial_delay=0.01), mock_http)
+
+        with pytest.raises(ServerError):
+            client.flows.get(1)
@@ -0,0 +1,143 @@
+"""Unit tests for the lineage index."""
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.utils.lineage import LineageIndex
+from tests.utils.fixtures import MockHTTPClient, create_http_error
+
+pytestmark = pytest.mark.unit
+
+
+def _brief(set_id):
+    return {"id": set_id, "owner_id": 1, "org_id": 1}
+
+
+def _sink(sink_id):
+    return {"id": sink_id, "name": f"sink {sink_id}"}
+
+
+# source 1 -> set 10 -> set 11 -> sink 100
+#                    \-> set 12 -> sink 101
+# source 2 -> set 20 -> sink 200 (edge only known from the sinks crawl)
+NEXSETS = [
+    {"id": 10, "data_source_id": 1, "updated_at": "2024-01-01T00:00:00Z"},
+    {
+        "id": 11,
+        "parent_data_sets": [_brief(10)],
+        "data_sinks": [_sink(100)],
+        "updated_at": "2024-01-01T00:00:00Z",
+    },
+    {
+        "id": 12,
+        "parent_data_sets": [_brief(10)],
+        "data_sinks": [_sink(101)],
+        "updated_at": "2024-01-01T00:00:00Z",
+    },
+    {"id": 20, "updated_at": "2024-01-01T00:00:00Z"},
+]
+SOURCES = [
+    {
+        "id": 2,
+        "name": "s2",
+        "status": "ACTIVE",
+        "source_type": "s3",
+        "data_sets": [_brief(20)],
+    }
+]
+SINKS = [
+    {
+        "id": 200,
+        "name": "d200",
+        "status": "ACTIVE",
+        "sink_type": "s3",
+        "data_set_id": 20,
+    }
+]
+
+
+@pytest.fixture
+def mock_http():
+    mock_http = MockHTTPClient()
+    mock_http.add_response("/data_sets/12", create_http_error(404, "gone"))
+    mock_http.add_response(
+        "/data_sets/11",
+        {"id": 11, "parent_data_sets": [_brief(20)], "data_sinks": [_sink(100)]},
+    )
+    mock_http.add_response("/data_sets/10", NEXSETS[0])
+    mock_http.add_response(
+        "/data_sets/20", {"id": 20, "data_source_id": 2, "data_sinks": []}
+    )
+    mock_http.add_response("/data_sets", NEXSETS)
+    mock_http.add_response("/data_sources", SOURCES)
+    mock_http.add_response("/data_sinks", SINKS)
+    return mock_http
+
+
+@pytest.fixture
+def lineage(mock_http):
+    client = NexlaClient(access_token="t", http_client=mock_http)
+    index = LineageIndex(client)
+    index.load()
+    yield index
+    client.close()
+
+
+class TestLineageIndex:
+    def test_closures_from_one_crawl(self, lineage, mock_http):
+        calls = len(mock_http.requests)
+
+        assert lineage.downstream_sinks(data_source_id=1) == [100, 101]
+        assert lineage.downstream_data_sets(data_source_id=1) == [10, 11, 12]
+        assert lineage.upstream_sources(data_sink_id=101) == [1]
+        assert lineage.upstream_sources(data_sink_id=200) == [2]
+        assert lineage.upstream(("data_set", 11)) == [
+            ("data_set", 10),
+            ("data_source", 1),
+        ]
+        impact = lineage.downstream_many([("data_set", 11), ("data_set", 20)])
+        assert impact[("data_set", 20)] == [("data_sink", 200)]
+        assert lineage.name(("data_sink", 100)) == "sink 100"
+        # Queries never touch the API
+        assert len(mock_http.requests) == calls
+
+        with pytest.raises(ValueError):
+            lineage.downstream_sinks()
+
+    def test_refresh_specific_sets(self, lineage):
+        assert lineage.downstream_sinks(data_source_id=2) == [200]
+
+        assert lineage.refresh([11, 12, 10]) == [11, 12]
+
+        # 11 moved under 20; 12 was deleted
+        assert lineage.downstream_sinks(data_source_id=2) == [100, 200]
+        assert lineage.downstream_sinks(data_source_id=1) == []
+        assert lineage.parents(("data_set", 11)) == [("data_set", 20)]
+
+    def test_refresh_reindexes_only_changed_sets(self, lineage, mock_http):
+        mock_http.add_response(
+            "/data_sets",
+            [
+                NEXSETS[0],
+                NEXSETS[1],
+                {
+                    "id": 12,
+                    "parent_data_sets": [_brief(11)],
+                    "updated_at": "2024-02-01T00:00:00Z",
+                },
+            ],
+        )
+
+        assert sorted(lineage.refresh()) == [12, 20]
+        assert lineage.downstream_data_sets(data_set_id=11) == [12]
+        assert lineage.downstream_sinks(data_source_id=1) == [100]
+        # 20 is gone, so the sink record's 20 -> 200 edge went with it
+        assert lineage.downstream_sinks(data_source_id=2) == []
+        assert lineage.parents(("data_sink", 200)) == []
+
+    def test_reindexed_nexset_overrules_sink_records(self, lineage):
+        assert lineage.refresh([20]) == [20]
+        assert lineage.downstream_sinks(data_set_id=20) == []
+        assert lineage.upstream_sources(data_set_id=20) == [2]
+        # Unchanged on a second refresh
+        assert lineage.refresh([20]) == []
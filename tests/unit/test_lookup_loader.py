@@ -0,0 +1,107 @@
+"""Unit tests for streaming lookup file loads."""
+
+import gzip
+import io
+import json
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.utils import lookup_loader
+from nexla_sdk.utils.lookup_loader import LookupLoader, iter_csv_rows
+from tests.utils.fixtures import MockHTTPClient
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def client():
+    mock_http = MockHTTPClient()
+    mock_http.add_response("/data_maps/55/entries", {"ok": True})
+    client = NexlaClient(access_token="t", http_client=mock_http)
+    yield client
+    client.close()
+
+
+def _uploaded(client):
+    return [
+        entry
+        for request in client.http_client.requests
+        for entry in request["json"]["entries"]
+    ]
+
+
+class TestLookupLoader:
+    def test_loads_gzipped_csv_with_mapping_and_types(self, client, tmp_path):
+        path = tmp_path / "catalog.csv.gz"
+        with gzip.open(path, "wt", newline="") as handle:
+            handle.write("SKU,Unit Price,Active,Ignored\n")
+            for i in range(7):
+                handle.write(f"S{i},{i}.5,{'yes' if i % 2 else 'no'},x\n")
+            handle.write("BAD,not-a-number,yes,x\n")
+
+        loader = LookupLoader(
+            client,
+            55,
+            columns={"SKU": "sku", "Unit Price": "price", "Active": "active"},
+            types={"price": float, "active": bool},
+            chunk_size=3,
+        )
+        report = loader.load(str(path))
+
+        assert report.rows_read == 8
+        assert report.rows_invalid == 1
+        assert "Row 8" in report.errors[0] and "price" in report.errors[0]
+        assert report.upsert.rows_upserted == 7
+        assert len(report.upsert.chunks) == 3
+        assert not report.ok
+        entries = sorted(_uploaded(client), key=lambda e: e["sku"])
+        assert entries[1] == {"sku": "S1", "price": 1.5, "active": True}
+
+    def test_loads_ndjson_file_object_and_raises_on_invalid(self, client):
+        lines = [json.dumps({"code": str(i), "rank": str(i)}) for i in range(3)]
+        source = io.BytesIO(("\n".join(lines) + "\n\n").encode())
+
+        report = LookupLoader(client, 55, types={"rank": int}).load(
+            source, format="ndjson"
+        )
+
+        assert report.ok
+        assert sorted(e["rank"] for e in _uploaded(client)) == [0, 1, 2]
+        assert not source.closed
+
+        bad = io.StringIO('{"code": "x", "rank": "?"}\n')
+        loader = LookupLoader(client, 55, types={"rank": int}, on_invalid="raise")
+        with pytest.raises(ValueError, match="Row 1"):
+            loader.load(bad, format="ndjson")
+
+    def test_malformed_ndjson_lines_are_invalid_rows(self, client):
+        source = io.StringIO('{"code": "a"}\n{"code": \n[1, 2]\n{"code": "b"}\n')
+
+        report = LookupLoader(client, 55).load(source, format="ndjson")
+
+        assert (report.rows_read, report.rows_invalid) == (4, 2)
+        assert report.errors[0].startswith("Line 2: invalid JSON")
+        assert report.errors[1] == "Line 3: expected a JSON object"
+        assert sorted(e["code"] for e in _uploaded(client)) == ["a", "b"]
+
+        source.seek(0)
+        loader = LookupLoader(client, 55, on_invalid="raise")
+        with pytest.raises(ValueError, match="Line 2"):
+            loader.load(source, format="ndjson")
+
+    def test_tsv_and_unknown_formats(self, tmp_path):
+        path = tmp_path / "codes.tsv"
+        path.write_text("code\tlabel\nA\tAlpha\n")
+        assert list(iter_csv_rows(str(path))) == [{"code": "A", "label": "Alpha"}]
+
+        with pytest.raises(ValueError, match="file format"):
+            list(LookupLoader(None, 55).rows("codes.xlsx"))
+        # A .json file may hold an array, so the format must be explicit
+        with pytest.raises(ValueError, match="file format"):
+            list(LookupLoader(None, 55).rows("codes.json"))
+
+    def test_parquet_requires_pyarrow(self, monkeypatch):
+        monkeypatch.setattr(lookup_loader, "_pyarrow_available", False)
+        with pytest.raises(ImportError, match="pyarrow"):
+            list(LookupLoader(None, 55).rows("codes.parquet"))
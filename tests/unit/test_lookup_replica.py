@@ -0,0 +1,130 @@
+"""Unit tests for the local lookup replica."""
+
+import threading
+from urllib.parse import unquote
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.utils.lookup_replica import LookupReplica
+from tests.utils.fixtures import MockHTTPClient
+
+pytestmark = pytest.mark.unit
+
+ENTRIES = [{"code": str(i), "label": f"label-{i}"} for i in range(5)]
+
+
+def _entries_handler(request):
+    segment = request["url"].split("/entries/")[1]
+    if segment == "*":
+        return list(ENTRIES)
+    keys = [unquote(key) for key in segment.split(",")]
+    return [{"code": key, "label": f"remote-{key}"} for key in keys if key != "nope"]
+
+
+@pytest.fixture
+def client():
+    mock_http = MockHTTPClient()
+    mock_http.add_response("/data_maps/55/entries/", _entries_handler)
+    mock_http.add_response("/data_maps/55/entries", {"ok": True})
+    client = NexlaClient(access_token="t", http_client=mock_http)
+    yield client
+    client.close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def replica_path(request, tmp_path):
+    return str(tmp_path / "replica.sqlite") if request.param == "sqlite" else None
+
+
+class TestLookupReplica:
+    def test_serves_loaded_entries_locally(self, client, replica_path):
+        with LookupReplica(client, 55, key_field="code", path=replica_path) as replica:
+            assert replica.get("3") == {"code": "3", "label": "label-3"}
+            assert list(replica.get_many(["4", "1", "4"])) == ["4", "1"]
+            assert len(replica) == 5
+        # One bulk fetch served every read
+        assert len(client.http_client.requests) == 1
+
+    def test_reads_through_and_remembers_misses(self, client, replica_path):
+        with LookupReplica(client, 55, key_field="code", path=replica_path) as replica:
+            found = replica.get_many(["1", "new", "nope"])
+            assert found["new"] == {"code": "new", "label": "remote-new"}
+            assert "nope" not in found
+            calls = len(client.http_client.requests)
+
+            assert replica.get("nope", "default") == "default"
+            assert replica.get("new")["label"] == "remote-new"
+            assert len(client.http_client.requests) == calls
+
+    def test_ttl_and_writes(self, client, replica_path):
+        clock = FakeClock()
+        replica = LookupReplica(
+            client, 55, key_field="code", ttl=60, path=replica_path, clock=clock
+        )
+        replica.get("1")
+
+        replica.upsert_entries([{"code": "1", "label": "changed"}])
+        replica.delete_entries(["2"])
+        assert replica.get("1")["label"] == "changed"
+        assert replica.get("2") is None
+        upserts = client.http_client.get_requests_by_url_pattern("/entries")
+        assert [r["method"] for r in upserts][-2:] == ["PUT", "DELETE"]
+
+        clock.now = 61
+        assert replica.get("1")["label"] == "label-1"
+        replica.invalidate()
+        assert replica.get("2")["label"] == "label-2"
+        # Initial load, TTL reload and reload after invalidate()
+        assert len(client.http_client.get_requests_by_url_pattern("/entries/*")) == 3
+        replica.close()
+
+    def test_reload_does_not_block_readers(self, replica_path):
+        reloading = threading.Event()
+        release = threading.Event()
+        loads = []
+
+        def handler(request):
+            if request["url"].endswith("/entries/*"):
+                loads.append(1)
+                if len(loads) > 1:
+                    reloading.set()
+                    release.wait(5)
+                    return [dict(entry, label="reloaded") for entry in ENTRIES]
+            return _entries_handler(request)
+
+        mock_http = MockHTTPClient()
+        mock_http.add_response("/data_maps/55/entries/", handler)
+        mock_http.add_response("/data_maps/55/entries", {"ok": True})
+        client = NexlaClient(access_token="t", http_client=mock_http)
+        clock = FakeClock()
+        replica = LookupReplica(
+            client, 55, key_field="code", ttl=60, path=replica_path, clock=clock
+        )
+        replica.load()
+
+        clock.now = 61
+        reader = threading.Thread(target=replica.get, args=("1",))
+        reader.start()
+        assert reloading.wait(5)
+
+        # Served from the previous copy while the reload is in flight
+        assert replica.get("2")["label"] == "label-2"
+        replica.upsert_entries([{"code": "3", "label": "written"}])
+        release.set()
+        reader.join(5)
+
+        assert replica.get("2")["label"] == "reloaded"
+        # A write made during the reload survives the swap
+        assert replica.get("3")["label"] == "written"
+        assert len(loads) == 2
+        replica.close()
+        client.close()
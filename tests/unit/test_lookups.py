@@ -1,5 +1,8 @@
 """Unit tests for lookups resource."""
 
+import time
+from urllib.parse import unquote
+
 import pytest
 from pydantic import ValidationError
 
@@ -314,3 +317,259 @@ class TestLookupsUnit:
         # Assert
         assert result == []
         assert len(result) == 0
+
+
+@pytest.mark.unit
+class TestLookupsBulkUpsert:
+    """Unit tests for chunked bulk upserts."""
+
+    def test_chunks_by_rows_and_bytes(self, mock_client):
+        """Entries are streamed into chunks bounded by rows and size."""
+        mock_client.http_client.add_response("/data_maps/55/entries", {"ok": True})
+        entries = (
+            {"code": str(i), "label": "x" * (200 if i == 4 else 1)} for i in range(10)
+        )
+
+        result = mock_client.lookups.bulk_upsert(
+            55, entries, chunk_size=3, max_chunk_bytes=200, concurrency=2
+        )
+
+        assert result.ok
+        assert result.rows_upserted == 10
+        # Row 4 alone exceeds the byte budget, so it gets a chunk of its own
+        assert [(c.start, c.rows) for c in result.chunks] == [
+            (0, 3),
+            (3, 1),
+            (4, 1),
+            (5, 3),
+            (8, 2),
+        ]
+        requests = mock_client.http_client.get_requests_by_url_pattern(
+            "/data_maps/55/entries"
+        )
+        assert sorted(len(r["json"]["entries"]) for r in requests) == [1, 1, 2, 3, 3]
+
+    def test_retries_transient_failures(self, mock_client):
+        """Server errors are retried; client errors fail only their chunk."""
+        attempts = {}
+
+        def handler(request):
+            first = request["json"]["entries"][0]["code"]
+            attempts[first] = attempts.get(first, 0) + 1
+            if first == "0" and attempts[first] == 1:
+                raise HttpClientError("unavailable", status_code=503, response={})
+            if first == "2":
+                raise HttpClientError("bad entry", status_code=400, response={})
+            return {"ok": True}
+
+        mock_client.http_client.add_response("/data_maps/55/entries", handler)
+        progress = []
+
+        result = mock_client.lookups.bulk_upsert(
+            55,
+            [{"code": str(i)} for i in range(4)],
+            chunk_size=2,
+            backoff=0.001,
+            on_progress=progress.append,
+        )
+
+        assert not result.ok
+        assert result.rows_upserted == 2
+        assert [(c.index, c.success, c.attempts) for c in result.chunks] == [
+            (0, True, 2),
+            (1, False, 1),
+        ]
+        assert result.failed[0].status_code == 400
+        assert len(progress) == 2
+
+    def test_attempts_skip_transport_retries_and_respect_deadline(self, mock_client):
+        """Each attempt is one request, and no wait runs past the deadline."""
+        from nexla_sdk.http_client import _transport_retries
+
+        transport_retries = []
+
+        def handler(request):
+            transport_retries.append(_transport_retries.get())
+            raise HttpClientError("unavailable", status_code=503, response={})
+
+        mock_client.http_client.add_response("/data_maps/55/entries", handler)
+
+        started = time.monotonic()
+        with mock_client.deadline(1.0):
+            result = mock_client.lookups.bulk_upsert(
+                55, [{"code": "0"}], retries=5, backoff=0.4
+            )
+
+        assert time.monotonic() - started < 1.0
+        assert result.chunks[0].attempts == 2
+        assert transport_retries == [False, False]
+
+
+@pytest.mark.unit
+class TestLookupsKeyBatching:
+    """Unit tests for URL-length-aware key batching."""
+
+    @staticmethod
+    def _entries_handler(request):
+        segment = request["url"].split("/entries/")[1]
+        return [
+            {"code": unquote(key), "label": f"label-{unquote(key)}"}
+            for key in segment.split(",")
+            if not key.startswith("missing")
+        ]
+
+    def test_get_entries_batches_and_encodes_keys(self, mock_client):
+        """Long key lists are split into URL-safe batches and merged in order."""
+        mock_client.http_client.add_response(
+            "/data_maps/55/entries/", self._entries_handler
+        )
+        keys = [f"key-{i:03d}" for i in range(100)] + ["a/b,c"]
+
+        result = mock_client.lookups.get_entries(55, keys, max_url_bytes=100)
+
+        assert [entry["code"] for entry in result] == keys
+        requests = mock_client.http_client.get_requests_by_url_pattern("/entries/")
+        segments = [r["url"].split("/entries/")[1] for r in requests]
+        assert len(segments) > 1
+        assert all(len(segment) <= 100 for segment in segments)
+        assert "a%2Fb%2Cc" in segments[-1]
+
+    def test_get_entries_map_reports_misses_and_failures(self, mock_client):
+        """Entries are keyed by primary key; misses and failures are listed."""
+
+        def handler(request):
+            if "boom" in request["url"]:
+                raise HttpClientError("unavailable", status_code=400, response={})
+            return self._entries_handler(request)
+
+        mock_client.http_client.add_response("/data_maps/55/entries/", handler)
+
+        result = mock_client.lookups.get_entries_map(
+            55,
+            ["b", "missing-1", "a", "b", "boom-long-key", "*"],
+            key_field="code",
+            max_url_bytes=12,
+        )
+
+        assert list(result.entries) == ["b", "a", "*"]
+        assert result.entries["a"]["label"] == "label-a"
+        assert result.missing == ["missing-1"]
+        # Exact keys never act as wildcards
+        assert any(r["url"].endswith("/%2A") for r in mock_client.http_client.requests)
+        assert list(result.failed) == ["boom-long-key"]
+        assert not result.ok
+
+    def test_single_requests_keep_the_api_response(self, mock_client):
+        """One-request calls return the response unchanged, whatever the size."""
+        mock_client.http_client.add_response(
+            "/data_maps/55/entries/", {"status": "ok", "entries": []}
+        )
+
+        assert mock_client.lookups.get_entries(55, "ABC*") == {
+            "status": "ok",
+            "entries": [],
+        }
+        assert mock_client.lookups.get_entries(55, ["a", "b"]) == {
+            "status": "ok",
+            "entries": [],
+        }
+        keys = [f"k{i}" for i in range(500)]
+        assert mock_client.lookups.delete_entries(55, keys)["status"] == "ok"
+        (delete,) = [
+            r for r in mock_client.http_client.requests if r["method"] == "DELETE"
+        ]
+        assert delete["url"].endswith("/entries/" + ",".join(keys))
+
+    def test_delete_entries_many_reports_per_key(self, mock_client):
+        """Many keys are deleted in batches with one result type."""
+
+        def handler(request):
+            if "k3" in request["url"]:
+                raise HttpClientError("bad", status_code=400, response={})
+            return {"status": "deleted"}
+
+        mock_client.http_client.add_response("/data_maps/55/entries/", handler)
+
+        result = mock_client.lookups.delete_entries_many(
+            55, [f"k{i}" for i in range(10)] + ["*"], max_url_bytes=10
+        )
+
+        requests = mock_client.http_client.get_requests_by_url_pattern("/entries/")
+        assert len(requests) > 1
+        assert all(r["method"] == "DELETE" for r in requests)
+        assert all(r == {"status": "deleted"} for r in result.responses)
+        assert len(result.responses) == len(requests) - 1
+        assert "k3" in result.failed and "*" in result.failed
+        assert "k0" in result.deleted_keys and "k3" not in result.deleted_keys
+        assert not result.ok
+
+
+@pytest.mark.unit
+class TestLookupsSync:
+    """Unit tests for diff-based lookup synchronization."""
+
+    REMOTE = [
+        {"code": "a", "label": "A"},
+        {"code": "b", "label": "B"},
+        {"code": "c", "label": "C"},
+    ]
+
+    @pytest.fixture
+    def sync_client(self, mock_client):
+        mock_client.http_client.add_response("/data_maps/55/entries/*", self.REMOTE)
+        mock_client.http_client.add_response("/data_maps/55/entries", {"ok": True})
+        return mock_client
+
+    def test_sync_sends_only_the_delta(self, sync_client):
+        """Only new and changed rows are upserted; removed keys are deleted."""
+        source = iter(
+            [
+                {"code": "a", "label": "A"},
+                {"code": "b", "label": "B2"},
+                {"code": "d", "label": "D"},
+                {"label": "no key"},
+            ]
+        )
+
+        report = sync_client.lookups.sync(55, source, key_field="code")
+
+        assert report.ok
+        assert (report.added, report.changed, report.unchanged) == (1, 1, 1)
+        assert (report.removed, report.skipped) == (1, 1)
+        assert report.removed_keys == ["c"]
+        http = sync_client.http_client
+        (upsert,) = [r for r in http.requests if r["method"] == "PUT"]
+        assert upsert["json"]["entries"] == [
+            {"code": "b", "label": "B2"},
+            {"code": "d", "label": "D"},
+        ]
+        (delete,) = [r for r in http.requests if r["method"] == "DELETE"]
+        assert delete["url"].endswith("/data_maps/55/entries/c")
+
+    def test_wildcard_and_comma_keys_are_never_deleted(self, mock_client):
+        """Stale keys that look like a wildcard or a key list are refused."""
+        remote = [{"code": "*"}, {"code": "x,y"}, {"code": "a b"}]
+        mock_client.http_client.add_response("/data_maps/55/entries/*", remote)
+        mock_client.http_client.add_response("/data_maps/55/entries", {"ok": True})
+
+        report = mock_client.lookups.sync(55, [], key_field="code")
+
+        assert report.removed_keys == ["*", "x,y", "a b"]
+        assert sorted(report.delete_failed) == ["*", "x,y"]
+        assert not report.ok
+        (delete,) = [
+            r for r in mock_client.http_client.requests if r["method"] == "DELETE"
+        ]
+        assert delete["url"].endswith("/data_maps/55/entries/a%20b")
+
+    def test_dry_run_writes_nothing(self, sync_client):
+        """A dry run reports the delta without upserting or deleting."""
+        report = sync_client.lookups.sync(
+            55, [{"code": "a", "label": "changed"}], key_field="code", dry_run=True
+        )
+
+        assert report.changed_keys == ["a"]
+        assert report.removed_keys == ["b", "c"]
+        assert report.upsert is None
+        methods = {r["method"] for r in sync_client.http_client.requests}
+        assert methods <= {"GET", "POST"}
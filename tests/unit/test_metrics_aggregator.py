@@ -0,0 +1,99 @@
+"""Unit tests for concurrent flow metrics aggregation."""
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.utils.metrics_aggregator import MetricsAggregator, MetricsSeries
+from tests.utils.fixtures import MockHTTPClient, create_http_error
+
+pytestmark = pytest.mark.unit
+
+
+def _metrics_server(rows_by_resource, per_page):
+    """Serve paginated runId-grouped metric rows per resource."""
+
+    def handler(request):
+        resource_id = int(request["url"].split("/")[-2])
+        if resource_id not in rows_by_resource:
+            raise create_http_error(500, "boom")
+        rows = rows_by_resource[resource_id]
+        page = request["params"]["page"]
+        chunk = rows[(page - 1) * per_page : page * per_page]
+        return {
+            "status": 200,
+            "message": "Ok",
+            "metrics": {
+                "data": {str(row["runId"]): row for row in chunk},
+                "meta": {
+                    "currentPage": page,
+                    "pageCount": -(-len(rows) // per_page),
+                    "totalCount": len(rows),
+                },
+            },
+        }
+
+    return handler
+
+
+@pytest.fixture
+def client():
+    rows = {
+        1: [{"runId": r, "records": 100, "size": 1000, "errors": r} for r in range(5)],
+        2: [{"runId": r, "records": 50, "size": 500, "errors": 0} for r in range(3)],
+    }
+    mock_http = MockHTTPClient()
+    mock_http.add_response("/data_flows", _metrics_server(rows, per_page=2))
+    client = NexlaClient(access_token="t", http_client=mock_http)
+    yield client
+    client.close()
+
+
+class TestMetricsAggregator:
+    def test_fetches_all_pages_for_all_resources(self, client):
+        report = MetricsAggregator(client, per_page=2).fetch(
+            [("data_sources", 1), ("data_sinks", 2)], "2024-01-01", "2024-01-07"
+        )
+
+        assert report.errors == []
+        assert report.totals()[("data_sources", 1)] == {
+            "records": 500.0,
+            "size": 5000.0,
+            "errors": 10.0,
+        }
+        assert len(report.series[("data_sinks", 2)]) == 3
+        # 3 pages for resource 1 and 2 pages for resource 2
+        assert len(client.http_client.requests) == 5
+
+    def test_combined_series_and_rollups(self, client):
+        report = MetricsAggregator(client, per_page=2).fetch(
+            [("data_sources", 1), ("data_sinks", 2)], "2024-01-01"
+        )
+        combined = report.combined()
+
+        assert combined.keys == [0, 1, 2, 3, 4]
+        assert list(combined.records) == [150, 150, 150, 100, 100]
+        assert combined.error_rate() == pytest.approx(10 / 650)
+        assert report.top("errors", n=1) == [("data_sources", 1)]
+        assert report.percentiles("records", q=[50]) == {50: pytest.approx(325.0)}
+
+    def test_failed_resources_are_reported(self, client):
+        report = MetricsAggregator(client).fetch(
+            [("data_sources", 1), ("data_sources", 3)], "2024-01-01"
+        )
+
+        assert list(report.series) == [("data_sources", 1)]
+        assert report.errors[0][0] == ("data_sources", 3)
+
+
+class TestMetricsSeries:
+    def test_rollups(self):
+        series = MetricsSeries(
+            [1, 2, 3, 4], [10, 20, 0, 40], [1, 2, 3, 4], [1, 2, 0, 4]
+        )
+
+        assert series.totals() == {"records": 70, "size": 10, "errors": 7}
+        assert list(series.error_rates()) == [0.1, 0.1, 0.0, 0.1]
+        assert series.percentile("records", 50) == pytest.approx(15.0)
+        assert series.percentile("records", 100) == 40
+        with pytest.raises(ValueError):
+            series.column("latency")
@@ -0,0 +1,166 @@
+"""Unit tests for the local incremental metrics store."""
+
+import datetime as dt
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.utils.metrics_store import MetricsStore
+from tests.utils.fixtures import MockHTTPClient
+
+pytestmark = pytest.mark.unit
+
+
+def _daily_server(request):
+    start = dt.date.fromisoformat(request["params"]["from"])
+    end = dt.date.fromisoformat(request["params"]["to"])
+    days = [start + dt.timedelta(days=i) for i in range((end - start).days + 1)]
+    return {
+        "status": 200,
+        "metrics": [
+            {"time": day.isoformat(), "records": day.day, "size": 10, "errors": 0}
+            for day in days
+            if day.day % 7  # some days have no data
+        ],
+    }
+
+
+class RunServer:
+    """Run summaries served newest first (highest lastWritten first)."""
+
+    def __init__(self, runs):
+        self.runs = runs
+
+    def __call__(self, request):
+        size = request["params"]["size"]
+        page = request["params"]["page"]
+        ordered = sorted(self.runs, key=lambda r: r["lastWritten"], reverse=True)
+        return {
+            "status": 200,
+            "metrics": {
+                "data": ordered[(page - 1) * size : page * size],
+                "meta": {"currentPage": page, "pageCount": -(-len(ordered) // size)},
+            },
+        }
+
+
+def _run(run_id, records=10):
+    return {
+        "runId": run_id,
+        "lastWritten": run_id * 1000,
+        "dataSetId": 7,
+        "records": records,
+        "size": 100,
+        "errors": 0,
+    }
+
+
+@pytest.fixture
+def mock_http():
+    mock_http = MockHTTPClient()
+    mock_http.add_response(
+        "/metrics/run_summary", RunServer([_run(i) for i in range(1, 8)])
+    )
+    mock_http.add_response("/metrics", _daily_server)
+    return mock_http
+
+
+@pytest.fixture
+def store(mock_http):
+    client = NexlaClient(access_token="t", http_client=mock_http)
+    store = MetricsStore(client, path=":memory:", refresh_days=1)
+    yield store
+    store.close()
+    client.close()
+
+
+class TestDailyMetrics:
+    def test_only_gaps_and_recent_days_are_fetched(self, store, mock_http):
+        today = dt.datetime.now(dt.timezone.utc).date()
+        start = today - dt.timedelta(days=20)
+
+        first = store.daily_metrics("data_sources", 1, start.isoformat())
+        assert [r.time for r in first] == [
+            (start + dt.timedelta(days=i)).isoformat()
+            for i in range(21)
+            if (start + dt.timedelta(days=i)).day % 7
+        ]
+        assert len(mock_http.requests) == 1
+
+        mock_http.clear_requests()
+        again = store.daily_metrics("data_sources", 1, start.isoformat())
+        assert again == first
+        params = [r["params"] for r in mock_http.requests]
+        assert params == [
+            {"from": today.isoformat(), "aggregate": 1, "to": today.isoformat()}
+        ]
+
+    def test_wider_range_fetches_only_new_days(self, store, mock_http):
+        store.daily_metrics("data_sources", 1, "2024-01-10", "2024-01-20")
+        mock_http.clear_requests()
+
+        store.daily_metrics("data_sources", 1, "2024-01-01", "2024-01-31")
+
+        ranges = sorted(
+            (r["params"]["from"], r["params"]["to"]) for r in mock_http.requests
+        )
+        assert ranges == [("2024-01-01", "2024-01-09"), ("2024-01-21", "2024-01-31")]
+
+    def test_partial_day_is_fetched_again_after_midnight(self, store, mock_http):
+        day = dt.date(2024, 3, 10)
+        store.sync_daily("data_sources", 1, dt.date(2024, 3, 1), day, today=day)
+
+        # The next day, the previously partial day is fetched once more
+        gaps = store.sync_daily(
+            "data_sources",
+            1,
+            dt.date(2024, 3, 1),
+            day + dt.timedelta(days=1),
+            today=day + dt.timedelta(days=1),
+        )
+        assert gaps == [(day, day + dt.timedelta(days=1))]
+
+        gaps = store.sync_daily(
+            "data_sources",
+            1,
+            dt.date(2024, 3, 1),
+            day + dt.timedelta(days=1),
+            today=day + dt.timedelta(days=1),
+        )
+        assert gaps == [(day + dt.timedelta(days=1), day + dt.timedelta(days=1))]
+
+    def test_persisted_between_instances(self, mock_http, tmp_path):
+        client = NexlaClient(access_token="t", http_client=mock_http)
+        path = str(tmp_path / "metrics.sqlite")
+        with MetricsStore(client, path=path) as store:
+            store.daily_metrics("data_sets", 2, "2024-02-01", "2024-02-05")
+        mock_http.clear_requests()
+
+        with MetricsStore(client, path=path) as store:
+            rows = store.daily_metrics("data_sets", 2, "2024-02-01", "2024-02-05")
+        assert len(rows) == 5
+        assert mock_http.requests == []
+        client.close()
+
+
+class TestRunMetrics:
+    def test_stops_paging_at_known_runs(self, store, mock_http):
+        runs = store.metrics_by_run("data_sources", 1, page_size=3)
+        assert [r.runId for r in runs] == list(range(1, 8))
+        assert len(mock_http.requests) == 3
+
+        mock_http.responses["/metrics/run_summary"].runs.append(_run(8))
+        mock_http.clear_requests()
+        runs = store.metrics_by_run("data_sources", 1, page_size=3)
+
+        assert [r.runId for r in runs] == list(range(1, 9))
+        # page 1 has the new run, page 2 is all known
+        assert len(mock_http.requests) == 2
+
+    def test_invalidate(self, store, mock_http):
+        store.metrics_by_run("data_sources", 1, page_size=10)
+        store.invalidate("data_sources", 1)
+        mock_http.clear_requests()
+
+        store.metrics_by_run("data_sources", 1, page_size=10)
+        assert len(mock_http.requests) == 1
@@ -3,14 +3,15 @@
 import pytest
 from pydantic import ValidationError
 
-from nexla_sdk.exceptions import NotFoundError, ServerError
+from nexla_sdk.exceptions import NexlaError, NotFoundError, ServerError
 from nexla_sdk.http_client import HttpClientError
 from nexla_sdk.models.nexsets.requests import (
     NexsetCopyOptions,
     NexsetCreate,
     NexsetUpdate,
 )
-from nexla_sdk.models.nexsets.responses import Nexset
+from nexla_sdk.models.nexsets.responses import Nexset, NexsetSample
+from tests.utils.fixtures import create_http_error
 from tests.utils.mock_builders import MockDataFactory
 
 
@@ -338,3 +339,107 @@ class TestNexsetsResource:
         # Assert
         assert nexsets == []
         assert len(nexsets) == 0
+
+
+class TestNexsetsSampleStreaming:
+    """Test streaming and parallel sampling."""
+
+    @staticmethod
+    def _samples(request):
+        count = request["params"]["count"]
+        set_id = int(request["url"].split("/data_sets/")[1].split("/")[0])
+        if set_id == 13:
+            raise create_http_error(500, "boom")
+        return [
+            {"id": set_id * 10000 + i, "even": i % 2 == 0 or None} for i in range(count)
+        ]
+
+    def test_iter_samples_outputs(self, mock_client):
+        mock_client.http_client.add_response("/samples", self._samples)
+
+        models = list(mock_client.nexsets.iter_samples(1, count=3))
+        assert all(isinstance(sample, NexsetSample) for sample in models)
+        raw = list(mock_client.nexsets.iter_samples(1, count=3, output="raw"))
+        assert raw[0] == {"id": 10000, "even": True}
+
+        batches = list(
+            mock_client.nexsets.iter_samples(1, count=5, output="columns", batch_size=2)
+        )
+        assert [len(batch["id"]) for batch in batches] == [2, 2, 1]
+        assert batches[0]["even"] == [True, None]
+
+    def test_count_is_capped_per_request(self, mock_client):
+        mock_client.http_client.add_response("/samples", self._samples)
+
+        raw = list(
+            mock_client.nexsets.iter_samples(
+                1, count=50, max_per_request=20, output="raw"
+            )
+        )
+        assert len(raw) == 20
+        assert mock_client.http_client.get_last_request()["params"]["count"] == 20
+
+    def test_reservoir_sampling_spans_requests(self, mock_client):
+        calls = []
+
+        def live_samples(request):
+            calls.append(request)
+            offset = len(calls) * 100
+            return [{"id": offset + i} for i in range(request["params"]["count"])]
+
+        mock_client.http_client.add_response("/samples", live_samples)
+
+        raw = list(
+            mock_client.nexsets.iter_samples(
+                1,
+                count=30,
+                live=True,
+                output="raw",
+                reservoir=True,
+                passes=4,
+                max_per_request=20,
+                seed=7,
+            )
+        )
+        assert len(calls) == 4
+        assert len(raw) == 30
+        assert len({row["id"] for row in raw}) == 30
+        assert any(row["id"] >= 300 for row in raw)
+
+    def test_reservoir_defaults_sample_beyond_the_first_records(self, mock_client):
+        calls = []
+
+        def live_samples(request):
+            calls.append(request)
+            offset = len(calls) * 100
+            return [{"id": offset + i} for i in range(request["params"]["count"])]
+
+        mock_client.http_client.add_response("/samples", live_samples)
+
+        raw = list(
+            mock_client.nexsets.iter_samples(
+                1, count=40, live=True, output="raw", reservoir=True, max_per_request=20
+            )
+        )
+        # Twice the two requests needed to fill the reservoir
+        assert len(calls) == 4 and len(raw) == 40
+        assert any(row["id"] >= 300 for row in raw)
+
+        with pytest.raises(ValueError, match="live=True"):
+            mock_client.nexsets.iter_samples(1, count=40, reservoir=True)
+
+    def test_unexpected_samples_response_raises(self, mock_client):
+        mock_client.http_client.add_response("/samples", {"error": "not ready"})
+
+        with pytest.raises(NexlaError, match="Unexpected samples response"):
+            list(mock_client.nexsets.iter_samples(1, count=3, output="raw"))
+
+    def test_sample_many_reports_failures(self, mock_client):
+        mock_client.http_client.add_response("/samples", self._samples)
+
+        results = {
+            r.set_id: r
+            for r in mock_client.nexsets.sample_many([1, 2, 13], count=4, concurrency=3)
+        }
+        assert results[1].rows == 4 and results[2].samples[0]["id"] == 20000
+        assert not results[13].success and results[13].status_code == 500
@@ -0,0 +1,143 @@
+"""Unit tests for the org dashboard aggregator."""
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.utils.org_dashboard import OrgDashboard
+from tests.utils.fixtures import MockHTTPClient, create_http_error
+
+pytestmark = pytest.mark.unit
+
+
+def _user_id(request):
+    return int(request["url"].split("/users/")[1].split("/")[0])
+
+
+def _dashboard(request):
+    user_id = _user_id(request)
+    if user_id == 99:
+        raise create_http_error(500, "boom")
+    return {
+        "status": 200,
+        "metrics": {
+            "data_sources": {
+                "1": {
+                    "records": 10 * user_id,
+                    "size": 100,
+                    "errors": user_id,
+                    "status": "OK",
+                },
+                "2": {"records": 5, "size": 50, "errors": 0, "status": "ERROR"},
+            }
+        },
+    }
+
+
+def _account_metrics(request):
+    return {
+        "status": 200,
+        "metrics": [{"records": 1000 * _user_id(request), "size": 1, "errors": 2}],
+    }
+
+
+def _daily_metrics(request):
+    return {
+        "status": 200,
+        "metrics": [
+            {"time": "2024-01-01", "records": 1, "size": 10, "errors": 0},
+            {"time": "2024-01-02", "records": 2, "size": 20, "errors": 1},
+        ],
+    }
+
+
+@pytest.fixture
+def client():
+    mock_http = MockHTTPClient()
+    mock_http.add_response("/orgs/7/flows/account_metrics", {"status": 200})
+    mock_http.add_response("/flows/dashboard", _dashboard)
+    mock_http.add_response("/flows/account_metrics", _account_metrics)
+    mock_http.add_response("/metrics", _daily_metrics)
+    mock_http.add_response(
+        "/orgs/7/account_summary",
+        {
+            "org_id": 7,
+            "data_sources": {"total": 3},
+            "data_sets": {},
+            "data_sinks": {"total": 1},
+        },
+    )
+    mock_http.add_response(
+        "/orgs/7/members",
+        [
+            {
+                "id": u,
+                "full_name": "n",
+                "email": "e@x.io",
+                "is_admin?": False,
+                "org_membership_status": "ACTIVE",
+                "user_status": "ACTIVE",
+            }
+            for u in (1, 2)
+        ],
+    )
+    client = NexlaClient(access_token="t", http_client=mock_http)
+    yield client
+    client.close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestOrgDashboard:
+    def test_summary_merges_users_and_org(self, client):
+        summary = OrgDashboard(client, concurrency=8).summary(7, "2024-01-01")
+
+        assert summary.user_ids == [1, 2]
+        assert summary.account_summary.data_sources == {"total": 3}
+        assert summary.flow_account_metrics == {"status": 200}
+        assert summary.totals() == {"records": 40.0, "size": 300.0, "errors": 3.0}
+        assert list(summary.account.records) == [1000, 2000]
+        assert summary.top("errors", n=1) == [2]
+        assert summary.statuses[1] == {"OK": 1, "WARNING": 0, "ERROR": 1}
+        # Two users, two resource types: each day summed across users
+        assert summary.daily["SOURCE"].keys == ["2024-01-01", "2024-01-02"]
+        assert list(summary.daily["SINK"].records) == [2, 4]
+        row = next(summary.rows())
+        assert row["records_24h"] == 15 and row["records"] == 1000
+        assert summary.errors == {}
+
+    def test_user_results_are_cached_until_ttl(self, client):
+        clock = FakeClock()
+        dashboard = OrgDashboard(client, ttl=60, clock=clock)
+        dashboard.summary(7, "2024-01-01", user_ids=[1, 2])
+        calls = len(client.http_client.requests)
+
+        clock.now = 30
+        summary = dashboard.summary(7, "2024-01-01", user_ids=[1, 2])
+        assert summary.cached_users == [1, 2]
+        # Only the two org-level calls were repeated
+        assert len(client.http_client.requests) == calls + 2
+
+        clock.now = 61
+        summary = dashboard.summary(7, "2024-01-01", user_ids=[1, 2])
+        assert summary.cached_users == []
+
+        dashboard.invalidate(1)
+        summary = dashboard.summary(7, "2024-01-01", user_ids=[1, 2])
+        assert summary.cached_users == [2]
+
+    def test_failures_are_reported_and_not_cached(self, client):
+        dashboard = OrgDashboard(client, ttl=60, clock=FakeClock())
+        summary = dashboard.summary(7, "2024-01-01", user_ids=[1, 99])
+
+        assert list(summary.errors) == ["99/dashboard"]
+        assert summary.user_ids == [1, 99]
+        assert summary.last_24h.records[1] == 0
+
+        summary = dashboard.summary(7, "2024-01-01", user_ids=[1, 99])
+        assert summary.cached_users == [1]
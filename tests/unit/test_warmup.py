@@ -0,0 +1,113 @@
+"""Unit tests for client warm-up."""
+
+import asyncio
+import threading
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.exceptions import AuthenticationError
+from tests.utils.fixtures import (
+    MockHTTPClient,
+    create_auth_token_response,
+    create_http_error,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class WarmableHTTPClient(MockHTTPClient):
+    """Mock client exposing the optional warm_connections hook."""
+
+    def __init__(self):
+        super().__init__()
+        self.warmed = []
+
+    def warm_connections(self, url, connections=4):
+        self.warmed.append((url, connections))
+        return connections
+
+
+@pytest.fixture
+def mock_http():
+    mock_http = WarmableHTTPClient()
+    mock_http.add_response("/token", create_auth_token_response(access_token="tk"))
+    return mock_http
+
+
+def test_warmup_obtains_token_and_opens_connections(mock_http):
+    client = NexlaClient(
+        service_key="sk", base_url="https://api.test/nexla-api", http_client=mock_http
+    )
+
+    result = client.warmup(connections=6)
+
+    assert result == {"token": True, "connections": 6}
+    assert mock_http.warmed == [("https://api.test/nexla-api", 6)]
+    assert client.auth_handler.get_access_token() == "tk"
+
+    # First real request reuses the token
+    mock_http.clear_requests()
+    mock_http.add_response("/limits", {"limit": 1})
+    client.metrics.get_rate_limits()
+    assert not mock_http.get_requests_by_url_pattern("/token")
+
+
+def test_warmup_without_connection_hook():
+    mock_http = MockHTTPClient()
+    client = NexlaClient(access_token="direct", http_client=mock_http)
+    assert client.warmup() == {"token": True, "connections": 0}
+    assert mock_http.requests == []
+
+
+def test_warmup_raises_on_bad_service_key():
+    mock_http = MockHTTPClient()
+    mock_http.add_error("/token", create_http_error(401, "bad key"))
+    client = NexlaClient(service_key="bad", http_client=mock_http)
+    with pytest.raises(AuthenticationError):
+        client.warmup()
+
+
+def test_prewarm_runs_in_background(mock_http):
+    client = NexlaClient(service_key="sk", http_client=mock_http, prewarm=True)
+    assert client._warmup_future.result(timeout=5)["token"] is True
+
+
+def test_warmup_async(mock_http):
+    client = NexlaClient(service_key="sk", http_client=mock_http)
+    result = asyncio.run(client.warmup_async(connections=2))
+    assert result["connections"] == 2
+
+
+def test_concurrent_token_acquisition_is_shared():
+    mock_http = MockHTTPClient()
+    calls = {"n": 0}
+    lock = threading.Lock()
+
+    def token_responder(_req):
+        with lock:
+            calls["n"] += 1
+        return create_auth_token_response(access_token="tk")
+
+    mock_http.add_response("/token", token_responder)
+    client = NexlaClient(service_key="sk", http_client=mock_http)
+
+    threads = [threading.Thread(target=client.get_access_token) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls["n"] == 1
+
+
+def test_requests_client_warm_connections_tolerates_http_errors():
+    import responses
+
+    from nexla_sdk.http_client import RequestsHttpClient
+
+    http_client = RequestsHttpClient(pool_maxsize=3)
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.HEAD, "https://api.test/nexla-api", status=404)
+        assert http_client.warm_connections("https://api.test/nexla-api", 10) == 3
+        assert len(rsps.calls) == 3
@@ -0,0 +1,238 @@
+"""Unit tests for the asyncio webhook sender."""
+
+import asyncio
+import json
+import threading
+import time
+import types
+
+import pytest
+
+from nexla_sdk import NexlaClient
+from nexla_sdk.http_client import HttpClientError
+from nexla_sdk.resources.webhooks import WebhooksResource
+from nexla_sdk.utils import webhook_async
+from tests.utils.fixtures import MockHTTPClient
+
+pytestmark = pytest.mark.unit
+
+URL_A = "https://api.nexla.com/webhook/a"
+URL_B = "https://api.nexla.com/webhook/b"
+
+
+def _accept(request):
+    return {"dataset_id": 1, "processed": len(request["json"])}
+
+
+class FakeResponse:
+    def __init__(self, status, payload):
+        self.status = status
+        self.headers = {"Content-Type": "application/json"}
+        self._text = json.dumps(payload)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def text(self):
+        return self._text
+
+
+class FakeSession:
+    """Stands in for aiohttp.ClientSession; ``statuses`` are served in order."""
+
+    instances = []
+
+    def __init__(self, connector=None, timeout=None):
+        self.connector = connector
+        self.timeout = timeout
+        self.posts = []
+        self.statuses = []
+        self.closed = False
+        FakeSession.instances.append(self)
+
+    def post(self, url, data=None, headers=None, params=None):
+        self.posts.append({"url": url, "data": data, "headers": headers})
+        status = self.statuses.pop(0) if self.statuses else 200
+        records = json.loads(data)
+        return FakeResponse(status, {"dataset_id": 1, "processed": len(records)})
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_aiohttp(monkeypatch):
+    FakeSession.instances = []
+    module = types.SimpleNamespace(
+        ClientSession=FakeSession,
+        TCPConnector=lambda limit: types.SimpleNamespace(limit=limit),
+        ClientTimeout=lambda total: types.SimpleNamespace(total=total),
+    )
+    monkeypatch.setattr(webhook_async, "aiohttp", module)
+    monkeypatch.setattr(webhook_async, "_aiohttp_available", True)
+    return FakeSession
+
+
+class TestAsyncWebhookSender:
+    def test_send_all_reports_each_batch(self):
+        mock_http = MockHTTPClient()
+        mock_http.add_response("/webhook/", _accept)
+        webhooks = WebhooksResource(api_key="key", http_client=mock_http)
+
+        async def run():
+            async with webhooks.async_sender(auth_method="header") as sender:
+                return await sender.send_all(
+                    [(URL_A, [{"n": 1}, {"n": 2}]), (URL_B, [{"n": 3}])]
+                )
+
+        deliveries = asyncio.run(run())
+
+        assert [d.webhook_url for d in deliveries] == [URL_A, URL_B]
+        assert [d.response.processed for d in deliveries] == [2, 1]
+        assert all(d.success and d.latency >= 0 for d in deliveries)
+        assert deliveries[0].bytes == len(b'[{"n":1},{"n":2}]')
+        assert mock_http.requests[0]["headers"]["Authorization"] == "Basic a2V5"
+
+    def test_per_url_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        in_flight = {URL_A: 0, URL_B: 0}
+        peak = {URL_A: 0, URL_B: 0, "total": 0}
+
+        def slow(request):
+            url = request["url"]
+            with lock:
+                in_flight[url] += 1
+                peak[url] = max(peak[url], in_flight[url])
+                peak["total"] = max(peak["total"], sum(in_flight.values()))
+            time.sleep(0.05)
+            with lock:
+                in_flight[url] -= 1
+            return _accept(request)
+
+        mock_http = MockHTTPClient()
+        mock_http.add_response("/webhook/", slow)
+        webhooks = WebhooksResource(api_key="key", http_client=mock_http)
+
+        async def run():
+            async with webhooks.async_sender(per_url_concurrency=2) as sender:
+                return await sender.send_all(
+                    [(url, [{"n": i}]) for i in range(6) for url in (URL_A, URL_B)]
+                )
+
+        deliveries = asyncio.run(run())
+
+        assert all(d.success for d in deliveries)
+        assert peak[URL_A] <= 2 and peak[URL_B] <= 2
+        assert peak["total"] > 2
+
+    def test_retries_server_errors_but_not_client_errors(self):
+        calls = []
+
+        def flaky(request):
+            calls.append(request["url"])
+            if request["url"] == URL_B:
+                raise HttpClientError("bad", status_code=400)
+            if len(calls) == 1:
+                raise HttpClientError("unavailable", status_code=503)
+            return _accept(request)
+
+        mock_http = MockHTTPClient()
+        mock_http.add_response("/webhook/", flaky)
+        webhooks = WebhooksResource(api_key="key", http_client=mock_http)
+
+        async def run():
+            sender = webhooks.async_sender(backoff=0.001)
+            try:
+                first = await sender.send_many_records(URL_A, [{"n": 1}])
+                second = await sender.send_many_records(URL_B, [{"n": 2}])
+            finally:
+                await sender.close()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first.success and first.attempts == 2
+        assert not second.success and second.attempts == 1
+        assert "bad" in second.error
+
+
+class TestAsyncWebhookSenderAiohttp:
+    def test_posts_through_one_pooled_session(self, fake_aiohttp):
+        webhooks = WebhooksResource(api_key="key")
+
+        async def run():
+            sender = webhooks.async_sender(
+                max_connections=8, timeout=5, auth_method="header"
+            )
+            assert sender.uses_aiohttp
+            try:
+                return await sender.send_all(
+                    [(URL_A, [{"n": i}]) for i in range(5)] + [(URL_B, [{"n": 9}])]
+                )
+            finally:
+                await sender.close()
+
+        deliveries = asyncio.run(run())
+
+        assert all(d.success and d.response.processed == 1 for d in deliveries)
+        # Every batch shared one session and its connection pool
+        (session,) = fake_aiohttp.instances
+        assert session.connector.limit == 8 and session.timeout.total == 5
+        assert len(session.posts) == 6 and session.closed
+        assert session.posts[0]["data"] == b'[{"n":0}]'
+        assert session.posts[0]["headers"]["Authorization"] == "Basic a2V5"
+
+    def test_retries_server_errors_but_not_client_errors(self, fake_aiohttp):
+        webhooks = WebhooksResource(api_key="key")
+
+        async def run():
+            async with webhooks.async_sender(backoff=0.001) as sender:
+                await sender.send_many_records(URL_A, [])  # opens the session
+                session = fake_aiohttp.instances[0]
+                session.statuses = [503, 200, 400]
+                first = await sender.send_many_records(URL_A, [{"n": 1}])
+                second = await sender.send_many_records(URL_B, [{"n": 2}])
+                return first, second, session
+
+        first, second, session = asyncio.run(run())
+
+        assert first.success and first.attempts == 2
+        assert not second.success and second.attempts == 1
+        assert "HTTP error 400" in second.error
+        assert [p["data"] for p in session.posts[1:3]] == [b'[{"n":1}]'] * 2
+
+    def test_client_webhooks_use_aiohttp(self, fake_aiohttp):
+        client = NexlaClient(access_token="t")
+        webhooks = client.create_webhook_client(api_key="key")
+        # A sync send creates the resource's HTTP client lazily
+        webhooks._get_http_client()
+
+        async def run():
+            async with webhooks.async_sender() as sender:
+                assert sender.uses_aiohttp
+                return await sender.send_many_records(URL_A, [{"n": 1}])
+
+        delivery = asyncio.run(run())
+        client.close()
+
+        assert delivery.success
+        (session,) = fake_aiohttp.instances
+        assert session.posts[0]["data"] == b'[{"n":1}]'
+
+    def test_user_supplied_http_client_keeps_threaded_path(self, fake_aiohttp):
+        mock_http = MockHTTPClient()
+        mock_http.add_response("/webhook/", _accept)
+        client = NexlaClient(access_token="t", http_client=mock_http)
+        webhooks = client.create_webhook_client(api_key="key")
+
+        async def run():
+            async with webhooks.async_sender() as sender:
+                assert not sender.uses_aiohttp
+                return await sender.send_many_records(URL_A, [{"n": 1}])
+
+        assert asyncio.run(run()).success
+        assert not fake_aiohttp.instances
+        assert mock_http.requests[-1]["json"] == [{"n": 1}]
@@ -0,0 +1,164 @@
+"""Unit tests for the buffered webhook producer."""
+
+import threading
+
+import pytest
+
+from nexla_sdk.exceptions import (
+    BufferFullError,
+    NexlaError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    is_retryable_error,
+)
+from nexla_sdk.http_client import HttpClientError, _transport_retries
+from nexla_sdk.resources.webhooks import WebhooksResource
+from tests.utils.fixtures import MockHTTPClient
+
+pytestmark = pytest.mark.unit
+
+URL_A = "https://api.nexla.com/webhook/a"
+URL_B = "https://api.nexla.com/webhook/b"
+
+
+def _accept(request):
+    return {"dataset_id": 1, "processed": len(request["json"])}
+
+
+@pytest.fixture
+def mock_http():
+    mock_http = MockHTTPClient()
+    mock_http.add_response("/webhook/", _accept)
+    return mock_http
+
+
+@pytest.fixture
+def webhooks(mock_http):
+    return WebhooksResource(api_key="key", http_client=mock_http)
+
+
+def _batches(mock_http, url=None):
+    return [r["json"] for r in mock_http.requests if url is None or r["url"] == url]
+
+
+class TestWebhookProducer:
+    def test_batches_per_url_by_count_and_flush(self, webhooks, mock_http):
+        deliveries = []
+        producer = webhooks.producer(
+            batch_size=3, linger=60, on_delivery=deliveries.append
+        )
+        for i in range(7):
+            producer.send(URL_A, {"i": i})
+        producer.send(URL_B, {"i": "b"})
+
+        assert producer.flush(timeout=5)
+        assert sorted(len(b) for b in _batches(mock_http, URL_A)) == [1, 3, 3]
+        assert _batches(mock_http, URL_B) == [[{"i": "b"}]]
+        assert producer.delivered == 8 and len(producer) == 0
+        assert all(d.success and d.response.processed == d.records for d in deliveries)
+        producer.close()
+
+    def test_batches_by_bytes_and_linger(self, webhooks, mock_http):
+        done = threading.Event()
+        producer = webhooks.producer(batch_size=1000, max_batch_bytes=40, linger=0.01)
+        for i in range(4):
+            producer.send(URL_A, {"value": "x" * 10, "i": i})
+        producer.send(URL_A, {"last": True}, callback=lambda d: done.set())
+
+        # Lingering batch goes out without an explicit flush
+        assert done.wait(5)
+        assert all(len(batch) <= 2 for batch in _batches(mock_http))
+        producer.close()
+
+    def test_retries_and_reports_failures(self, webhooks, mock_http):
+        calls = {"n": 0}
+        transport_retries = []
+
+        def flaky(request):
+            calls["n"] += 1
+            transport_retries.append(_transport_retries.get())
+            if request["url"] == URL_B:
+                raise HttpClientError("bad", status_code=400, response={})
+            if calls["n"] == 1:
+                raise HttpClientError("unavailable", status_code=503, response={})
+            return _accept(request)
+
+        mock_http.add_response("/webhook/", flaky)
+        deliveries = []
+        with webhooks.producer(
+            batch_size=10, linger=60, backoff=0.001, on_delivery=deliveries.append
+        ) as producer:
+            producer.send(URL_A, {"i": 1})
+            producer.flush(timeout=5)
+            producer.send(URL_B, {"i": 2})
+
+        by_url = {d.webhook_url: d for d in deliveries}
+        assert by_url[URL_A].success and by_url[URL_A].attempts == 2
+        assert not by_url[URL_B].success and by_url[URL_B].attempts == 1
+        assert (producer.delivered, producer.failed) == (1, 1)
+        # The producer retries, so the transport does not retry as well
+        assert transport_retries == [False, False, False]
+
+    def test_backpressure_and_closed_producer(self, webhooks, mock_http):
+        release = threading.Event()
+
+        def slow(request):
+            release.wait(5)
+            return _accept(request)
+
+        mock_http.add_response("/webhook/", slow)
+        producer = webhooks.producer(
+            batch_size=1, linger=0, max_buffered_records=2, max_block=0.05
+        )
+        producer.send(URL_A, {"i": 1})
+        producer.send(URL_A, {"i": 2})
+        with pytest.raises(BufferFullError):
+            producer.send(URL_A, {"i": 3})
+
+        release.set()
+        assert producer.close(timeout=5)
+        with pytest.raises(NexlaError, match="closed"):
+            producer.send(URL_A, {"i": 4})
+
+    def test_raising_callback_does_not_skip_others(self, webhooks, caplog):
+        def broken(delivery):
+            raise RuntimeError("callback bug")
+
+        received = []
+        with webhooks.producer(batch_size=2, linger=60, on_delivery=broken) as producer:
+            producer.send(URL_A, {"i": 1}, callback=broken)
+            producer.send(URL_A, {"i": 2}, callback=received.append)
+
+        assert [d.records for d in received] == [2]
+        assert producer.delivered == 2
+        assert "callback bug" in caplog.text
+
+    def test_unexpected_errors_are_reported_as_failures(self, webhooks):
+        def broken(*args, **kwargs):
+            raise OSError("socket closed")
+
+        webhooks.send_many_records = broken
+        deliveries, per_record = [], []
+        with webhooks.producer(batch_size=1, on_delivery=deliveries.append) as producer:
+            producer.send(URL_A, {"i": 1}, callback=per_record.append)
+
+        assert [d.success for d in deliveries] == [False]
+        assert "socket closed" in deliveries[0].error
+        assert per_record == deliveries and producer.failed == 1
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (RateLimitError("slow down", status_code=429), True),
+        (ServerError("boom", status_code=503), True),
+        (ServerError("teapot", status_code=418), False),
+        (NexlaError("connection reset"), True),
+        (NexlaError("rejected", original_error=HttpClientError("x", 400)), False),
+        (NexlaError("flaky", original_error=HttpClientError("x", 502)), True),
+        (NotFoundError("gone"), False),
+    ],
+)
+def test_is_retryable_error(error, retryable):
+    assert is_retryable_error(error) is retryable
@@ -0,0 +1,142 @@
+"""Unit tests for the durable webhook spool."""
+
+import os
+import threading
+
+import pytest
+
+from nexla_sdk.http_client import HttpClientError
+from nexla_sdk.resources.webhooks import WebhooksResource
+from nexla_sdk.utils.webhook_spool import WebhookSpool
+from tests.utils.fixtures import MockHTTPClient
+
+pytestmark = pytest.mark.unit
+
+URL = "https://api.nexla.com/webhook/a"
+
+
+def _logs(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".log"))
+
+
+class TestWebhookSpool:
+    def test_unacked_batches_survive_reopen(self, tmp_path):
+        with WebhookSpool(str(tmp_path), fsync="never") as spool:
+            first = spool.append(URL, [{"n": 1}, {"n": 2}])
+            second = spool.append(URL, [{"n": 3}])
+            spool.ack(first)
+            lag = spool.lag()
+            assert (lag.pending_batches, lag.pending_records) == (1, 1)
+            assert lag.appended == 2 and lag.acked == 1
+
+        with WebhookSpool(str(tmp_path)) as spool:
+            pending = list(spool.pending())
+            assert [(b.seq, b.records) for b in pending] == [(second, [{"n": 3}])]
+            # Sequence numbers continue after the recovered ones
+            assert spool.append(URL, []) == second + 1
+
+    def test_acknowledged_segments_are_deleted(self, tmp_path):
+        with WebhookSpool(str(tmp_path), segment_bytes=100) as spool:
+            seqs = [spool.append(URL, [{"payload": "x" * 40}]) for _ in range(4)]
+            assert len(_logs(tmp_path)) == 4
+
+            for seq in seqs[:3]:
+                spool.ack(seq)
+            assert len(_logs(tmp_path)) == 1
+
+            spool.ack(seqs[3])
+            assert spool.compact() == 1
+            lag = spool.lag()
+            assert lag.pending_batches == 0 and lag.disk_bytes == 0
+            assert len(_logs(tmp_path)) == 1
+
+    def test_torn_tail_is_dropped(self, tmp_path):
+        with WebhookSpool(str(tmp_path)) as spool:
+            spool.append(URL, [{"n": 1}])
+        path = os.path.join(str(tmp_path), _logs(tmp_path)[0])
+        with open(path, "ab") as handle:
+            handle.write(b'{"seq":2,"url":"')
+
+        with WebhookSpool(str(tmp_path)) as spool:
+            assert [b.seq for b in spool.pending()] == [1]
+            assert spool.append(URL, [{"n": 2}]) == 2
+            assert [b.records for b in spool.pending()] == [[{"n": 1}], [{"n": 2}]]
+
+    def test_producer_replays_undelivered_batches(self, tmp_path):
+        failing = MockHTTPClient()
+        failing.add_response(
+            "/webhook/", HttpClientError("unavailable", status_code=503)
+        )
+        spool = WebhookSpool(str(tmp_path))
+        webhooks = WebhooksResource(api_key="key", http_client=failing)
+        with webhooks.producer(spool=spool, batch_size=2, retries=0) as producer:
+            for n in range(3):
+                producer.send(URL, {"n": n})
+        assert producer.failed == 3
+        spool.close()
+
+        accepting = MockHTTPClient()
+        accepting.add_response("/webhook/", {"processed": 1})
+        spool = WebhookSpool(str(tmp_path))
+        assert len(spool) == 2
+        webhooks = WebhooksResource(api_key="key", http_client=accepting)
+        with webhooks.producer(spool=spool) as producer:
+            pass
+        sent = sorted((r["json"] for r in accepting.requests), key=len, reverse=True)
+        assert sent == [[{"n": 0}, {"n": 1}], [{"n": 2}]]
+        assert len(spool) == 0
+        spool.close()
+
+    def test_rejected_batches_are_dead_lettered(self, tmp_path):
+        rejecting = MockHTTPClient()
+        rejecting.add_response("/webhook/", HttpClientError("bad", status_code=400))
+        deliveries = []
+        with WebhookSpool(str(tmp_path)) as spool:
+            webhooks = WebhooksResource(api_key="key", http_client=rejecting)
+            with webhooks.producer(
+                spool=spool, batch_size=2, on_delivery=deliveries.append
+            ) as producer:
+                producer.send(URL, {"n": 1})
+
+            assert [(d.success, d.dead_lettered) for d in deliveries] == [(False, True)]
+            # Not replayed again, but kept with the error for inspection
+            assert len(spool) == 0 and spool.lag().dead_lettered == 1
+            (dead,) = spool.dead_letters()
+            assert dead.records == [{"n": 1}] and "bad" in dead.error
+
+    def test_failed_batches_are_resent_while_producer_runs(self, tmp_path):
+        calls = {"n": 0}
+
+        def recovering(request):
+            calls["n"] += 1
+            if calls["n"] <= 2:
+                raise HttpClientError("unavailable", status_code=503)
+            return {"processed": len(request["json"])}
+
+        mock_http = MockHTTPClient()
+        mock_http.add_response("/webhook/", recovering)
+        deliveries = []
+        done = threading.Event()
+
+        def record(delivery):
+            deliveries.append(delivery)
+            if delivery.success:
+                done.set()
+
+        with WebhookSpool(str(tmp_path)) as spool:
+            webhooks = WebhooksResource(api_key="key", http_client=mock_http)
+            with webhooks.producer(
+                spool=spool,
+                retries=0,
+                backoff=0.01,
+                max_redrive_interval=0.02,
+                on_delivery=record,
+            ) as producer:
+                producer.send(URL, {"n": 1})
+                assert producer.flush(timeout=5)
+                # Resent in the background, without restarting the producer
+                assert done.wait(5)
+
+            assert [d.success for d in deliveries] == [False, True]
+            assert (producer.delivered, producer.failed) == (1, 1)
+            assert calls["n"] == 3 and len(spool) == 0
@@ -332,3 +332,101 @@ class TestWebhooksHTTPClientCreation:
 
         returned_client = webhooks._get_http_client()
         assert returned_client is mock_client
+
+
+class TestWebhooksRawRecords:
+    """Tests for sending pre-encoded payloads."""
+
+    URL = "https://api.nexla.com/webhook/abc123"
+
+    @pytest.fixture
+    def mock_client(self):
+        mock_client = MockHTTPClient()
+        mock_client.add_response("/webhook/", {"dataset_id": 1, "processed": 2})
+        return mock_client
+
+    def _body(self, request):
+        data = request["data"]
+        if isinstance(data, (bytes, bytearray)):
+            return bytes(data)
+        return b"".join(bytes(chunk) for chunk in data)
+
+    def test_json_bytes_are_sent_unchanged(self, mock_client):
+        webhooks = WebhooksResource(api_key="key", http_client=mock_client)
+        payload = b'[{"id":1},{"id":2}]'
+
+        response = webhooks.send_raw_records(self.URL, payload)
+
+        assert response.processed == 2
+        request = mock_client.requests[0]
+        assert request["data"] is payload
+        assert request["json"] == {}
+        assert request["params"] == {"api_key": "key"}
+
+    def test_ndjson_is_framed_as_array(self, mock_client):
+        webhooks = WebhooksResource(api_key="key", http_client=mock_client)
+        buffer = bytearray(b'{"id":1}\n\n{"id":2}\r\n')
+
+        webhooks.send_raw_records(self.URL, memoryview(buffer), format="ndjson")
+        webhooks.send_raw_records(
+            self.URL, [b'{"id":3}\n', b'{"id":4}'], format="ndjson"
+        )
+
+        bodies = [self._body(r) for r in mock_client.requests]
+        assert bodies == [b'[{"id":1},{"id":2}]', b'[{"id":3},{"id":4}]']
+
+    def test_files_stream(self, mock_client, tmp_path):
+        webhooks = WebhooksResource(api_key="key", http_client=mock_client)
+        path = tmp_path / "events.ndjson"
+        path.write_bytes(b'{"id":1}\n{"id":2}\n')
+
+        with open(path, "rb") as f:
+            webhooks.send_raw_records(self.URL, f, format="ndjson")
+            # The mock leaves the stream unread; a real client drains it here
+            body = self._body(mock_client.requests[0])
+        assert body == b'[{"id":1},{"id":2}]'
+
+        with pytest.raises(ValueError):
+            webhooks.send_raw_records(self.URL, b"[]", format="csv")
+
+    def test_streamed_body_is_rebuilt_for_a_retry(self, mock_client, tmp_path):
+        bodies = []
+
+        def unavailable_once(request):
+            bodies.append(self._body(request))
+            if len(bodies) % 2:
+                raise HttpClientError("unavailable", status_code=503)
+            return {"dataset_id": 1, "processed": 2}
+
+        mock_client.add_response("/webhook/", unavailable_once)
+        webhooks = WebhooksResource(api_key="key", http_client=mock_client)
+        path = tmp_path / "events.ndjson"
+        path.write_bytes(b'{"id":1}\n{"id":2}\n')
+
+        with open(path, "rb") as f:
+            webhooks.send_raw_records(self.URL, f, format="ndjson", backoff=0.001)
+        webhooks.send_raw_records(
+            self.URL, memoryview(b'[{"id":1},{"id":2}]'), backoff=0.001
+        )
+
+        # The retry after each 503 sent the whole body again
+        assert bodies == [b'[{"id":1},{"id":2}]'] * 4
+
+    def test_one_shot_iterables_are_not_retried(self, mock_client):
+        mock_client.add_error(
+            "/webhook/", HttpClientError("unavailable", status_code=503)
+        )
+        webhooks = WebhooksResource(api_key="key", http_client=mock_client)
+        chunks = iter([b'[{"id":1}', b"]"])
+
+        with pytest.raises(NexlaError):
+            webhooks.send_raw_records(self.URL, chunks, backoff=0.001)
+        assert len(mock_client.requests) == 1
+
+    def test_streamed_bodies_skip_transport_retries(self):
+        webhooks = WebhooksResource(api_key="key")
+        stream_client = webhooks._get_stream_http_client()
+
+        adapter = stream_client.session.get_adapter("https://api.nexla.com")
+        assert adapter.max_retries.total == 0
+        assert webhooks._get_http_client() is not stream_client